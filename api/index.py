@@ -1,61 +1,1388 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, has_request_context, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import gzip
+import hashlib
+import heapq
+import html
+import math
+import mmap
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 
+def decode_block(buffer, offset, length):
+    """번들 블록 하나 디코딩 (UTF-8 JSON)"""
+    return json.loads(str(buffer[offset:offset + length], 'utf-8'))
+
+class BundleRecords(Mapping):
+    """데이터 번들 테이블 - 키 접근 시 해당 레코드만 디코딩 (읽기 전용)"""
+    
+    def __init__(self, buffer, offset, length):
+        self._buffer = buffer
+        self._table = decode_block(buffer, offset, length)
+        self._decoded = {}
+    
+    def __getitem__(self, key):
+        if key in self._decoded:
+            return self._decoded[key]
+        kind, offset, length = self._table[key]
+        if kind == 't':
+            value = BundleRecords(self._buffer, offset, length)
+        else:
+            value = decode_block(self._buffer, offset, length)
+        self._decoded[key] = value
+        return value
+    
+    def __contains__(self, key):
+        return key in self._table
+    
+    def __iter__(self):
+        return iter(self._table)
+    
+    def __len__(self):
+        return len(self._table)
+
+class BundleJSONProvider(DefaultJSONProvider):
+    """jsonify에서 번들 레코드를 일반 dict처럼 직렬화"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, BundleRecords):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
 app = Flask(__name__)
+app.json = BundleJSONProvider(app)
 CORS(app)
 
-# 데이터 디렉토리 - Vercel 환경 고려
-import sys
-# Vercel에서는 현재 작업 디렉토리가 프로젝트 루트
-DATA_DIR = Path.cwd() / "insightforge-web" / "data"
-if not DATA_DIR.exists():
-    # 대안 경로들 시도
-    DATA_DIR = Path(__file__).parent.parent / "insightforge-web" / "data"
-    if not DATA_DIR.exists():
-        DATA_DIR = Path("/var/task/insightforge-web/data")
+# 데이터 디렉토리 - Vercel 환경 고려
+import sys
+# Vercel에서는 현재 작업 디렉토리가 프로젝트 루트
+DATA_DIR = Path.cwd() / "insightforge-web" / "data"
+if not DATA_DIR.exists():
+    # 대안 경로들 시도
+    DATA_DIR = Path(__file__).parent.parent / "insightforge-web" / "data"
+    if not DATA_DIR.exists():
+        DATA_DIR = Path("/var/task/insightforge-web/data")
+
+# 데이터 스냅샷 (파일 캐시 + 파일 버전 + 파생 인덱스)
+# 파일이 다시 생성되면 백그라운드에서 새 스냅샷을 만들어 current_snapshot을 한 번에 교체하고,
+# 요청은 처음 데이터에 접근한 시점의 스냅샷을 끝까지 사용
+class DataSnapshot:
+    def __init__(self, files=None, versions=None, derived=None):
+        self.files = dict(files or {})
+        self.versions = dict(versions or {})
+        self.derived = dict(derived or {})
+
+current_snapshot = DataSnapshot()
+snapshot_local = threading.local()  # 재로드 스레드가 만드는 중인 스냅샷
+
+def active_snapshot():
+    """만드는 중인 스냅샷 → 요청에 고정된 스냅샷 → 현재 스냅샷 순"""
+    building = getattr(snapshot_local, 'snapshot', None)
+    if building is not None:
+        return building
+    if has_request_context():
+        if 'data_snapshot' not in g:
+            g.data_snapshot = current_snapshot
+        return g.data_snapshot
+    return current_snapshot
+
+class SnapshotView(MutableMapping):
+    """활성 스냅샷의 dict 하나를 가리키는 뷰"""
+    
+    def __init__(self, attr):
+        self._attr = attr
+    
+    def _target(self):
+        return getattr(active_snapshot(), self._attr)
+    
+    def __getitem__(self, key):
+        return self._target()[key]
+    
+    def __setitem__(self, key, value):
+        self._target()[key] = value
+    
+    def __delitem__(self, key):
+        del self._target()[key]
+    
+    def __contains__(self, key):
+        return key in self._target()
+    
+    def __iter__(self):
+        return iter(self._target())
+    
+    def __len__(self):
+        return len(self._target())
+
+# 데이터 캐시
+data_cache = SnapshotView('files')
+data_versions = SnapshotView('versions')  # 로드된 파일 버전 (파일명 -> (mtime_ns, size))
+
+def file_version(path):
+    """파일 버전 (수정 시각, 크기)"""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+# 데이터 번들 (build_data_bundle.py 생성, 없으면 파일별 로드)
+BUNDLE_FILE = 'data_bundle.bin'
+BUNDLE_MAGIC = b'IFBUNDLE1\n'
+bundle_state = {}
+
+def open_data_bundle():
+    """데이터 번들 mmap 열기 → (루트 테이블, mmap, 번들 mtime) 또는 None"""
+    if 'bundle' in bundle_state:
+        return bundle_state['bundle']
+    
+    bundle_state['bundle'] = None
+    bundle_path = DATA_DIR / BUNDLE_FILE
+    if not bundle_path.exists():
+        return None
+    
+    try:
+        with open(bundle_path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header_end = len(BUNDLE_MAGIC)
+        if buffer[:header_end] != BUNDLE_MAGIC:
+            raise ValueError("번들 형식이 아닙니다")
+        root_offset = int.from_bytes(buffer[header_end:header_end + 8], 'little')
+        root_length = int.from_bytes(buffer[header_end + 8:header_end + 16], 'little')
+        root = decode_block(buffer, root_offset, root_length)
+        bundle_state['bundle'] = (root, buffer, bundle_path.stat().st_mtime_ns)
+    except Exception as e:
+        print(f"Error loading {BUNDLE_FILE}: {e}", file=sys.stderr)
+    
+    return bundle_state['bundle']
+
+def load_bundled_file(filename, source_path):
+    """번들에서 파일 로드 (원본이 번들 빌드 이후 바뀌었으면 None)"""
+    bundle = open_data_bundle()
+    if not bundle or filename not in bundle[0]:
+        return None
+    
+    root, buffer, bundle_mtime = bundle
+    entry = root[filename]
+    version = file_version(source_path)
+    if version[1] != entry['version'][1] or version[0] > bundle_mtime:
+        return None
+    
+    if entry['kind'] == 't':
+        data = BundleRecords(buffer, entry['offset'], entry['length'])
+    else:
+        data = decode_block(buffer, entry['offset'], entry['length'])
+    
+    data_cache[filename] = data
+    data_versions[filename] = version
+    return data
+
+def load_json_file(filename):
+    """JSON 파일 로드 및 캐싱 (데이터 번들 → gzip → 일반 파일 순)"""
+    track_data_dependency(filename)
+    if filename in data_cache:
+        return data_cache[filename]
+    
+    file_path = DATA_DIR / filename
+    
+    # gzip 파일 먼저 시도
+    gz_path = DATA_DIR / (filename + '.gz')
+    source_path = gz_path if gz_path.exists() else file_path
+    if source_path.exists():
+        data = load_bundled_file(filename, source_path)
+        if data is not None:
+            return data
+    
+    if gz_path.exists():
+        try:
+            with gzip.open(gz_path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+                data_cache[filename] = data
+                data_versions[filename] = file_version(gz_path)
+                return data
+        except Exception as e:
+            print(f"Error loading {filename}.gz: {e}")
+    
+    # 일반 파일
+    if not file_path.exists():
+        return None
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            data_cache[filename] = data
+            data_versions[filename] = file_version(file_path)
+            return data
+    except Exception as e:
+        print(f"Error loading {filename}: {e}")
+        return None
+
+# 파생 인덱스 캐시 (이름 -> (원본 파일 버전, 값))
+index_cache = SnapshotView('derived')
+derived_builders = {}  # 이름 -> (원본 파일, 생성 함수) - 원본 재로드 시 다시 생성
+
+def get_data_version(*filenames):
+    """원본 파일들의 로드 버전 (로드되지 않은 파일은 먼저 로드)"""
+    for filename in filenames:
+        load_json_file(filename)
+    return tuple(data_versions.get(filename) for filename in filenames)
+
+def get_derived(name, filenames, builder):
+    """원본 파일 버전당 1회만 생성되는 파생 데이터 조회"""
+    derived_builders[name] = (tuple(filenames), builder)
+    version = get_data_version(*filenames)
+    cached = index_cache.get(name)
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    value = builder()
+    index_cache[name] = (version, value)
+    return value
+
+# 데이터 파일 재로드 (convert_*.py가 파일을 다시 만들면 재시작 없이 반영)
+DATA_RELOAD_INTERVAL = float(os.environ.get('DATA_RELOAD_INTERVAL', '10'))  # 초, 0이면 감시 안 함
+FILE_LOADERS = {}  # 파일명 -> 전용 로더 (없으면 load_json_file)
+reload_lock = threading.Lock()
+
+def current_file_version(filename):
+    """디스크상의 원본 파일 버전 (load_json_file과 같은 우선순위: gzip → 일반 파일)"""
+    for path in (DATA_DIR / (filename + '.gz'), DATA_DIR / filename):
+        if path.exists():
+            return file_version(path)
+    return None
+
+def find_changed_files(snapshot):
+    """스냅샷에 로드된 파일 중 디스크에서 바뀐 파일 (삭제된 파일은 기존 데이터 유지)"""
+    changed = []
+    for filename, version in list(snapshot.versions.items()):
+        current = current_file_version(filename)
+        if current is not None and current != version:
+            changed.append(filename)
+    return changed
+
+def reload_changed_files():
+    """바뀐 파일과 의존 파생 인덱스를 새 스냅샷에 만든 뒤 교체 → 바뀐 파일 목록"""
+    global current_snapshot
+    with reload_lock:
+        old = current_snapshot
+        changed = find_changed_files(old)
+        if not changed:
+            return []
+        
+        started = time.perf_counter()
+        new = DataSnapshot(
+            {k: v for k, v in old.files.items() if k not in changed},
+            {k: v for k, v in old.versions.items() if k not in changed},
+            old.derived
+        )
+        snapshot_local.snapshot = new
+        try:
+            for filename in changed:
+                loader = FILE_LOADERS.get(filename)
+                if loader:
+                    loader()
+                else:
+                    load_json_file(filename)
+            # 바뀐 파일에 의존하는 인덱스만 다시 생성 (나머지는 버전이 같아 그대로 재사용)
+            for name, (filenames, builder) in list(derived_builders.items()):
+                if name in new.derived and set(filenames) & set(changed):
+                    get_derived(name, filenames, builder)
+        finally:
+            snapshot_local.snapshot = None
+        
+        current_snapshot = new
+        print(f"🔄 데이터 재로드 ({(time.perf_counter() - started) * 1000:.0f}ms): {', '.join(changed)}", file=sys.stderr)
+        return changed
+
+def watch_data_files():
+    """DATA_RELOAD_INTERVAL마다 파일 버전 확인"""
+    while True:
+        time.sleep(DATA_RELOAD_INTERVAL)
+        try:
+            reload_changed_files()
+        except Exception as e:
+            print(f"Error reloading data: {e}", file=sys.stderr)
+
+def start_data_watcher():
+    if DATA_RELOAD_INTERVAL > 0:
+        threading.Thread(target=watch_data_files, name='data-watcher', daemon=True).start()
+
+# 응답 캐시 (경로 + 파라미터 → 인코딩된 본문, gzip 본문, ETag, 의존 파일 버전)
+# 요청 처리 중 load_json_file로 읽은 파일을 의존 파일로 기록하고,
+# 의존 파일 버전이 그대로면 라우트를 다시 실행하지 않고 저장된 본문을 그대로 응답
+RESPONSE_CACHE_MAX_ENTRIES = 512
+RESPONSE_GZIP_MIN_BYTES = 1024
+response_cache = OrderedDict()
+
+def track_data_dependency(filename):
+    """현재 요청이 읽은 데이터 파일 기록"""
+    if has_request_context() and 'data_dependencies' in g:
+        g.data_dependencies.add(filename)
+
+UNCACHED_PATHS = {'/api/ready'}
+
+def is_cacheable_request():
+    return (request.method == 'GET' and request.path.startswith('/api/')
+            and request.path not in UNCACHED_PATHS)
+
+def response_cache_key():
+    return (request.path, tuple(sorted(request.args.items(multi=True))))
+
+def dependency_version(filenames):
+    return tuple(data_versions.get(filename) for filename in filenames)
+
+def build_cached_response(entry):
+    """캐시 항목 → 응답 (If-None-Match 일치 시 304, gzip 수락 시 압축 본문)"""
+    if request.if_none_match.contains_weak(entry['etag']):
+        response = Response(status=304)
+    elif entry['gzip'] is not None and request.accept_encodings.quality('gzip') > 0:
+        response = Response(entry['gzip'], mimetype=entry['mimetype'])
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(entry['body'], mimetype=entry['mimetype'])
+    response.set_etag(entry['etag'])
+    response.vary.add('Accept-Encoding')
+    return response
+
+@app.before_request
+def serve_cached_response():
+    """의존 파일 버전이 같은 캐시 항목이 있으면 라우트 실행 없이 응답"""
+    if not is_cacheable_request():
+        return None
+    
+    key = response_cache_key()
+    entry = response_cache.get(key)
+    if entry and entry['version'] == dependency_version(entry['dependencies']):
+        response_cache.move_to_end(key)
+        g.response_cache_hit = True
+        return build_cached_response(entry)
+    
+    g.data_dependencies = set()
+    return None
+
+@app.after_request
+def store_cached_response(response):
+    """라우트 응답(200) 본문을 인코딩/압축된 상태로 저장"""
+    if (not is_cacheable_request() or g.get('response_cache_hit')
+            or 'data_dependencies' not in g or response.status_code != 200
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    body = response.get_data()
+    dependencies = tuple(sorted(g.data_dependencies))
+    entry = {
+        'dependencies': dependencies,
+        'version': dependency_version(dependencies),
+        'body': body,
+        'gzip': gzip.compress(body, compresslevel=6) if len(body) >= RESPONSE_GZIP_MIN_BYTES else None,
+        'etag': hashlib.sha1(body).hexdigest(),
+        'mimetype': response.mimetype
+    }
+    response_cache[response_cache_key()] = entry
+    while len(response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+        response_cache.popitem(last=False)
+    
+    return build_cached_response(entry)
+
+def build_region_index(data):
+    """sgis_national_regions.json → 코드별 지역 인덱스
+    
+    시도(2자리)/시군구(5자리)/읍면동(8자리) 코드를 키로
+    원본 레코드, 상위 코드, 하위 코드 목록을 보관
+    """
+    index = {}
+    if not data or 'regions' not in data:
+        return index
+    
+    for sido_code, sido_data in data['regions'].items():
+        sigungu_codes = []
+        index[sido_code] = {
+            'level': 'sido',
+            'record': sido_data,
+            'sido_code': sido_code,
+            'sigungu_code': None,
+            'parent': None,
+            'children': sigungu_codes
+        }
+        
+        for sigungu in sido_data.get('sigungu_list', []):
+            sigungu_code = sigungu.get('sigungu_code')
+            if not sigungu_code:
+                continue
+            sigungu_codes.append(sigungu_code)
+            
+            emdong_codes = []
+            index[sigungu_code] = {
+                'level': 'sigungu',
+                'record': sigungu,
+                'sido_code': sido_code,
+                'sigungu_code': sigungu_code,
+                'parent': sido_code,
+                'children': emdong_codes
+            }
+            
+            for emdong in sigungu.get('emdong_list', []):
+                emdong_code = emdong.get('emdong_code')
+                if not emdong_code:
+                    continue
+                emdong_codes.append(emdong_code)
+                index[emdong_code] = {
+                    'level': 'emdong',
+                    'record': emdong,
+                    'sido_code': sido_code,
+                    'sigungu_code': sigungu_code,
+                    'parent': sigungu_code,
+                    'children': []
+                }
+    
+    return index
+
+def get_region_index():
+    """지역 코드 인덱스 조회 (파일 버전당 1회 생성)"""
+    return get_derived(
+        'regions',
+        ['sgis_national_regions.json'],
+        lambda: build_region_index(load_json_file('sgis_national_regions.json'))
+    )
+
+def find_region(code, level=None):
+    """코드로 지역 인덱스 항목 조회 (level 지정 시 해당 단계만)"""
+    entry = get_region_index().get(code)
+    if entry and level and entry['level'] != level:
+        return None
+    return entry
+
+# 읍면동 지역 카드 (build_region_cards.py가 데이터 갱신 시 1회 조인해 저장)
+REGION_CARDS_FILE = 'emdong_region_cards.json'
+REGION_CARD_SOURCES = (
+    'sgis_national_regions.json',
+    'sgis_comprehensive_stats.json',
+    'code_mapping.json',
+    'jumin_population_2025.json',
+    'jumin_growth_2025.json'
+)
+
+def build_region_cards():
+    """카드 파일 → 읍면동 코드별 카드 (원본이 카드 생성 이후 바뀌었으면 None)
+    
+    번들과 같은 기준: 원본 크기가 같고 수정 시각이 카드 파일보다 늦지 않아야 함
+    """
+    cards = load_json_file(REGION_CARDS_FILE)
+    if cards is None:
+        return None
+    
+    cards_mtime = data_versions[REGION_CARDS_FILE][0]
+    built_versions = cards.get('source_versions') or {}
+    for filename in REGION_CARD_SOURCES:
+        built = built_versions.get(filename)
+        version = data_versions.get(filename)
+        if not built or not version or version[1] != built[1] or version[0] > cards_mtime:
+            return None
+    return cards.get('regions', {})
+
+def get_region_cards():
+    return get_derived('region_cards', (REGION_CARDS_FILE, *REGION_CARD_SOURCES), build_region_cards)
+
+def get_region_card(emdong_code):
+    """읍면동 카드 조회 (카드 파일이 없거나 원본과 다르거나 코드가 없으면 원본 파일에서 직접 조인)"""
+    cards = get_region_cards()
+    if cards is not None and emdong_code in cards:
+        return cards[emdong_code]
+    return join_region_card(emdong_code)
+
+def join_region_card(emdong_code):
+    """원본 파일 조인으로 읍면동 카드 생성 (build_region_cards.build_card와 동일)"""
+    # 기본 정보
+    entry = find_region(emdong_code, 'emdong')
+    base_data = entry['record'] if entry else {}
+    
+    # comprehensive stats에서 읍면동 데이터 (사업체, 주택 등)
+    comprehensive_stats = load_json_file('sgis_comprehensive_stats.json') or {}
+    emdong_stats = {}
+    if 'regions' in comprehensive_stats and emdong_code in comprehensive_stats['regions']:
+        emdong_stats = comprehensive_stats['regions'][emdong_code]
+    
+    # 코드 매핑으로 주민등록 코드 찾기
+    code_mapping = load_json_file('code_mapping.json') or {}
+    jumin_code = None
+    if 'mapping' in code_mapping and emdong_code in code_mapping['mapping']:
+        jumin_code = code_mapping['mapping'][emdong_code]['jumin_code']
+    
+    # 주민등록 인구 데이터 (가장 정확)
+    jumin_data = load_json_file('jumin_population_2025.json') or {}
+    jumin_info = {}
+    if jumin_code and 'regions' in jumin_data and jumin_code in jumin_data['regions']:
+        jumin_info = jumin_data['regions'][jumin_code]
+        
+    # 인구증감 데이터
+    growth_data = load_json_file('jumin_growth_2025.json') or {}
+    growth_info = {}
+    if jumin_code and 'regions' in growth_data and jumin_code in growth_data['regions']:
+        growth_info = growth_data['regions'][jumin_code]
+    
+    # 데이터 병합 - 주민등록 데이터 우선
+    result = {
+        **base_data,
+        **emdong_stats
+    }
+    
+    # 주민등록 데이터로 가구/인구 덮어쓰기 (더 정확함)
+    if jumin_info:
+        result['household'] = {
+            'household_cnt': jumin_info.get('household_cnt', 0),
+            'family_member_cnt': jumin_info.get('total_population', 0),
+            'avg_family_member_cnt': jumin_info.get('avg_household_size', 0),
+            'male_population': jumin_info.get('male_population', 0),
+            'female_population': jumin_info.get('female_population', 0)
+        }
+        result['data_source'] = '주민등록 2025-09'
+        result['data_year'] = '2025-09'
+    
+    # 인구증감 데이터 추가
+    if growth_info and 'data' in growth_info:
+        growth_cols = growth_info['data']
+        result['population_growth'] = {
+            'prev_month': growth_cols.get('2025년09월_전월인구수_계', 0),
+            'curr_month': growth_cols.get('2025년09월_당월인구수_계', 0),
+            'change': growth_cols.get('2025년09월_인구증감_계', 0),
+            'male_change': growth_cols.get('2025년09월_인구증감_남자인구수', 0),
+            'female_change': growth_cols.get('2025년09월_인구증감_여자인구수', 0)
+        }
+    
+    return result
+
+# 시도/시군구 합계 (읍면동 값 합산)
+ROLLUP_FILES = [
+    'sgis_national_regions.json',
+    'code_mapping.json',
+    'jumin_population_2025.json',
+    'sgis_comprehensive_stats.json'
+]
+ROLLUP_FIELDS = ('household', 'population', 'male', 'female', 'house', 'company', 'worker')
+
+def empty_rollup():
+    """빈 합계 레코드"""
+    totals = {field: 0 for field in ROLLUP_FIELDS}
+    totals['emdong_count'] = 0
+    return totals
+
+def build_emdong_figures(emdong_code, mapping_dict, jumin_regions, stats_regions):
+    """읍면동 1개의 합산 대상 수치 (주민등록 인구/가구 + SGIS 주택/사업체)"""
+    figures = {field: 0 for field in ROLLUP_FIELDS}
+    
+    # 주민등록 데이터 (코드 매핑 사용)
+    mapping = mapping_dict.get(emdong_code)
+    jumin_info = jumin_regions.get(mapping['jumin_code']) if mapping else None
+    if jumin_info:
+        figures['household'] = jumin_info.get('household_cnt', 0)
+        figures['population'] = jumin_info.get('total_population', 0)
+        figures['male'] = jumin_info.get('male_population', 0)
+        figures['female'] = jumin_info.get('female_population', 0)
+    
+    # SGIS 데이터 (사업체, 주택)
+    emdong_stats = stats_regions.get(emdong_code)
+    if emdong_stats:
+        figures['house'] = emdong_stats.get('house', {}).get('house_cnt', 0)
+        figures['company'] = emdong_stats.get('company', {}).get('corp_cnt', 0)
+        figures['worker'] = emdong_stats.get('company', {}).get('tot_worker', 0)
+    
+    return figures
+
+def add_figures(totals, figures):
+    """합계 레코드에 수치 더하기"""
+    for field in ROLLUP_FIELDS:
+        totals[field] += figures.get(field, 0)
+
+def build_region_rollups():
+    """읍면동 수치를 시군구/시도 단위로 합산"""
+    mapping_dict = (load_json_file('code_mapping.json') or {}).get('mapping', {})
+    jumin_regions = (load_json_file('jumin_population_2025.json') or {}).get('regions', {})
+    stats_regions = (load_json_file('sgis_comprehensive_stats.json') or {}).get('regions', {})
+    region_index = get_region_index()
+    
+    rollups = {'emdong': {}, 'sigungu': {}, 'sido': {}}
+    for code, entry in region_index.items():
+        if entry['level'] != 'sido':
+            continue
+        
+        sido_totals = rollups['sido'][code] = empty_rollup()
+        for sigungu_code in entry['children']:
+            sigungu_totals = rollups['sigungu'][sigungu_code] = empty_rollup()
+            for emdong_code in region_index[sigungu_code]['children']:
+                figures = build_emdong_figures(emdong_code, mapping_dict, jumin_regions, stats_regions)
+                rollups['emdong'][emdong_code] = figures
+                add_figures(sigungu_totals, figures)
+                add_figures(sido_totals, figures)
+                sigungu_totals['emdong_count'] += 1
+                sido_totals['emdong_count'] += 1
+    
+    return rollups
+
+def get_region_rollups():
+    """시도/시군구 합계 조회 (원본 파일 버전당 1회 생성)"""
+    return get_derived('rollups', ROLLUP_FILES, build_region_rollups)
+
+def format_rollup(totals):
+    """합계 레코드 → API 응답 형식 (household/house/company)"""
+    return {
+        'household': {
+            'household_cnt': totals['household'],
+            'family_member_cnt': totals['population'],
+            'avg_family_member_cnt': totals['population'] / totals['household'] if totals['household'] > 0 else 0,
+            'male_population': totals['male'],
+            'female_population': totals['female']
+        },
+        'house': {
+            'house_cnt': totals['house']
+        },
+        'company': {
+            'corp_cnt': totals['company'],
+            'tot_worker': totals['worker']
+        },
+        'emdong_count': totals['emdong_count']
+    }
+
+# 정치인 디렉터리 (읍면동 코드 → 정치인 목록, 원본 파일 버전당 1회 생성)
+POLITICIAN_FILES = [
+    'sgis_national_regions.json',
+    'local_politicians_lda_analysis.json',
+    'seoul_si_uiwon_8th_real.json',
+    'seoul_gu_uiwon_8th_real.json',
+    'assembly_by_region.json'
+]
+
+# 구 이름 매핑 (시군구 코드 -> 구 이름)
+SEOUL_GU_NAMES = {
+    '11110': '종로구', '11140': '중구', '11170': '용산구', '11200': '성동구',
+    '11215': '광진구', '11230': '강남구', '11260': '동대문구', '11290': '중랑구',
+    '11305': '성북구', '11320': '강북구', '11350': '도봉구', '11380': '노원구',
+    '11410': '은평구', '11440': '서대문구', '11470': '마포구', '11500': '양천구',
+    '11530': '강서구', '11545': '구로구', '11560': '금천구', '11590': '영등포구',
+    '11620': '동작구', '11650': '관악구', '11680': '서초구', '11710': '송파구',
+    '11740': '강동구'
+}
+
+def build_sigungu_politicians(sigungu_code, local_data, si_uiwon, gu_uiwon, assembly_data):
+    """시군구 1개의 정치인 목록 (서울시장/구청장 → 시의원 → 구의원 → 국회의원)"""
+    politicians = []
+    gu_name = SEOUL_GU_NAMES.get(sigungu_code)
+    
+    # 지방 정치인에서 서울시장/구청장 찾기
+    for name, pol_data in local_data.items():
+        if 'politician_info' in pol_data:
+            info = pol_data['politician_info']
+            # 오세훈 (서울시장)
+            if info.get('position') == '시장' and sigungu_code.startswith('11'):
+                politicians.append({
+                    'name': name,
+                    'position': '서울시장',
+                    'party': info.get('party', ''),
+                    'district': info.get('district', '')
+                })
+            # 구청장 (구 이름으로 매칭)
+            elif info.get('position') == '구청장':
+                pol_district = info.get('district', '')
+                if gu_name and gu_name in pol_district:
+                    politicians.append({
+                        'name': name,
+                        'position': '구청장',
+                        'party': info.get('party', ''),
+                        'district': pol_district
+                    })
+    
+    # 시의원 찾기 (dict 구조)
+    if gu_name and isinstance(si_uiwon, Mapping) and gu_name in si_uiwon:
+        for pol in si_uiwon[gu_name]:
+            politicians.append({
+                'name': pol.get('name', '').split('\n')[0],
+                'position': '시의원',
+                'party': pol.get('party', ''),
+                'district': pol.get('district', '')
+            })
+    
+    # 구의원 찾기 (dict 구조)
+    if gu_name and isinstance(gu_uiwon, Mapping) and gu_name in gu_uiwon:
+        for pol in gu_uiwon[gu_name]:
+            politicians.append({
+                'name': pol.get('name', '').split('\n')[0],
+                'position': '구의원',
+                'party': pol.get('party', ''),
+                'district': pol.get('district', '')
+            })
+    
+    # 국회의원 찾기
+    if 'regional' in assembly_data and '서울특별시' in assembly_data['regional']:
+        seoul_members = assembly_data['regional']['서울특별시']
+        for member in seoul_members:
+            # 구 이름이 지역구에 포함되어 있는지 확인
+            district = member.get('district', '')
+            if gu_name and gu_name.replace('구', '') in district:
+                politicians.append({
+                    'name': member.get('name', ''),
+                    'position': '국회의원',
+                    'party': member.get('party', ''),
+                    'district': district,
+                    'committee': member.get('committee', '')
+                })
+    
+    return politicians
+
+def build_politician_directory():
+    """시군구별 목록을 한 번 만들고 읍면동 코드는 소속 시군구 목록을 그대로 가리킴"""
+    sources = (
+        load_json_file('local_politicians_lda_analysis.json') or {},
+        load_json_file('seoul_si_uiwon_8th_real.json') or {},
+        load_json_file('seoul_gu_uiwon_8th_real.json') or {},
+        load_json_file('assembly_by_region.json') or {}
+    )
+    
+    by_sigungu = {code: build_sigungu_politicians(code, *sources) for code in SEOUL_GU_NAMES}
+    seoul_default = build_sigungu_politicians('11', *sources)  # 서울시장만
+    
+    directory = {'by_emdong': {}, 'by_sigungu': by_sigungu, 'seoul_default': seoul_default}
+    for code, entry in get_region_index().items():
+        if entry['level'] == 'emdong':
+            directory['by_emdong'][code] = sigungu_politicians(directory, entry['sigungu_code'])
+    return directory
+
+def sigungu_politicians(directory, sigungu_code):
+    """구 이름 매핑에 없는 서울 시군구는 서울시장만, 그 밖의 지역은 빈 목록"""
+    if sigungu_code in directory['by_sigungu']:
+        return directory['by_sigungu'][sigungu_code]
+    return directory['seoul_default'] if sigungu_code.startswith('11') else []
+
+def get_politician_directory():
+    return get_derived('politicians', POLITICIAN_FILES, build_politician_directory)
+
+def find_politicians(emdong_code):
+    """읍면동 코드 → 정치인 목록 (인덱스에 없는 코드는 앞 5자리를 시군구 코드로 사용)"""
+    directory = get_politician_directory()
+    if emdong_code in directory['by_emdong']:
+        return directory['by_emdong'][emdong_code]
+    return sigungu_politicians(directory, emdong_code[:5])  # 11230680 -> 11230
+
+# 지도 레이어 (지표·연도·단계별 코드 → 값 배열 + 분위 구간)
+LAYER_LEVELS = {'sido': 2, 'sigungu': 5, 'emdong': 8}  # 단계 → 코드 길이
+LAYER_CLASSES = 5  # 분위 구간 수
+LAYER_YEARS_FILE = 'sgis_multiyear_stats.json'
+LAYER_RATIO_FILE = 'sgis_enhanced_multiyear_stats.json'
+# 연도별 합산 지표 → (원본 파일, 레코드 내 경로)
+LAYER_YEARLY_SUMS = {
+    'population': (LAYER_RATIO_FILE, ('basic', 'total_population')),
+    'household': (LAYER_YEARS_FILE, ('household', 'household_cnt')),
+    'house': (LAYER_YEARS_FILE, ('house', 'house_cnt')),
+    'company': (LAYER_YEARS_FILE, ('company', 'corp_cnt')),
+    'worker': (LAYER_YEARS_FILE, ('company', 'tot_worker'))
+}
+# 연도별 비율 지표 (basic 하위, 상위 단계는 인구 가중 평균)
+LAYER_RATIOS = ('avg_age', 'population_density', 'aging_index', 'oldage_support_ratio', 'youth_support_ratio')
+
+def layer_years():
+    """레이어 연도 목록 (연도별 통계 연도)"""
+    data = load_json_file(LAYER_YEARS_FILE) or {}
+    return list(data.get('metadata', {}).get('years', []))
+
+def layer_metrics(year):
+    """연도별 지표 목록 - latest는 현재 합계(주민등록 2025-09 + SGIS 2023)"""
+    if year == 'latest':
+        return list(ROLLUP_FIELDS) + list(LAYER_RATIOS)
+    return list(LAYER_YEARLY_SUMS) + list(LAYER_RATIOS)
+
+def layer_value(record, path):
+    """레코드에서 숫자 값 꺼내기 (없으면 None)"""
+    for key in path:
+        record = record.get(key) if isinstance(record, Mapping) else None
+    if isinstance(record, bool) or not isinstance(record, (int, float)):
+        return None
+    return record
+
+def build_yearly_layer(metric, year, level):
+    """연도별 통계 → 단계별 {코드: 값} (읍면동 코드 앞자리로 상위 단계 합산)"""
+    if metric in LAYER_YEARLY_SUMS:
+        filename, path = LAYER_YEARLY_SUMS[metric]
+        weight_path = None
+    else:
+        filename, path = LAYER_RATIO_FILE, ('basic', metric)
+        weight_path = ('basic', 'total_population') if level != 'emdong' else None
+    
+    year_data = ((load_json_file(filename) or {}).get('regions_by_year') or {}).get(year) or {}
+    code_length = LAYER_LEVELS[level]
+    totals, weights = {}, {}
+    for code, record in year_data.items():
+        value = layer_value(record, path)
+        if value is None:
+            continue
+        parent = code[:code_length]
+        if weight_path is None:
+            totals[parent] = totals.get(parent, 0) + value
+        else:
+            weight = layer_value(record, weight_path) or 0
+            totals[parent] = totals.get(parent, 0) + value * weight
+            weights[parent] = weights.get(parent, 0) + weight
+    
+    if weight_path is None:
+        return totals
+    return {code: round(total / weights[code], 1) for code, total in totals.items() if weights[code] > 0}
+
+def quantile_breaks(values):
+    """분위 구간 경계 (LAYER_CLASSES등분, 최근접 순위)"""
+    ordered = sorted(values)
+    if not ordered:
+        return []
+    return [ordered[min(len(ordered) - 1, len(ordered) * i // LAYER_CLASSES)] for i in range(1, LAYER_CLASSES)]
+
+def build_layer(metric, year, level):
+    """레이어 1개 생성 → 코드순 codes/values 배열 + 분위 구간"""
+    if year == 'latest' and metric in ROLLUP_FIELDS:
+        values = {code: totals[metric] for code, totals in get_region_rollups()[level].items()}
+    else:
+        values = build_yearly_layer(metric, year, level)
+    
+    codes = sorted(values)
+    ordered_values = [values[code] for code in codes]
+    return {
+        'metric': metric,
+        'year': year,
+        'level': level,
+        'codes': codes,
+        'values': ordered_values,
+        'breaks': quantile_breaks(ordered_values),
+        'min': min(ordered_values) if ordered_values else None,
+        'max': max(ordered_values) if ordered_values else None
+    }
+
+def get_layer(metric, year, level):
+    """레이어 조회 (원본 파일 버전당 1회 생성, latest 비율 지표는 마지막 연도 사용)"""
+    if year == 'latest' and metric in ROLLUP_FIELDS:
+        filenames = ROLLUP_FILES
+    else:
+        if year == 'latest':
+            year = (layer_years() or ['latest'])[-1]
+        filenames = [LAYER_YEARLY_SUMS.get(metric, (LAYER_RATIO_FILE,))[0]]
+    return get_derived(f'layer:{metric}:{year}:{level}', filenames, lambda: build_layer(metric, year, level))
+
+# 월별 주민등록 인구 열 저장소 (convert_monthly_jumin.py 생성)
+# 형식: 매직 + 헤더 길이(4바이트) + 헤더 JSON + 열별 리틀엔디언 배열
+MONTHLY_STORE_FILE = 'jumin_monthly_columnar.bin.gz'
+COLUMNAR_MAGIC = b'IFCOL1\n'
+MONTHLY_FIELDS = ('population', 'male', 'female', 'household', 'change')
+
+def read_columnar_store(path):
+    """열 저장소 파일 읽기 → 지역 코드 인덱스 + 필드별 배열"""
+    with gzip.open(path, 'rb') as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"열 저장소 형식이 아닙니다: {path}")
+        header_len = int.from_bytes(f.read(4), 'little')
+        header = json.loads(f.read(header_len).decode('utf-8'))
+        
+        columns = {}
+        for column in header['columns']:
+            arr = array(column['typecode'])
+            arr.frombytes(f.read(column['length'] * arr.itemsize))
+            if sys.byteorder != 'little':
+                arr.byteswap()
+            columns[column['name']] = arr
+    
+    return {
+        'metadata': {k: v for k, v in header.items() if k not in ('months', 'codes', 'names', 'columns')},
+        'months': header['months'],
+        'codes': {code: i for i, code in enumerate(header['codes'])},
+        'names': header['names'],
+        'offsets': columns.pop('offsets'),
+        'columns': columns
+    }
+
+def build_monthly_store(data):
+    """jumin_monthly_full.json → 열 저장소 (저장소 파일이 없을 때 대체 경로)"""
+    regions = (data or {}).get('regions', {})
+    months = sorted({m['date'] for region in regions.values() for m in region.get('monthly', [])})
+    month_pos = {date: i for i, date in enumerate(months)}
+    
+    store = {
+        'metadata': {k: v for k, v in (data or {}).items() if k != 'regions'},
+        'months': months,
+        'codes': {},
+        'names': [],
+        'offsets': array('I', [0]),
+        'columns': {'month': array('H'), **{field: array('i') for field in MONTHLY_FIELDS}}
+    }
+    columns = store['columns']
+    for code, region in regions.items():
+        store['codes'][code] = len(store['names'])
+        store['names'].append(region.get('name', ''))
+        for m in region.get('monthly', []):
+            columns['month'].append(month_pos[m['date']])
+            for field in MONTHLY_FIELDS:
+                columns[field].append(m.get(field, 0))
+        store['offsets'].append(len(columns['month']))
+    
+    return store
+
+def get_monthly_store():
+    """월별 인구 열 저장소 조회 (없으면 JSON에서 변환 후 원본 JSON은 캐시에서 제거)"""
+    track_data_dependency(MONTHLY_STORE_FILE)
+    if MONTHLY_STORE_FILE in data_cache:
+        return data_cache[MONTHLY_STORE_FILE]
+    
+    store = None
+    store_path = DATA_DIR / MONTHLY_STORE_FILE
+    if store_path.exists():
+        try:
+            store = read_columnar_store(store_path)
+            data_versions[MONTHLY_STORE_FILE] = file_version(store_path)
+        except Exception as e:
+            print(f"Error loading {MONTHLY_STORE_FILE}: {e}")
+    
+    if store is None:
+        store = build_monthly_store(load_json_file('jumin_monthly_full.json'))
+        data_versions[MONTHLY_STORE_FILE] = data_versions.get('jumin_monthly_full.json')
+        data_cache.pop('jumin_monthly_full.json', None)
+    
+    data_cache[MONTHLY_STORE_FILE] = store
+    return store
+
+FILE_LOADERS[MONTHLY_STORE_FILE] = get_monthly_store
+
+def get_monthly_series(code, start=None, end=None, as_columns=False):
+    """지역 코드의 월별 인구 시계열 (start/end: 'YYYY-MM', 배열 슬라이스로 범위 조회)
+    
+    as_columns=True면 필드별 배열, 아니면 월별 레코드 목록 반환. 지역이 없으면 None
+    """
+    store = get_monthly_store()
+    row = store['codes'].get(code)
+    if row is None:
+        return None
+    
+    lo, hi = store['offsets'][row], store['offsets'][row + 1]
+    month_col = store['columns']['month']
+    if start:
+        lo = bisect_left(month_col, bisect_left(store['months'], start), lo, hi)
+    if end:
+        hi = bisect_left(month_col, bisect_right(store['months'], end), lo, hi)
+    
+    dates = [store['months'][i] for i in month_col[lo:hi]]
+    values = {field: store['columns'][field][lo:hi].tolist() for field in MONTHLY_FIELDS}
+    
+    if as_columns:
+        return {'dates': dates, **values}
+    
+    return [
+        {
+            'year': int(date[:4]),
+            'month': int(date[5:7]),
+            'date': date,
+            'population': values['population'][i],
+            'male': values['male'][i],
+            'female': values['female'][i],
+            'household': values['household'][i],
+            'change': values['change'][i]
+        }
+        for i, date in enumerate(dates)
+    ]
+
+# 통합 검색 인덱스 (지역명 + 정치인 + 뉴스 제목/본문, 문자 bigram 역색인)
+SEARCH_FILES = [
+    'sgis_national_regions.json',
+    'assembly_by_region.json',
+    'seoul_si_uiwon_8th_real.json',
+    'seoul_gu_uiwon_8th_real.json',
+    'seoul_mayor_8th_real.json',
+    'seoul_gu_mayor_8th.json',
+    'assembly_member_news.json',
+    'gu_news_articles.json',
+    'gu_audit_news.json'
+]
+SEARCH_TYPES = ('region', 'politician', 'news')
+SEARCH_NAME_WEIGHT = 3.0  # 이름/제목 필드 가중치 (본문 = 1)
+SEARCH_TAG_PATTERN = re.compile(r'<[^>]+>')
+SEARCH_SPLIT_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+def normalize_search_text(text):
+    """검색용 정규화 (HTML 엔티티/태그 제거, 소문자)"""
+    return SEARCH_TAG_PATTERN.sub(' ', html.unescape(text or '')).lower()
+
+def search_tokens(text, unigrams=False):
+    """문자 bigram 토큰 (한 글자 단어는 그대로, unigrams=True면 글자 단위도 포함)"""
+    tokens = []
+    for word in SEARCH_SPLIT_PATTERN.split(normalize_search_text(text)):
+        if not word:
+            continue
+        if len(word) == 1 or unigrams:
+            tokens.extend(word)
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def clean_politician_name(name):
+    """'오세훈\n(吳世勲)', '정문헌 (鄭文憲)' → 한글 이름만"""
+    return (name or '').split('\n')[0].split('(')[0].strip()
+
+def collect_politicians():
+    """정치인 목록 (국회의원 + 제8회 서울시장/구청장/시의원/구의원)"""
+    politicians = []
+    
+    # 국회의원 (지역구 + 비례대표)
+    assembly_data = load_json_file('assembly_by_region.json') or {}
+    for group in ('regional', 'proportional'):
+        for members in assembly_data.get(group, {}).values():
+            for member in members:
+                politicians.append({
+                    'position': '국회의원',
+                    'name': member.get('name', ''),
+                    'party': member.get('party', ''),
+                    'district': member.get('district', ''),
+                    'committee': member.get('committee', '')
+                })
+    
+    # 시장/구청장/시의원/구의원
+    local_sources = [
+        ('서울시장', {'서울특별시': load_json_file('seoul_mayor_8th_real.json') or {}}),
+        ('구청장', load_json_file('seoul_gu_mayor_8th.json') or {}),
+        ('시의원', load_json_file('seoul_si_uiwon_8th_real.json') or {}),
+        ('구의원', load_json_file('seoul_gu_uiwon_8th_real.json') or {})
+    ]
+    for position, by_district in local_sources:
+        for district_key, members in by_district.items():
+            if isinstance(members, Mapping):
+                members = [members]
+            for member in members:
+                politicians.append({
+                    'position': position,
+                    'name': clean_politician_name(member.get('name', '')),
+                    'party': member.get('party', ''),
+                    'district': member.get('district', district_key),
+                    'gu': district_key
+                })
+    
+    return politicians
+
+def collect_search_documents():
+    """검색 대상 문서 목록 (type, id, name, body + 응답용 필드)"""
+    docs = []
+    
+    # 지역 (시도/시군구/읍면동)
+    for code, entry in get_region_index().items():
+        record = entry['record']
+        name = record.get('full_address') or record.get('sido_name', '')
+        docs.append({
+            'type': 'region', 'id': code, 'name': name, 'body': '',
+            'level': entry['level'], 'code': code
+        })
+    
+    # 정치인
+    for pol in collect_politicians():
+        docs.append({
+            'type': 'politician', 'id': f"{pol['position']}:{pol['name']}:{pol['district']}",
+            'name': pol['name'],
+            'body': f"{pol['party']} {pol['district']} {pol.get('gu', '')} {pol.get('committee', '')}",
+            'position': pol['position'], 'party': pol['party'], 'district': pol['district']
+        })
+    
+    # 뉴스 (의원별/구별 수집 기사, 링크 기준 중복 제거)
+    seen_links = set()
+    for filename in ('assembly_member_news.json', 'gu_news_articles.json', 'gu_audit_news.json'):
+        for owner, entry in (load_json_file(filename) or {}).items():
+            for article in entry.get('news', []):
+                link = article.get('link', '')
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                docs.append({
+                    'type': 'news', 'id': link,
+                    'name': normalize_search_text(article.get('title', '')).strip(),
+                    'body': article.get('description', ''),
+                    'link': link, 'pubDate': article.get('pubDate', ''), 'related': owner
+                })
+    
+    return docs
 
-print(f"📁 데이터 디렉토리: {DATA_DIR}", file=sys.stderr)
-print(f"📁 존재 여부: {DATA_DIR.exists()}", file=sys.stderr)
-if DATA_DIR.exists():
-    print(f"📁 파일 목록: {list(DATA_DIR.glob('*.json'))[:5]}", file=sys.stderr)
+def build_search_index():
+    """문서 목록 → 역색인 (토큰 → {문서 번호: 가중치}) + 토큰별 idf"""
+    docs = collect_search_documents()
+    postings = {}
+    for doc_id, doc in enumerate(docs):
+        weights = {}
+        for token in search_tokens(doc['name'], unigrams=doc['type'] != 'news'):
+            weights[token] = weights.get(token, 0) + SEARCH_NAME_WEIGHT
+        for token in search_tokens(doc['body']):
+            weights[token] = weights.get(token, 0) + 1.0
+        for token, weight in weights.items():
+            postings.setdefault(token, {})[doc_id] = weight
+        doc['_name'] = normalize_search_text(doc['name'])
+    
+    total = len(docs)
+    idf = {token: math.log(1 + total / len(docs_map)) for token, docs_map in postings.items()}
+    return {'docs': docs, 'postings': postings, 'idf': idf}
 
-# 데이터 캐시
-data_cache = {}
+def get_search_index():
+    """통합 검색 인덱스 조회 (원본 파일 버전당 1회 생성)"""
+    return get_derived('search', SEARCH_FILES, build_search_index)
 
-def load_json_file(filename):
-    """JSON 파일 로드 및 캐싱 (gzip 지원)"""
-    if filename in data_cache:
-        return data_cache[filename]
+def run_search(query, doc_type=None, limit=20):
+    """검색 실행 - 모든 토큰을 포함하는 문서 우선, 없으면 일부 일치 문서로 대체"""
+    index = get_search_index()
+    tokens = set(search_tokens(query))
+    tokens = [t for t in tokens if t in index['postings']] if tokens else []
+    if not tokens:
+        return 0, []
     
-    file_path = DATA_DIR / filename
+    docs, postings, idf = index['docs'], index['postings'], index['idf']
+    # 가장 희소한 토큰부터 교집합
+    tokens.sort(key=lambda t: len(postings[t]))
+    candidates = set(postings[tokens[0]])
+    for token in tokens[1:]:
+        candidates.intersection_update(postings[token])
+        if not candidates:
+            break
+    if not candidates:
+        candidates = set().union(*(postings[t] for t in tokens))
     
-    # gzip 파일 먼저 시도
-    gz_path = DATA_DIR / (filename + '.gz')
-    if gz_path.exists():
-        try:
-            import gzip
-            with gzip.open(gz_path, 'rt', encoding='utf-8') as f:
-                data = json.load(f)
-                data_cache[filename] = data
-                return data
-        except Exception as e:
-            print(f"Error loading {filename}.gz: {e}")
+    if doc_type:
+        candidates = {d for d in candidates if docs[d]['type'] == doc_type}
     
-    # 일반 파일
-    if not file_path.exists():
-        return None
+    phrase = normalize_search_text(query).strip()
+    def score(doc_id):
+        value = sum(idf[t] * postings[t].get(doc_id, 0) for t in tokens)
+        name = docs[doc_id]['_name']
+        if name == phrase:
+            value *= 3
+        elif phrase and name.endswith(phrase):
+            value *= 2
+        elif phrase and phrase in name:
+            value *= 1.5
+        return value
+    
+    ranked = heapq.nlargest(limit, candidates, key=score)
+    results = []
+    for doc_id in ranked:
+        doc = docs[doc_id]
+        results.append({
+            **{k: v for k, v in doc.items() if k not in ('body', '_name')},
+            'score': round(score(doc_id), 3)
+        })
+    return len(candidates), results
+
+# 자동완성 인덱스 (지역명 + 정치인 이름, 정렬 배열 + 초성 배열)
+AUTOCOMPLETE_FILES = ROLLUP_FILES + [
+    'assembly_by_region.json',
+    'seoul_si_uiwon_8th_real.json',
+    'seoul_gu_uiwon_8th_real.json',
+    'seoul_mayor_8th_real.json',
+    'seoul_gu_mayor_8th.json'
+]
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+PREFIX_END = '\uffff'  # 접두어 범위 상한 (어떤 글자보다 뒤에 정렬됨)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+# 정치인 가중치 (지역 인구와 같은 척도로 비교)
+POSITION_WEIGHTS = {
+    '서울시장': 10000000,
+    '국회의원': 1000000,
+    '구청장': 500000,
+    '시의원': 100000,
+    '구의원': 50000
+}
+AUTOCOMPLETE_SCAN_LIMIT = 2000  # 범위가 이보다 넓으면 가중치 순 목록에서 선별
+
+def autocomplete_key(text):
+    """자동완성 키 (공백 제거, 소문자)"""
+    return re.sub(r'\s+', '', text or '').lower()
+
+def to_chosung(text):
+    """한글 음절 → 초성 (그 외 문자는 그대로)"""
+    return ''.join(
+        CHOSUNG[(ord(ch) - HANGUL_FIRST) // 588] if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST else ch
+        for ch in text
+    )
+
+def build_autocomplete_index():
+    """자동완성 항목 + 이름 키/초성 키 정렬 배열 + 가중치 순 목록"""
+    rollups = get_region_rollups()
+    items = []
+    for code, entry in get_region_index().items():
+        record = entry['record']
+        level = entry['level']
+        name = record.get(f'{level}_name', '')
+        totals = rollups['emdong' if level == 'emdong' else level].get(code) or {}
+        items.append({
+            'type': 'region', 'level': level, 'code': code, 'name': name,
+            'label': record.get('full_address') or name,
+            'weight': totals.get('population', 0)
+        })
+    
+    for pol in collect_politicians():
+        items.append({
+            'type': 'politician', 'name': pol['name'],
+            'label': f"{pol['position']} · {pol['district']}",
+            'position': pol['position'], 'party': pol['party'],
+            'weight': POSITION_WEIGHTS.get(pol['position'], 0)
+        })
+    
+    for item in items:
+        item['_key'] = autocomplete_key(item['name'])
+        item['_chosung'] = to_chosung(item['_key'])
+    
+    by_name = sorted(range(len(items)), key=lambda i: items[i]['_key'])
+    by_chosung = sorted(range(len(items)), key=lambda i: items[i]['_chosung'])
+    return {
+        'items': items,
+        'name_keys': [items[i]['_key'] for i in by_name],
+        'name_ids': by_name,
+        'chosung_keys': [items[i]['_chosung'] for i in by_chosung],
+        'chosung_ids': by_chosung,
+        'by_weight': sorted(range(len(items)), key=lambda i: -items[i]['weight'])
+    }
+
+def get_autocomplete_index():
+    """자동완성 인덱스 조회 (원본 파일 버전당 1회 생성)"""
+    return get_derived('autocomplete', AUTOCOMPLETE_FILES, build_autocomplete_index)
+
+def prefix_range(query):
+    """접두어 → 키 범위 [lo, hi) - 입력 중인 마지막 글자 고려
+    
+    '가'(받침 없음) → 가~갛, 'ㄱ'(자음만) → 가~깋 음절로 시작하는 키까지 포함
+    """
+    head, last = query[:-1], query[-1]
+    code = ord(last)
+    if HANGUL_FIRST <= code <= HANGUL_LAST and (code - HANGUL_FIRST) % 28 == 0:
+        return head + last, head + chr(code + 27) + PREFIX_END
+    if last in CHOSUNG:
+        first = HANGUL_FIRST + CHOSUNG.index(last) * 588
+        return head + chr(first), head + chr(first + 587) + PREFIX_END
+    return query, query + PREFIX_END
+
+def run_autocomplete(query, item_type=None, limit=10):
+    """접두어 자동완성 - 범위 내 항목을 인구/중요도 가중치 순으로 상위 limit개"""
+    index = get_autocomplete_index()
+    key = autocomplete_key(query)
+    if not key:
+        return []
+    
+    # 모두 초성이면 초성 배열, 아니면 이름 배열에서 범위 탐색
+    field = '_chosung' if all(ch in CHOSUNG for ch in key) else '_key'
+    keys, ids = (index['chosung_keys'], index['chosung_ids']) if field == '_chosung' \
+        else (index['name_keys'], index['name_ids'])
+    lo, hi = prefix_range(key) if field == '_key' else (key, key + PREFIX_END)
+    start, end = bisect_left(keys, lo), bisect_left(keys, hi)
+    
+    items = index['items']
+    def matches(i):
+        return not item_type or items[i]['type'] == item_type
+    
+    if end - start <= AUTOCOMPLETE_SCAN_LIMIT:
+        candidates = [i for i in ids[start:end] if matches(i)]
+        top = heapq.nlargest(limit, candidates, key=lambda i: items[i]['weight'])
+    else:
+        # 넓은 범위는 일치 비율이 높으므로 가중치 순으로 훑으며 조기 종료
+        top = []
+        for i in index['by_weight']:
+            if lo <= items[i][field] < hi and matches(i):
+                top.append(i)
+                if len(top) >= limit:
+                    break
     
+    return [{k: v for k, v in items[i].items() if not k.startswith('_')} for i in top]
+
+# 워밍업 매니페스트 (요청 받기 전에 미리 로드할 파일 / 생성할 인덱스)
+# 파일은 스레드 풀에서 병렬 로드, 인덱스는 앞 인덱스를 재사용하므로 순서대로 생성
+# WARMUP_MANIFEST 환경변수로 같은 형식의 JSON 파일을 지정하면 배포별로 교체 가능
+# WARMUP=off 이면 워밍업 없이 바로 준비 완료 (첫 요청이 로드 비용 부담)
+WARMUP_MANIFEST = {
+    'files': [
+        'sgis_national_regions.json',
+        REGION_CARDS_FILE,
+        'code_mapping.json',
+        'jumin_population_2025.json',
+        'jumin_growth_2025.json',
+        'sgis_comprehensive_stats.json',
+        'sgis_enhanced_multiyear_stats.json',
+        'assembly_by_region.json',
+        'seoul_si_uiwon_8th_real.json',
+        'seoul_gu_uiwon_8th_real.json',
+        'seoul_mayor_8th_real.json',
+        'seoul_gu_mayor_8th.json'
+    ],
+    'indexes': ['region_index', 'region_rollups', 'region_cards', 'monthly_store', 'search_index', 'autocomplete_index', 'politician_directory']
+}
+WARMUP_BUILDERS = {
+    'region_index': get_region_index,
+    'region_rollups': get_region_rollups,
+    'region_cards': get_region_cards,
+    'monthly_store': get_monthly_store,
+    'search_index': get_search_index,
+    'autocomplete_index': get_autocomplete_index,
+    'politician_directory': get_politician_directory
+}
+WARMUP_WORKERS = 4
+warmup_state = {'status': 'pending', 'items': [], 'elapsed_ms': None}
+
+def load_warmup_manifest():
+    """워밍업 매니페스트 (WARMUP_MANIFEST 환경변수의 JSON 파일 우선)"""
+    manifest_path = os.environ.get('WARMUP_MANIFEST')
+    if manifest_path:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading {manifest_path}: {e}", file=sys.stderr)
+    return WARMUP_MANIFEST
+
+def timed_warmup(kind, name, loader):
+    """워밍업 항목 1개 실행 + 소요 시간 기록"""
+    started = time.perf_counter()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            data_cache[filename] = data
-            return data
+        ok = loader() is not None
+        error = None if ok else '파일 없음'
     except Exception as e:
-        print(f"Error loading {filename}: {e}")
-        return None
+        ok, error = False, str(e)
+    
+    item = {'kind': kind, 'name': name, 'ok': ok, 'ms': round((time.perf_counter() - started) * 1000, 1)}
+    if error:
+        item['error'] = error
+    warmup_state['items'].append(item)
+    print(f"   {'✅' if ok else '⚠️ '} {kind} {name}: {item['ms']}ms" + (f" ({error})" if error else ''), file=sys.stderr)
+    return item
+
+def run_warmup():
+    """매니페스트의 파일/인덱스를 미리 로드 (완료 후 /api/ready가 200)"""
+    manifest = load_warmup_manifest()
+    files = manifest.get('files', [])
+    indexes = [name for name in manifest.get('indexes', []) if name in WARMUP_BUILDERS]
+    
+    warmup_state.update(status='running', items=[])
+    started = time.perf_counter()
+    print(f"🔥 워밍업 시작: 파일 {len(files)}개, 인덱스 {len(indexes)}개 ({DATA_DIR})", file=sys.stderr)
+    
+    open_data_bundle()  # 병렬 로드 전에 번들을 한 번만 열기
+    with ThreadPoolExecutor(max_workers=WARMUP_WORKERS) as pool:
+        list(pool.map(lambda filename: timed_warmup('file', filename, lambda: load_json_file(filename)), files))
+    for name in indexes:
+        timed_warmup('index', name, WARMUP_BUILDERS[name])
+    
+    warmup_state.update(status='ready', elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+    print(f"🔥 워밍업 완료: {warmup_state['elapsed_ms']}ms", file=sys.stderr)
+
+def start_warmup():
+    """백그라운드 워밍업 시작 (요청 처리는 바로 가능, 준비 여부는 /api/ready)"""
+    if os.environ.get('WARMUP', 'on').lower() in ('0', 'off', 'false'):
+        warmup_state['status'] = 'skipped'
+        return
+    threading.Thread(target=run_warmup, name='warmup', daemon=True).start()
+
+start_warmup()
+start_data_watcher()
+
+@app.route('/api/ready')
+def readiness():
+    """준비 상태 (워밍업 완료 전 503) - 항목별 소요 시간 포함"""
+    ready = warmup_state['status'] in ('ready', 'skipped')
+    return jsonify({'ready': ready, **warmup_state}), 200 if ready else 503
 
 @app.route('/api/politicians/si_uiwon')
 def get_si_uiwon():
@@ -79,7 +1406,7 @@ def get_national_assembly():
     data = load_json_file('national_assembly_22nd.json')
     if data:
         # 배열 형태로 변환
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             politicians = []
             for region, pols in data.items():
                 if isinstance(pols, list):
@@ -140,94 +1467,53 @@ def get_sido_list():
 @app.route('/api/national/sido/<sido_code>')
 def get_sido_detail(sido_code):
     """시도 상세 정보"""
-    data = load_json_file('sgis_national_regions.json')
-    if data and 'regions' in data and sido_code in data['regions']:
-        return jsonify(data['regions'][sido_code])
+    entry = find_region(sido_code, 'sido')
+    if entry:
+        return jsonify(entry['record'])
     return jsonify({})
 
+@app.route('/api/national/sido/<sido_code>/detail')
+def get_sido_detail_with_stats(sido_code):
+    """시도 상세 정보 (동별 데이터 합산)"""
+    entry = find_region(sido_code, 'sido')
+    if not entry:
+        return jsonify({})
+    
+    totals = get_region_rollups()['sido'].get(sido_code) or empty_rollup()
+    
+    return jsonify({
+        'sido_code': sido_code,
+        'sido_name': entry['record'].get('sido_name', ''),
+        'sigungu_count': len(entry['children']),
+        **format_rollup(totals),
+        'data_source': '주민등록 2025-09 (인구/가구 합산)',
+        'data_year': '2025-09'
+    })
+
 @app.route('/api/national/sigungu/<sigungu_code>')
 def get_sigungu_detail(sigungu_code):
     """시군구 상세 정보"""
-    data = load_json_file('sgis_national_regions.json')
-    if data and 'regions' in data:
-        # 모든 시도에서 시군구 찾기
-        for sido_code, sido_data in data['regions'].items():
-            for sigungu in sido_data.get('sigungu_list', []):
-                if sigungu.get('sigungu_code') == sigungu_code:
-                    return jsonify(sigungu)
+    entry = find_region(sigungu_code, 'sigungu')
+    if entry:
+        return jsonify(entry['record'])
     return jsonify({})
 
 @app.route('/api/national/sigungu/<sigungu_code>/detail')
 def get_sigungu_detail_with_stats(sigungu_code):
     """시군구 상세 정보 (동별 데이터 합산)"""
     # 기본 정보
-    basic_data = get_sigungu_detail(sigungu_code).get_json()
-    
-    # 코드 매핑
-    code_mapping = load_json_file('code_mapping.json') or {}
-    mapping_dict = code_mapping.get('mapping', {})
-    
-    # 주민등록 인구 데이터
-    jumin_data = load_json_file('jumin_population_2025.json') or {}
-    
-    # comprehensive stats
-    comprehensive_stats = load_json_file('sgis_comprehensive_stats.json') or {}
+    entry = find_region(sigungu_code, 'sigungu')
+    basic_data = entry['record'] if entry else {}
     
-    # 해당 시군구의 모든 읍면동 합산
-    total_household = 0
-    total_population = 0
-    total_male = 0
-    total_female = 0
-    total_house = 0
-    total_company = 0
-    total_worker = 0
-    emdong_count = 0
-    
-    # 읍면동 목록에서 각각 집계
-    if 'emdong_list' in basic_data:
-        for emdong in basic_data['emdong_list']:
-            emdong_code = emdong.get('emdong_code')
-            emdong_count += 1
-            
-            # 주민등록 데이터 (코드 매핑 사용)
-            if emdong_code in mapping_dict:
-                jumin_code = mapping_dict[emdong_code]['jumin_code']
-                if 'regions' in jumin_data and jumin_code in jumin_data['regions']:
-                    jumin_info = jumin_data['regions'][jumin_code]
-                    total_household += jumin_info.get('household_cnt', 0)
-                    total_population += jumin_info.get('total_population', 0)
-                    total_male += jumin_info.get('male_population', 0)
-                    total_female += jumin_info.get('female_population', 0)
-            
-            # SGIS 데이터 (사업체, 주택)
-            if 'regions' in comprehensive_stats and emdong_code in comprehensive_stats['regions']:
-                emdong_stats = comprehensive_stats['regions'][emdong_code]
-                house = emdong_stats.get('house', {})
-                company = emdong_stats.get('company', {})
-                total_house += house.get('house_cnt', 0)
-                total_company += company.get('corp_cnt', 0)
-                total_worker += company.get('tot_worker', 0)
+    # 읍면동 합산 결과 (미리 계산된 합계 사용)
+    totals = get_region_rollups()['sigungu'].get(sigungu_code) or empty_rollup()
     
     result = {
         **basic_data,
         'sigungu_code': sigungu_code,
-        'household': {
-            'household_cnt': total_household,
-            'family_member_cnt': total_population,
-            'avg_family_member_cnt': total_population / total_household if total_household > 0 else 0,
-            'male_population': total_male,
-            'female_population': total_female
-        },
-        'house': {
-            'house_cnt': total_house  # 실제 값 사용
-        },
-        'company': {
-            'corp_cnt': total_company,
-            'tot_worker': total_worker  # 실제 값 사용
-        },
+        **format_rollup(totals),
         'data_source': '주민등록 2025-09 (인구/가구 합산)',
-        'data_year': '2025-09',
-        'emdong_count': emdong_count
+        'data_year': '2025-09'
     }
     
     return jsonify(result)
@@ -249,81 +1535,61 @@ def get_emdong_detail(emdong_code):
 @app.route('/api/emdong/<emdong_code>/enhanced')
 def get_emdong_enhanced(emdong_code):
     """읍면동 향상된 상세 정보 - 주민등록 인구 우선 사용"""
-    year = request.args.get('year', '2023')
-    
-    # 기본 정보
-    base_data = {}
-    regions_data = load_json_file('sgis_national_regions.json')
-    if regions_data and 'regions' in regions_data:
-        for sido_code, sido_data in regions_data['regions'].items():
-            for sigungu in sido_data.get('sigungu_list', []):
-                for emdong in sigungu.get('emdong_list', []):
-                    if emdong.get('emdong_code') == emdong_code:
-                        base_data = emdong
-                        break
+    return jsonify(get_region_card(emdong_code))
+
+@app.route('/api/layers/<metric>')
+def get_map_layer(metric):
+    """지도 레이어 (?year=YYYY|latest&level=sido|sigungu|emdong) → 코드/값 배열 + 분위 구간"""
+    year = request.args.get('year', 'latest')
+    level = request.args.get('level', 'sigungu')
+    years = layer_years()
+    if level not in LAYER_LEVELS or (year != 'latest' and year not in years) or metric not in layer_metrics(year):
+        return jsonify({
+            'error': '지원하지 않는 레이어입니다',
+            'metrics': layer_metrics(year if year in years else 'latest'),
+            'years': ['latest'] + years,
+            'levels': list(LAYER_LEVELS)
+        }), 404
     
-    # comprehensive stats에서 읍면동 데이터 (사업체, 주택 등)
-    comprehensive_stats = load_json_file('sgis_comprehensive_stats.json') or {}
-    emdong_stats = {}
-    if 'regions' in comprehensive_stats and emdong_code in comprehensive_stats['regions']:
-        emdong_stats = comprehensive_stats['regions'][emdong_code]
+    return jsonify(get_layer(metric, year, level))
+
+# 지도 뷰포트용 일괄 조회 (읍면동별 요청 대신 한 번에)
+BATCH_MAX_CODES = 500
+
+def batch_emdong_codes():
+    """?codes=코드,코드 또는 ?sigungu=시군구코드 → 읍면동 코드 목록 (중복 제거, 최대 BATCH_MAX_CODES개)"""
+    codes = [code.strip() for code in request.args.get('codes', '').split(',') if code.strip()]
+    sigungu_code = request.args.get('sigungu')
+    if sigungu_code:
+        entry = find_region(sigungu_code, 'sigungu')
+        if entry:
+            codes.extend(entry['children'])
+    return list(dict.fromkeys(codes))[:BATCH_MAX_CODES]
+
+@app.route('/api/emdong/batch')
+def get_emdong_batch():
+    """읍면동 카드 일괄 조회 - 한 줄에 한 읍면동씩 NDJSON 스트리밍
     
-    # 코드 매핑으로 주민등록 코드 찾기
-    code_mapping = load_json_file('code_mapping.json') or {}
-    jumin_code = None
-    if 'mapping' in code_mapping and emdong_code in code_mapping['mapping']:
-        jumin_code = code_mapping['mapping'][emdong_code]['jumin_code']
+    각 줄: {"code", "enhanced": /api/emdong/<code>/enhanced, "detail": /api/national/emdong/<code>}
+    """
+    codes = batch_emdong_codes()
+    year = request.args.get('year', '2023')
     
-    # 주민등록 인구 데이터 (가장 정확)
-    jumin_data = load_json_file('jumin_population_2025.json') or {}
-    jumin_info = {}
-    if jumin_code and 'regions' in jumin_data and jumin_code in jumin_data['regions']:
-        jumin_info = jumin_data['regions'][jumin_code]
+    def generate():
+        # 파일은 요청당 한 번만 조회하고 코드별로는 키 조회만
+        cards = get_region_cards()
+        multiyear_data = load_json_file('sgis_enhanced_multiyear_stats.json') or {}
         
-    # 인구증감 데이터
-    growth_data = load_json_file('jumin_growth_2025.json') or {}
-    growth_info = {}
-    if jumin_code and 'regions' in growth_data and jumin_code in growth_data['regions']:
-        growth_info = growth_data['regions'][jumin_code]
-    
-    # 멀티 year 통계 데이터
-    multiyear_data = load_json_file('sgis_enhanced_multiyear_stats.json') or {}
-    year_stats = {}
-    if emdong_code in multiyear_data:
-        emdong_data = multiyear_data[emdong_code]
-        if 'years' in emdong_data and year in emdong_data['years']:
-            year_stats = emdong_data['years'][year]
-    
-    # 데이터 병합 - 주민등록 데이터 우선
-    result = {
-        **base_data,
-        **emdong_stats
-    }
-    
-    # 주민등록 데이터로 가구/인구 덮어쓰기 (더 정확함)
-    if jumin_info:
-        result['household'] = {
-            'household_cnt': jumin_info.get('household_cnt', 0),
-            'family_member_cnt': jumin_info.get('total_population', 0),
-            'avg_family_member_cnt': jumin_info.get('avg_household_size', 0),
-            'male_population': jumin_info.get('male_population', 0),
-            'female_population': jumin_info.get('female_population', 0)
-        }
-        result['data_source'] = '주민등록 2025-09'
-        result['data_year'] = '2025-09'
-    
-    # 인구증감 데이터 추가
-    if growth_info and 'data' in growth_info:
-        growth_cols = growth_info['data']
-        result['population_growth'] = {
-            'prev_month': growth_cols.get('2025년09월_전월인구수_계', 0),
-            'curr_month': growth_cols.get('2025년09월_당월인구수_계', 0),
-            'change': growth_cols.get('2025년09월_인구증감_계', 0),
-            'male_change': growth_cols.get('2025년09월_인구증감_남자인구수', 0),
-            'female_change': growth_cols.get('2025년09월_인구증감_여자인구수', 0)
-        }
+        for code in codes:
+            card = cards[code] if cards is not None and code in cards else join_region_card(code)
+            detail = {}
+            if code in multiyear_data:
+                emdong_data = multiyear_data[code]
+                if 'years' in emdong_data and year in emdong_data['years']:
+                    detail = emdong_data['years'][year]
+            yield app.json.dumps({'code': code, 'enhanced': card, 'detail': detail}) + '\n'
     
-    return jsonify(result)
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @app.route('/api/regions')
 def get_regions():
@@ -342,18 +1608,19 @@ def get_emdong_timeseries(emdong_code):
     if emdong_code in mapping_dict:
         jumin_code = mapping_dict[emdong_code]['jumin_code']
     
-    # 월별 인구 데이터 (2008-2025)
-    monthly_data_file = load_json_file('jumin_monthly_full.json') or {}
+    # 월별 인구 데이터 (열 저장소, ?start=YYYY-MM&end=YYYY-MM 범위 조회)
+    start, end = request.args.get('start'), request.args.get('end')
+    as_columns = request.args.get('format') == 'columns'
     monthly_list = []
     
     # jumin_code로 월별 데이터 찾기
-    if jumin_code and 'regions' in monthly_data_file and jumin_code in monthly_data_file['regions']:
-        monthly_list = monthly_data_file['regions'][jumin_code].get('monthly', [])
+    if jumin_code:
+        monthly_list = get_monthly_series(jumin_code, start, end, as_columns) or []
     
     # 만약 없으면 인구증감 데이터 사용 (fallback)
-    if not monthly_list:
+    growth_info = {}
+    if not monthly_list or (as_columns and not monthly_list['dates']):
         growth_data = load_json_file('jumin_growth_2025.json') or {}
-        growth_info = {}
         if jumin_code and 'regions' in growth_data and jumin_code in growth_data['regions']:
             growth_info = growth_data['regions'][jumin_code].get('data', {})
     
@@ -364,8 +1631,8 @@ def get_emdong_timeseries(emdong_code):
         yearly_stats = multiyear_data[emdong_code]['years']
     
     # 월별 데이터 사용 또는 fallback
-    if monthly_list:
-        # 새로운 월별 데이터 사용 (2022-2025)
+    if monthly_list and (not as_columns or monthly_list['dates']):
+        # 새로운 월별 데이터 사용 (2018-2025)
         monthly_data = monthly_list
     else:
         # fallback: 인구증감 데이터 사용 (2025년만)
@@ -387,6 +1654,11 @@ def get_emdong_timeseries(emdong_code):
                 })
         
         monthly_data.sort(key=lambda x: (x['year'], x['month']))
+        if as_columns:
+            monthly_data = {
+                'dates': [m['date'] for m in monthly_data],
+                **{field: [m.get(field, 0) for m in monthly_data] for field in MONTHLY_FIELDS}
+            }
     
     # 연도별 사업체/주택 데이터 추가
     yearly_business = []
@@ -412,45 +1684,35 @@ def get_emdong_timeseries(emdong_code):
 @app.route('/api/sigungu/<sigungu_code>/timeseries')
 def get_sigungu_timeseries(sigungu_code):
     """시군구 시계열 데이터 (읍면동 합산)"""
-    # 월별 인구 데이터 직접 사용
-    monthly_data_file = load_json_file('jumin_monthly_full.json') or {}
-    monthly_list = []
-    
     # 시군구 코드로 직접 찾기 (예: 11230 -> 1123000000)
     sigungu_full_code = sigungu_code + '00000' if len(sigungu_code) == 5 else sigungu_code
     
-    if 'regions' in monthly_data_file and sigungu_full_code in monthly_data_file['regions']:
-        monthly_list = monthly_data_file['regions'][sigungu_full_code].get('monthly', [])
-    
-    # 데이터가 있으면 그대로 반환
-    if monthly_list:
-        return jsonify({
-            'sigungu_code': sigungu_code,
-            'timeseries': monthly_list
-        })
+    # 월별 인구 데이터 (열 저장소 범위 조회, 없으면 빈 배열)
+    as_columns = request.args.get('format') == 'columns'
+    monthly_list = get_monthly_series(
+        sigungu_full_code, request.args.get('start'), request.args.get('end'), as_columns
+    )
     
-    # 없으면 빈 배열 반환 (fallback 로직은 너무 복잡하므로 생략)
     return jsonify({
         'sigungu_code': sigungu_code,
-        'timeseries': []
+        'timeseries': monthly_list if monthly_list is not None else []
     })
 
 @app.route('/api/sido/<sido_code>/timeseries')
 def get_sido_timeseries(sido_code):
     """시도 시계열 데이터"""
-    # 월별 인구 데이터 직접 사용
-    monthly_data_file = load_json_file('jumin_monthly_full.json') or {}
-    monthly_list = []
-    
     # 시도 코드로 찾기 (예: 11 -> 1100000000)
     sido_full_code = sido_code + '00000000' if len(sido_code) == 2 else sido_code
     
-    if 'regions' in monthly_data_file and sido_full_code in monthly_data_file['regions']:
-        monthly_list = monthly_data_file['regions'][sido_full_code].get('monthly', [])
+    # 월별 인구 데이터 (열 저장소 범위 조회)
+    as_columns = request.args.get('format') == 'columns'
+    monthly_list = get_monthly_series(
+        sido_full_code, request.args.get('start'), request.args.get('end'), as_columns
+    )
     
     return jsonify({
         'sido_code': sido_code,
-        'timeseries': monthly_list
+        'timeseries': monthly_list if monthly_list is not None else []
     })
 
 @app.route('/api/years')
@@ -463,93 +1725,7 @@ def get_available_years():
 @app.route('/api/politicians/emdong/<emdong_code>')
 def get_politicians(emdong_code):
     """읍면동의 정치인 정보 (현재 + 이전 임기)"""
-    # 지방 정치인 데이터
-    local_data = load_json_file('local_politicians_lda_analysis.json') or {}
-    
-    # 시의원, 구의원 데이터 (제8회)
-    si_uiwon = load_json_file('seoul_si_uiwon_8th_real.json') or {}
-    gu_uiwon = load_json_file('seoul_gu_uiwon_8th_real.json') or {}
-    
-    # 국회의원 데이터
-    assembly_data = load_json_file('assembly_by_region.json') or {}
-    
-    politicians = []
-    
-    # 읍면동 코드에서 시군구 코드 추출
-    sigungu_code = emdong_code[:5]  # 11230680 -> 11230
-    
-    # 구 이름 매핑 (시군구 코드 -> 구 이름)
-    gu_names = {
-        '11110': '종로구', '11140': '중구', '11170': '용산구', '11200': '성동구',
-        '11215': '광진구', '11230': '강남구', '11260': '동대문구', '11290': '중랑구',
-        '11305': '성북구', '11320': '강북구', '11350': '도봉구', '11380': '노원구',
-        '11410': '은평구', '11440': '서대문구', '11470': '마포구', '11500': '양천구',
-        '11530': '강서구', '11545': '구로구', '11560': '금천구', '11590': '영등포구',
-        '11620': '동작구', '11650': '관악구', '11680': '서초구', '11710': '송파구',
-        '11740': '강동구'
-    }
-    
-    gu_name = gu_names.get(sigungu_code)
-    
-    # 지방 정치인에서 서울시장/구청장 찾기
-    for name, pol_data in local_data.items():
-        if 'politician_info' in pol_data:
-            info = pol_data['politician_info']
-            # 오세훈 (서울시장)
-            if info.get('position') == '시장' and sigungu_code.startswith('11'):
-                politicians.append({
-                    'name': name,
-                    'position': '서울시장',
-                    'party': info.get('party', ''),
-                    'district': info.get('district', '')
-                })
-            # 구청장 (구 이름으로 매칭)
-            elif info.get('position') == '구청장':
-                pol_district = info.get('district', '')
-                if gu_name and gu_name in pol_district:
-                    politicians.append({
-                        'name': name,
-                        'position': '구청장',
-                        'party': info.get('party', ''),
-                        'district': pol_district
-                    })
-    
-    # 시의원 찾기 (dict 구조)
-    if gu_name and isinstance(si_uiwon, dict) and gu_name in si_uiwon:
-        for pol in si_uiwon[gu_name]:
-            politicians.append({
-                'name': pol.get('name', '').split('\n')[0],
-                'position': '시의원',
-                'party': pol.get('party', ''),
-                'district': pol.get('district', '')
-            })
-    
-    # 구의원 찾기 (dict 구조)
-    if gu_name and isinstance(gu_uiwon, dict) and gu_name in gu_uiwon:
-        for pol in gu_uiwon[gu_name]:
-            politicians.append({
-                'name': pol.get('name', '').split('\n')[0],
-                'position': '구의원',
-                'party': pol.get('party', ''),
-                'district': pol.get('district', '')
-            })
-    
-    # 국회의원 찾기
-    if 'regional' in assembly_data and '서울특별시' in assembly_data['regional']:
-        seoul_members = assembly_data['regional']['서울특별시']
-        for member in seoul_members:
-            # 구 이름이 지역구에 포함되어 있는지 확인
-            district = member.get('district', '')
-            if gu_name and gu_name.replace('구', '') in district:
-                politicians.append({
-                    'name': member.get('name', ''),
-                    'position': '국회의원',
-                    'party': member.get('party', ''),
-                    'district': district,
-                    'committee': member.get('committee', '')
-                })
-    
-    return jsonify(politicians)
+    return jsonify(find_politicians(emdong_code))
 
 @app.route('/api/network/assembly')
 def get_assembly_network():
@@ -559,10 +1735,37 @@ def get_assembly_network():
 
 @app.route('/api/search')
 def search():
-    """검색 API"""
+    """통합 검색 API (?q=검색어&type=region|politician|news&limit=20)"""
+    query = request.args.get('q', '').strip()
+    doc_type = request.args.get('type')
+    if doc_type not in SEARCH_TYPES:
+        doc_type = None
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    
+    if not query:
+        return jsonify({"query": query, "total": 0, "results": []})
+    
+    total, results = run_search(query, doc_type, limit)
+    return jsonify({
+        "query": query,
+        "type": doc_type,
+        "total": total,
+        "results": results
+    })
+
+@app.route('/api/autocomplete')
+def autocomplete():
+    """지역/정치인 이름 자동완성 (?q=접두어 또는 초성&type=region|politician&limit=10)"""
     query = request.args.get('q', '')
-    # 간단한 검색 구현
-    return jsonify({"results": []})
+    item_type = request.args.get('type')
+    if item_type not in ('region', 'politician'):
+        item_type = None
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+    
+    return jsonify({
+        "query": query,
+        "results": run_autocomplete(query, item_type, limit)
+    })
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=8000)
@@ -14,6 +14,7 @@ let expandedSidos = new Set();
 let expandedSigungus = new Set();
 let availableYears = [];
 let selectedYear = "2023"; // 항상 최신 연도 사용
+let emdongCards = new Map(); // 읍면동 코드 → 카드 (/api/emdong/batch 미리 받기)
 
 // ============================================
 // 초기화
@@ -303,23 +304,56 @@ async function loadEmdongList(sigunguCode) {
         html += '</div>';
         container.innerHTML = html;
         
+        // 읍면동 카드를 한 번에 미리 받기 (선택 시 개별 요청 생략)
+        prefetchEmdongCards(sigunguCode);
+        
     } catch (error) {
         console.error('❌ 읍면동 로드 실패:', error);
     }
 }
 
+async function prefetchEmdongCards(sigunguCode) {
+    try {
+        const response = await fetch(`${API_BASE}/api/emdong/batch?sigungu=${sigunguCode}&year=${selectedYear}`);
+        if (!response.ok || !response.body) return;
+        
+        // NDJSON 스트림: 도착하는 줄부터 바로 캐시에 저장
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { done, value } = await reader.read();
+            buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => {
+                const row = JSON.parse(line);
+                emdongCards.set(row.code, row.enhanced);
+            });
+            if (done) break;
+        }
+    } catch (error) {
+        console.log('읍면동 일괄 조회 없음 (개별 조회 사용)');
+    }
+}
+
 async function selectEmdong(emdongCode) {
     try {
         console.log(`🔍 읍면동 선택: ${emdongCode}`);
         
-        // Enhanced API에서 모든 데이터 가져오기
-        const response = await fetch(`${API_BASE}/api/emdong/${emdongCode}/enhanced?year=${selectedYear}`);
-        
-        if (!response.ok) {
-            throw new Error(`API 오류: ${response.status}`);
+        // 미리 받은 카드가 있으면 사용, 없으면 Enhanced API에서 가져오기
+        let data;
+        if (emdongCards.has(emdongCode)) {
+            data = { ...emdongCards.get(emdongCode) };
+        } else {
+            const response = await fetch(`${API_BASE}/api/emdong/${emdongCode}/enhanced?year=${selectedYear}`);
+            
+            if (!response.ok) {
+                throw new Error(`API 오류: ${response.status}`);
+            }
+            
+            data = await response.json();
         }
-        
-        const data = await response.json();
         console.log('📦 읍면동 데이터:', data);
         
         currentRegion = data;
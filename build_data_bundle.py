@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터 번들 빌드
+insightforge-web/data/*.json(.gz)을 하나의 바이너리 번들(data_bundle.bin)로 묶음
+
+api/index.py는 번들을 mmap으로 열고 요청에 필요한 레코드만 디코딩하므로
+콜드 스타트 시 gzip 해제 + 전체 json.load 비용이 사라짐
+
+번들 형식:
+    매직(10바이트) + 루트 테이블 위치(8바이트) + 루트 테이블 길이(8바이트) + 블록들
+    루트 테이블: {파일명: {'version': [mtime_ns, size], 'kind', 'offset', 'length'}}
+    테이블 블록: {키: [kind, offset, length]}  (kind: 'v' = JSON 값, 't' = 하위 테이블)
+
+사용법:
+    python build_data_bundle.py
+"""
+import gzip
+import json
+from pathlib import Path
+
+DATA_DIR = Path('insightforge-web/data')
+BUNDLE_FILE = DATA_DIR / 'data_bundle.bin'
+BUNDLE_MAGIC = b'IFBUNDLE1\n'
+
+# 직렬화 크기가 이만큼 이상인 dict는 하위 테이블로 분할 (키 단위 지연 디코딩)
+SPLIT_MIN_BYTES = 64 * 1024
+MAX_SPLIT_DEPTH = 3
+
+def source_files():
+    """번들 대상 파일 (파일명 → 실제 경로, .gz 우선 - load_json_file과 동일한 우선순위)"""
+    sources = {}
+    for path in sorted(DATA_DIR.glob('*.json')):
+        sources[path.name] = path
+    for path in sorted(DATA_DIR.glob('*.json.gz')):
+        sources[path.name[:-3]] = path
+    return sources
+
+def read_json(path):
+    """JSON 파일 읽기 (gzip 지원)"""
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_block(out, payload):
+    """블록 기록 → (offset, length)"""
+    offset = out.tell()
+    out.write(payload)
+    return offset, len(payload)
+
+def encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def write_table(out, mapping, depth):
+    """dict를 키별 레코드로 기록하고 테이블 블록 기록 → ('t', offset, length)"""
+    table = {key: list(write_value(out, item, depth + 1)) for key, item in mapping.items()}
+    return ('t', *write_block(out, encode(table)))
+
+def write_value(out, value, depth):
+    """값 기록 - 큰 dict는 하위 테이블로 분할 → (kind, offset, length)"""
+    payload = encode(value)
+    if isinstance(value, dict) and len(payload) >= SPLIT_MIN_BYTES and depth < MAX_SPLIT_DEPTH:
+        return write_table(out, value, depth)
+    return ('v', *write_block(out, payload))
+
+def main():
+    sources = source_files()
+    print(f"📦 데이터 번들 빌드: {len(sources)}개 파일")
+
+    root = {}
+    header_size = len(BUNDLE_MAGIC) + 16
+    with open(BUNDLE_FILE, 'wb') as out:
+        out.write(b'\0' * header_size)
+
+        for filename, path in sources.items():
+            try:
+                data = read_json(path)
+            except Exception as e:
+                print(f"   ⚠️  {filename}: 읽기 실패 ({e})")
+                continue
+
+            stat = path.stat()
+            # 최상위 dict는 키 개수와 무관하게 분할 (파일 단위 지연 로딩)
+            if isinstance(data, dict):
+                kind, offset, length = write_table(out, data, 0)
+            else:
+                kind, offset, length = write_value(out, data, 0)
+
+            root[filename] = {
+                'version': [stat.st_mtime_ns, stat.st_size],
+                'kind': kind,
+                'offset': offset,
+                'length': length
+            }
+            print(f"   ✅ {filename}")
+
+        root_offset, root_length = write_block(out, encode(root))
+        out.seek(0)
+        out.write(BUNDLE_MAGIC)
+        out.write(root_offset.to_bytes(8, 'little'))
+        out.write(root_length.to_bytes(8, 'little'))
+
+    print(f"\n💾 저장 완료: {BUNDLE_FILE}")
+    print(f"   파일 크기: {BUNDLE_FILE.stat().st_size / 1024 / 1024:.1f} MB")
+
+if __name__ == '__main__':
+    main()
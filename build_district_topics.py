@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+구별 토픽/키워드 행렬 생성
+/api/lda/district/{gu} 응답을 요청 시 텍스트 처리 없이 배열 조회만으로 만들도록 미리 계산
+
+입력 (파일별로 기사를 하나씩 내보내는 제너레이터로 읽음):
+    gu_news_articles.json      - 구별 뉴스
+    gu_audit_news.json         - 구별 국정감사 뉴스
+    assembly_member_news.json  - 국회의원 뉴스 (선거구 → 구, 예: 중구성동구갑 → 중구, 성동구)
+
+처리:
+    1. 상태 파일(district_topic_state.json)에 없는 기사만 프로세스 풀에서 토큰화
+    2. 구별 단어 빈도에 누적 (기존 기사는 다시 토큰화하지 않음)
+    3. 구 × 단어 TF-IDF 행렬을 NMF로 분해 → 토픽별 상위 단어, 구별 토픽 비중
+    4. 희소 행렬(CSR)로 district_topics.bin.gz 저장 (convert_monthly_jumin.py와 같은 열 저장소 형식)
+
+사용법:
+    python build_district_topics.py              # 새 기사만 반영
+    python build_district_topics.py --full       # 상태 초기화 후 전체 재계산
+    python build_district_topics.py --workers 4  # 토큰화 프로세스 수 (기본: CPU 수)
+"""
+import argparse
+import gzip
+import html
+import json
+import os
+import re
+import sys
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path('insightforge-web/data')
+OUTPUT_FILE = DATA_DIR / 'district_topics.bin.gz'
+STATE_FILE = DATA_DIR / 'district_topic_state.json'
+SOURCES = {
+    'gu_news': 'gu_news_articles.json',
+    'gu_audit': 'gu_audit_news.json',
+    'assembly': 'assembly_member_news.json'
+}
+
+CHUNK_SIZE = 200  # 프로세스 1회 작업량 (기사 수)
+
+TOPIC_COUNT = 8
+TOPIC_TERMS = 20       # 토픽별 저장 단어 수
+DISTRICT_TERMS = 300   # 구별 저장 단어 수 (빈도순)
+MAX_VOCAB = 5000       # NMF에 쓰는 단어 수 (전체 빈도순)
+MIN_TERM_COUNT = 3
+NMF_ITERATIONS = 300
+
+# 열 저장소 형식: 매직 + 헤더 길이(4바이트) + 헤더 JSON + 열별 리틀엔디언 배열
+COLUMNAR_MAGIC = b'IFCOL1\n'
+
+TOKEN_PATTERN = re.compile(r'[가-힣A-Za-z0-9]{2,}')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+GU_PATTERN = re.compile(r'[가-힣]+?구')
+JOSA = ('에서는', '에서', '으로', '에게', '까지', '부터', '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도', '로', '만')
+STOPWORDS = {
+    '의원', '국회', '기자', '뉴스', '관련', '대한', '이번', '지난', '있는', '있다', '했다', '한다',
+    '것으', '따르면', '통해', '위해', '대해', '밝혔다', '말했다', '오늘', '이날', '가운데', '이후',
+    '지난해', '올해', '현재', '당시', '함께', '라고', '이라고', '등을', '등의', '하는', '했다고'
+}
+
+def tokenize(text):
+    """제목+요약 → 단어 목록 (태그/엔티티 제거, 조사 1개 제거, 숫자·불용어 제외)"""
+    text = TAG_PATTERN.sub(' ', html.unescape(text))
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text):
+        for josa in JOSA:
+            if token.endswith(josa) and len(token) - len(josa) >= 2:
+                token = token[:-len(josa)]
+                break
+        if token.isdigit() or token in STOPWORDS:
+            continue
+        tokens.append(token)
+    return tokens
+
+def count_chunk(texts):
+    """기사 텍스트 묶음 → 묶음 전체 단어 빈도 (프로세스 풀 작업 단위)"""
+    counts = Counter()
+    for text in texts:
+        counts.update(tokenize(text))
+    return counts
+
+def read_json(path):
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    gz_path = Path(str(path) + '.gz')
+    if gz_path.exists():
+        with gzip.open(gz_path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    print(f"   ⚠️  {path.name} 없음")
+    return {}
+
+def district_gus(district):
+    """선거구 이름 → 구 목록 ('중구성동구갑' → ['중구', '성동구'])"""
+    return GU_PATTERN.findall(district)
+
+def iter_articles():
+    """(구, 출처, 링크, 텍스트) 제너레이터 - 파일은 하나씩 읽고 바로 놓음"""
+    for source, filename in SOURCES.items():
+        data = read_json(DATA_DIR / filename)
+        for key, record in data.items():
+            # 구 파일 키도 '중구성동구'처럼 묶인 경우가 있어 같은 방식으로 나눔
+            district = record.get('member_info', {}).get('district', '') if source == 'assembly' else key
+            gus = district_gus(district)
+            for article in record.get('news', []):
+                text = f"{article.get('title', '')} {article.get('description', '')}"
+                for gu in gus:
+                    yield gu, source, article.get('link', ''), text
+        del data
+
+def load_state(full=False):
+    if full or not STATE_FILE.exists():
+        return {'seen': defaultdict(set), 'counts': defaultdict(Counter), 'articles': defaultdict(Counter)}
+    raw = read_json(STATE_FILE)
+    return {
+        'seen': defaultdict(set, {k: set(v) for k, v in raw['seen'].items()}),
+        'counts': defaultdict(Counter, {k: Counter(v) for k, v in raw['counts'].items()}),
+        'articles': defaultdict(Counter, {k: Counter(v) for k, v in raw['articles'].items()})
+    }
+
+def save_state(state):
+    raw = {
+        'seen': {k: sorted(v) for k, v in state['seen'].items()},
+        'counts': {k: dict(v) for k, v in state['counts'].items()},
+        'articles': {k: dict(v) for k, v in state['articles'].items()}
+    }
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(raw, f, ensure_ascii=False, separators=(',', ':'))
+
+def ingest(state, workers=None):
+    """새 기사만 구별로 모아 프로세스 풀에서 토큰화 → 구별 빈도에 누적"""
+    pending = defaultdict(list)
+    for gu, source, link, text in iter_articles():
+        # 같은 기사가 여러 출처에 있으면 처음 본 출처에만 반영
+        if link in state['seen'][gu]:
+            continue
+        state['seen'][gu].add(link)
+        state['articles'][gu][source] += 1
+        pending[gu].append(text)
+
+    jobs = [
+        (gu, texts[i:i + CHUNK_SIZE])
+        for gu, texts in pending.items()
+        for i in range(0, len(texts), CHUNK_SIZE)
+    ]
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (gu, _), counts in zip(jobs, pool.map(count_chunk, [texts for _, texts in jobs])):
+                state['counts'][gu].update(counts)
+    return sum(len(texts) for texts in pending.values())
+
+def factorize(matrix, k):
+    """NMF (곱셈 갱신, 고정 시드) → (구 × 토픽, 토픽 × 단어)"""
+    rng = np.random.default_rng(0)
+    rows, cols = matrix.shape
+    w = rng.random((rows, k)) + 0.1
+    h = rng.random((k, cols)) + 0.1
+    eps = 1e-10
+    for _ in range(NMF_ITERATIONS):
+        h *= (w.T @ matrix) / (w.T @ w @ h + eps)
+        w *= (matrix @ h.T) / (w @ h @ h.T + eps)
+    return w, h
+
+def build_matrices(state):
+    """구별 빈도 → 구 × 단어 CSR, 토픽 분해 결과"""
+    districts = sorted(gu for gu, counts in state['counts'].items() if counts)
+    totals = Counter()
+    for gu in districts:
+        totals.update(state['counts'][gu])
+    vocab = [term for term, count in totals.most_common(MAX_VOCAB) if count >= MIN_TERM_COUNT]
+    term_pos = {term: i for i, term in enumerate(vocab)}
+
+    # 구 × 단어 빈도 (NMF 입력은 log 빈도 × IDF, 행 정규화)
+    counts = np.zeros((len(districts), len(vocab)))
+    for row, gu in enumerate(districts):
+        for term, count in state['counts'][gu].items():
+            col = term_pos.get(term)
+            if col is not None:
+                counts[row, col] = count
+    idf = np.log((1 + len(districts)) / (1 + (counts > 0).sum(axis=0))) + 1
+    tfidf = np.log1p(counts) * idf
+    tfidf /= np.linalg.norm(tfidf, axis=1, keepdims=True) + 1e-10
+
+    k = min(TOPIC_COUNT, len(districts))
+    w, h = factorize(tfidf, k)
+    w /= w.sum(axis=1, keepdims=True) + 1e-10
+
+    # 저장할 단어 (구별 상위 + 토픽별 상위)만 헤더 어휘로
+    out_vocab = {}
+    def term_id(term):
+        return out_vocab.setdefault(term, len(out_vocab))
+
+    columns = {name: array('I') for name in ('term_offsets', 'term_ids', 'term_counts', 'topic_offsets', 'topic_terms')}
+    columns['topic_term_weights'] = array('f')
+    columns['topic_weights'] = array('f', w.astype(np.float32).ravel().tolist())
+
+    columns['term_offsets'].append(0)
+    for gu in districts:
+        for term, count in state['counts'][gu].most_common(DISTRICT_TERMS):
+            columns['term_ids'].append(term_id(term))
+            columns['term_counts'].append(count)
+        columns['term_offsets'].append(len(columns['term_ids']))
+
+    columns['topic_offsets'].append(0)
+    for topic in h:
+        top = np.argsort(-topic)[:TOPIC_TERMS]
+        scale = topic[top[0]] or 1.0
+        for col in top:
+            columns['topic_terms'].append(term_id(vocab[col]))
+            columns['topic_term_weights'].append(float(topic[col] / scale))
+        columns['topic_offsets'].append(len(columns['topic_terms']))
+
+    header = {
+        'analysis_date': datetime.now().strftime('%Y%m%d'),
+        'sources': list(SOURCES.values()),
+        'districts': districts,
+        'article_counts': [dict(state['articles'][gu]) for gu in districts],
+        'topic_count': k,
+        'vocab': list(out_vocab)
+    }
+    return header, columns
+
+def write_store(header, columns, output_file):
+    header = {
+        **header,
+        'columns': [
+            {'name': name, 'typecode': arr.typecode, 'length': len(arr)}
+            for name, arr in columns.items()
+        ]
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    with gzip.open(output_file, 'wb') as f:
+        f.write(COLUMNAR_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, 'little'))
+        f.write(header_bytes)
+        for arr in columns.values():
+            if sys.byteorder != 'little':
+                arr = array(arr.typecode, arr)
+                arr.byteswap()
+            f.write(arr.tobytes())
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='구별 토픽/키워드 행렬 생성')
+    parser.add_argument('--full', action='store_true', help='상태 초기화 후 전체 재계산')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='토큰화 프로세스 수 (기본: CPU 수)')
+    return parser.parse_args()
+
+def main(args):
+    print("🧩 구별 토픽/키워드 행렬 생성\n")
+    state = load_state(args.full)
+
+    new_articles = ingest(state, args.workers)
+    print(f"📰 새 기사: {new_articles:,}건 (프로세스 {args.workers}개)")
+    if not new_articles and OUTPUT_FILE.exists():
+        print("✅ 변경 없음 (행렬 유지)")
+        return
+
+    header, columns = build_matrices(state)
+    write_store(header, columns, OUTPUT_FILE)
+    save_state(state)
+
+    print(f"✅ {len(header['districts'])}개 구, 토픽 {header['topic_count']}개, 저장 단어 {len(header['vocab']):,}개")
+    print(f"💾 저장 완료: {OUTPUT_FILE}")
+    print(f"   파일 크기: {OUTPUT_FILE.stat().st_size / 1024:.1f} KB")
+
+if __name__ == '__main__':
+    main(parse_args())
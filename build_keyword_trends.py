@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 트렌드 저장소 생성
+의원/구별로 단어의 일별 빈도를 누적합(prefix sum)으로 저장해
+/api/trends가 어떤 기간이든 뺄셈 두 번으로 빈도를 구하도록 함
+
+입력 (기사 날짜 pubDate 기준, 한국 시간):
+    assembly_member_news.json  - 의원별 뉴스 (선거구 → 구에도 반영)
+    gu_news_articles.json      - 구별 뉴스 (politician 필드의 의원에도 반영)
+    gu_audit_news.json         - 구별 국정감사 뉴스 (동일)
+
+저장 (keyword_trends.bin.gz, convert_monthly_jumin.py와 같은 열 저장소 형식):
+    최근 TREND_DAYS일, 대상(의원/구)마다 빈도 상위 TREND_TERMS개 단어
+    prefix[행 × (일수+1)]   - 단어 행별 누적 빈도 (prefix[d] = 0..d-1일 합)
+    article_prefix          - 대상별 누적 기사 수
+    term_offsets/term_ids   - 대상별 단어 행 범위와 어휘 번호
+
+토큰화는 build_district_topics.py와 같은 규칙을 사용
+
+사용법:
+    python build_keyword_trends.py
+"""
+from array import array
+from collections import Counter, defaultdict
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+
+from build_district_topics import DATA_DIR, SOURCES, district_gus, read_json, tokenize, write_store
+
+OUTPUT_FILE = DATA_DIR / 'keyword_trends.bin.gz'
+TREND_DAYS = 180
+TREND_TERMS = 100
+
+def article_day(article):
+    """pubDate → 날짜 (파싱 실패 시 None)"""
+    try:
+        return parsedate_to_datetime(article['pubDate']).date()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def iter_dated_articles():
+    """(대상 목록, 링크, 날짜, 텍스트) 제너레이터 - 대상은 ('member'|'district', 이름)"""
+    for source, filename in SOURCES.items():
+        data = read_json(DATA_DIR / filename)
+        for key, record in data.items():
+            if source == 'assembly':
+                info = record.get('member_info', {})
+                entities = [('member', info.get('name') or key)]
+                entities += [('district', gu) for gu in district_gus(info.get('district', ''))]
+            else:
+                entities = [('district', gu) for gu in district_gus(key)]
+                if record.get('politician'):
+                    entities.append(('member', record['politician']))
+            for article in record.get('news', []):
+                day = article_day(article)
+                if day is None:
+                    continue
+                text = f"{article.get('title', '')} {article.get('description', '')}"
+                yield entities, article.get('link', ''), day, text
+        del data
+
+def main():
+    print("📈 키워드 트렌드 저장소 생성\n")
+    articles = list(iter_dated_articles())
+    if not articles:
+        print("❌ 날짜가 있는 기사가 없습니다")
+        return
+
+    last_day = max(day for _, _, day, _ in articles)
+    first_day = last_day - timedelta(days=TREND_DAYS - 1)
+
+    # 대상별 (일, 단어) 빈도 - 같은 기사가 여러 출처에 있으면 한 번만
+    seen = defaultdict(set)
+    day_terms = defaultdict(lambda: defaultdict(Counter))
+    day_articles = defaultdict(Counter)
+    skipped = 0
+    for entities, link, day, text in articles:
+        if day < first_day:
+            skipped += 1
+            continue
+        offset = (day - first_day).days
+        tokens = None
+        for entity in entities:
+            if link in seen[entity]:
+                continue
+            seen[entity].add(link)
+            if tokens is None:
+                tokens = tokenize(text)
+            day_terms[entity][offset].update(tokens)
+            day_articles[entity][offset] += 1
+
+    vocab = {}
+    entities = sorted(day_terms)
+    columns = {
+        'term_offsets': array('I', [0]),
+        'term_ids': array('I'),
+        'prefix': array('I'),
+        'article_prefix': array('I')
+    }
+    for entity in entities:
+        days = day_terms[entity]
+        totals = Counter()
+        for counts in days.values():
+            totals.update(counts)
+        for term, _ in totals.most_common(TREND_TERMS):
+            columns['term_ids'].append(vocab.setdefault(term, len(vocab)))
+            running = 0
+            columns['prefix'].append(0)
+            for offset in range(TREND_DAYS):
+                running += days[offset][term] if offset in days else 0
+                columns['prefix'].append(running)
+        columns['term_offsets'].append(len(columns['term_ids']))
+
+        running = 0
+        columns['article_prefix'].append(0)
+        for offset in range(TREND_DAYS):
+            running += day_articles[entity][offset]
+            columns['article_prefix'].append(running)
+
+    header = {
+        'sources': list(SOURCES.values()),
+        'start_date': first_day.isoformat(),
+        'day_count': TREND_DAYS,
+        'entities': [{'kind': kind, 'name': name} for kind, name in entities],
+        'vocab': list(vocab)
+    }
+    write_store(header, columns, OUTPUT_FILE)
+
+    kinds = Counter(kind for kind, _ in entities)
+    print(f"✅ 기간: {first_day} ~ {last_day} ({TREND_DAYS}일, 이전 기사 {skipped:,}건 제외)")
+    print(f"✅ 의원 {kinds['member']}명, 구 {kinds['district']}개, 단어 행 {len(columns['term_ids']):,}개")
+    print(f"💾 저장 완료: {OUTPUT_FILE}")
+    print(f"   파일 크기: {OUTPUT_FILE.stat().st_size / 1024:.1f} KB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+국회의원 연결망 증분 갱신
+assembly_member_news.json에 새로 들어온 기사만 반영해
+assembly_network_graph.json.gz의 member_connections, connection_stats,
+clusters, member_to_cluster를 갱신
+
+연결 규칙 (기존 그래프와 동일):
+    article_strength   = 5 × 공통 이슈 수   (의원별 이슈 = 기사에 등장한 이슈 분류)
+    committee_strength = 15 × 공통 위원회 수
+    total_strength >= 10 인 의원 쌍만 간선으로 저장
+    클러스터 = total_strength >= 30 간선의 연결 요소 중 3명 이상
+
+증분 처리:
+    1. 상태 파일(assembly_network_state.json)에 의원별 이슈/위원회, 반영한 기사 링크 보관
+    2. 새 기사만 이슈 분류 → 새 이슈가 생긴 의원만 표시
+    3. 그 의원과 같은 이슈를 가진 의원 쌍만 간선 재계산
+    4. 바뀐 간선이 닿는 연결 요소만 다시 클러스터링 (나머지 클러스터는 id/색 유지)
+    5. metadata.graph_version을 올려 저장
+
+상태 파일이 없으면 issue_articles_tracking.json(이슈)과 현재 그래프(위원회)로 초기화
+이슈 집합은 늘어나기만 하므로 상태 파일을 잃어도 다시 실행하면 같은 결과가 나옴
+
+사용법:
+    python build_network_incremental.py          # 새 기사만 반영
+    python build_network_incremental.py --full   # 상태 초기화 후 전체 재계산
+"""
+import argparse
+import gzip
+import html
+import json
+from collections import Counter, defaultdict, deque
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+
+DATA_DIR = Path('insightforge-web/data')
+GRAPH_FILE = DATA_DIR / 'assembly_network_graph.json.gz'
+STATE_FILE = DATA_DIR / 'assembly_network_state.json'
+NEWS_FILE = DATA_DIR / 'assembly_member_news.json'
+TRACKING_FILE = DATA_DIR / 'issue_articles_tracking.json'
+
+ARTICLE_WEIGHT = 5
+COMMITTEE_WEIGHT = 15
+MIN_EDGE_STRENGTH = 10
+CLUSTER_MIN_STRENGTH = 30
+CLUSTER_MIN_SIZE = 3
+CLUSTER_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E2']
+
+# 이슈 분류 규칙 (위에서부터 처음 맞는 이슈, 없으면 '기타')
+ISSUE_RULES = [
+    ('국정감사·질의', ('국정감사', '국감', '질의')),
+    ('법안·입법', ('법안', '개정안', '발의', '입법', '법률')),
+    ('예산·재정', ('예산', '재정', '세수', '기금')),
+    ('주택·부동산', ('부동산', '주택', '아파트', '전세', '재건축')),
+    ('교통·인프라', ('교통', '철도', '도로', '지하철', '공항', 'GTX')),
+    ('안전·재난', ('안전', '재난', '참사', '화재', '사고')),
+    ('복지·의료', ('복지', '의료', '병원', '건강보험', '돌봄')),
+    ('교육·보육', ('교육', '학교', '보육', '유치원', '학생')),
+    ('일자리·경제', ('일자리', '고용', '경제', '중소기업', '소상공인')),
+    ('문화·체육', ('문화', '체육', '예술', '관광', '스포츠')),
+    ('지역개발', ('개발', '재개발', '도시재생', '균형발전')),
+    ('민원·주민', ('민원', '주민', '간담회')),
+    ('정책발표', ('정책', '발표', '공약', '토론회')),
+]
+
+def classify_issue(article):
+    """기사 제목+요약 → 이슈 분류"""
+    text = html.unescape(f"{article.get('title', '')} {article.get('description', '')}")
+    for issue, keywords in ISSUE_RULES:
+        if any(keyword in text for keyword in keywords):
+            return issue
+    return '기타'
+
+def read_json(path):
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def bootstrap_state(graph):
+    """상태 초기화: 이슈는 이슈 추적 기사, 위원회/정당은 현재 그래프에서"""
+    member_issues = defaultdict(set)
+    seen = defaultdict(set)
+    for issue, issue_data in read_json(TRACKING_FILE).items():
+        for article in issue_data.get('articles', []):
+            name = article.get('member_name')
+            if name:
+                member_issues[name].add(issue)
+                seen[name].add(article.get('link', ''))
+
+    # 원본 위원회 명단이 없으므로 간선의 공통 위원회를 합쳐 복원 (공통 위원회 계산에는 충분)
+    member_committees = defaultdict(set)
+    parties = {name: info.get('party', '') for name, info in graph.get('members', {}).items()}
+    for edge in graph.get('member_connections', []):
+        member_committees[edge['from']].update(edge['common_committees'])
+        member_committees[edge['to']].update(edge['common_committees'])
+        parties.setdefault(edge['from'], edge.get('from_party', ''))
+        parties.setdefault(edge['to'], edge.get('to_party', ''))
+
+    return {
+        'graph_version': graph.get('metadata', {}).get('graph_version', 0),
+        'member_issues': member_issues,
+        'member_committees': member_committees,
+        'parties': parties,
+        'seen': seen
+    }
+
+def load_state():
+    raw = read_json(STATE_FILE)
+    return {
+        'graph_version': raw['graph_version'],
+        'member_issues': defaultdict(set, {k: set(v) for k, v in raw['member_issues'].items()}),
+        'member_committees': defaultdict(set, {k: set(v) for k, v in raw['member_committees'].items()}),
+        'parties': raw['parties'],
+        'seen': defaultdict(set, {k: set(v) for k, v in raw['seen'].items()})
+    }
+
+def save_state(state):
+    raw = {
+        'graph_version': state['graph_version'],
+        'member_issues': {k: sorted(v) for k, v in state['member_issues'].items()},
+        'member_committees': {k: sorted(v) for k, v in state['member_committees'].items()},
+        'parties': state['parties'],
+        'seen': {k: sorted(v) for k, v in state['seen'].items()}
+    }
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(raw, f, ensure_ascii=False, separators=(',', ':'))
+
+def ingest_news(state, news):
+    """새 기사만 반영 → {의원: 새로 생긴 이슈 집합}, 새 기사 수"""
+    added = defaultdict(set)
+    new_articles = 0
+    for name, member_news in news.items():
+        info = member_news.get('member_info', {})
+        if info.get('party'):
+            state['parties'].setdefault(name, info['party'])
+        seen = state['seen'][name]
+        for article in member_news.get('news', []):
+            link = article.get('link', '')
+            if link in seen:
+                continue
+            seen.add(link)
+            new_articles += 1
+            issue = classify_issue(article)
+            if issue not in state['member_issues'][name]:
+                state['member_issues'][name].add(issue)
+                added[name].add(issue)
+    return added, new_articles
+
+def build_edge(state, a, b):
+    """의원 쌍 → member_connections 레코드 (기준 미달이면 None)"""
+    issues_a, issues_b = state['member_issues'].get(a, set()), state['member_issues'].get(b, set())
+    committees_a, committees_b = state['member_committees'].get(a, set()), state['member_committees'].get(b, set())
+    common_issues = sorted(issues_a & issues_b)
+    common_committees = sorted(committees_a & committees_b)
+    article_strength = ARTICLE_WEIGHT * len(common_issues)
+    committee_strength = COMMITTEE_WEIGHT * len(common_committees)
+    total_strength = article_strength + committee_strength
+    if total_strength < MIN_EDGE_STRENGTH:
+        return None
+
+    types = []
+    if common_issues:
+        types.append('article')
+    if common_committees:
+        types.append('committee')
+    return {
+        'id': f'{a}_{b}',
+        'from': a,
+        'to': b,
+        'from_party': state['parties'].get(a, ''),
+        'to_party': state['parties'].get(b, ''),
+        'types': types,
+        'article_strength': article_strength,
+        'committee_strength': committee_strength,
+        'total_strength': total_strength,
+        'common_issues': common_issues,
+        'common_committees': common_committees
+    }
+
+def edge_type(edge):
+    """connection_stats 분류 키"""
+    if edge is None:
+        return None
+    if edge['article_strength'] and edge['committee_strength']:
+        return 'both'
+    return 'article_only' if edge['article_strength'] else 'committee_only'
+
+def update_edges(graph, state, added):
+    """새 이슈가 생긴 의원이 포함된 쌍만 재계산 → 바뀐 간선의 양끝 의원 집합"""
+    edges = graph['member_connections']
+    edge_pos = {frozenset((e['from'], e['to'])): i for i, e in enumerate(edges)}
+
+    # 이슈 → 의원 역색인 (새 이슈와 같은 이슈를 가진 의원만 후보)
+    issue_members = defaultdict(set)
+    for name, issues in state['member_issues'].items():
+        for issue in issues:
+            issue_members[issue].add(name)
+
+    pairs = set()
+    for name, issues in added.items():
+        for issue in issues:
+            for other in issue_members[issue]:
+                if other != name:
+                    pairs.add(frozenset((name, other)))
+
+    stats = graph['connection_stats']
+    changed_nodes = set()
+    removed = set()
+    for pair in pairs:
+        i = edge_pos.get(pair)
+        old = edges[i] if i is not None else None
+        a, b = (old['from'], old['to']) if old else sorted(pair)
+        new = build_edge(state, a, b)
+        if new == old:
+            continue
+        for key, delta in ((edge_type(old), -1), (edge_type(new), 1)):
+            if key:
+                stats[key] += delta
+        if old is None:
+            edge_pos[pair] = len(edges)
+            edges.append(new)
+        elif new is None:
+            removed.add(i)
+        else:
+            edges[i] = new
+        changed_nodes.update(pair)
+
+    if removed:
+        graph['member_connections'] = [e for i, e in enumerate(edges) if i not in removed]
+    stats['total_connections'] = len(graph['member_connections'])
+    return changed_nodes
+
+def rebuild_edges(graph, state):
+    """전체 재계산 (--full): 이슈/위원회를 공유하는 모든 쌍"""
+    candidates = defaultdict(set)
+    for field in ('member_issues', 'member_committees'):
+        for name, keys in state[field].items():
+            for key in keys:
+                candidates[(field, key)].add(name)
+
+    members = sorted(set(state['member_issues']) | set(state['member_committees']))
+    order = {name: i for i, name in enumerate(members)}
+    pairs = set()
+    for names in candidates.values():
+        pairs.update(combinations(sorted(names, key=order.get), 2))
+
+    edges = [edge for edge in (build_edge(state, a, b) for a, b in sorted(pairs, key=lambda p: (order[p[0]], order[p[1]]))) if edge]
+    stats = Counter(edge_type(e) for e in edges)
+    graph['member_connections'] = edges
+    graph['connection_stats'] = {
+        'total_connections': len(edges),
+        'article_only': stats['article_only'],
+        'committee_only': stats['committee_only'],
+        'both': stats['both']
+    }
+
+def strong_adjacency(edges):
+    adjacency = defaultdict(set)
+    for edge in edges:
+        if edge['total_strength'] >= CLUSTER_MIN_STRENGTH:
+            adjacency[edge['from']].add(edge['to'])
+            adjacency[edge['to']].add(edge['from'])
+    return adjacency
+
+def components_from(adjacency, seeds):
+    """seeds가 속한 연결 요소만 BFS (요소 안의 의원 순서는 방문 순)"""
+    visited = set()
+    components = []
+    for seed in seeds:
+        if seed in visited:
+            continue
+        visited.add(seed)
+        component = [seed]
+        queue = deque([seed])
+        while queue:
+            for neighbor in adjacency[queue.popleft()]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    component.append(neighbor)
+                    queue.append(neighbor)
+        components.append(component)
+    return components
+
+def make_cluster(cluster_id, members, edges_by_member):
+    """연결 요소 → clusters 레코드 (공통 이슈/위원회는 내부 간선 빈도순)"""
+    member_set = set(members)
+    internal = {
+        id(edge): edge
+        for name in members for edge in edges_by_member[name]
+        if edge['from'] in member_set and edge['to'] in member_set
+        and edge['total_strength'] >= CLUSTER_MIN_STRENGTH
+    }.values()
+    issues = Counter(issue for edge in internal for issue in edge['common_issues'])
+    committees = Counter(c for edge in internal for c in edge['common_committees'])
+    return {
+        'id': cluster_id,
+        'members': members,
+        'size': len(members),
+        'connections': len(internal),
+        'common_issues': [issue for issue, _ in issues.most_common()],
+        'common_committees': [c for c, _ in committees.most_common()],
+        'color': CLUSTER_COLORS[cluster_id % len(CLUSTER_COLORS)]
+    }
+
+def recluster(graph, seeds):
+    """seeds가 닿는 연결 요소만 다시 클러스터링, 나머지 클러스터는 그대로 유지"""
+    edges = graph['member_connections']
+    adjacency = strong_adjacency(edges)
+    components = components_from(adjacency, sorted(seeds))
+    affected = {name for component in components for name in component}
+
+    kept = []
+    free_ids = []
+    for cluster in graph.get('clusters', []):
+        if affected.isdisjoint(cluster['members']):
+            kept.append(cluster)
+        else:
+            free_ids.append(cluster['id'])
+
+    edges_by_member = defaultdict(list)
+    for edge in edges:
+        if edge['from'] in affected or edge['to'] in affected:
+            edges_by_member[edge['from']].append(edge)
+            edges_by_member[edge['to']].append(edge)
+
+    # 큰 요소부터 기존 id 재사용, 모자라면 새 id
+    next_id = max((c['id'] for c in graph.get('clusters', [])), default=-1) + 1
+    free_ids.sort(reverse=True)
+    new_clusters = []
+    for component in sorted(components, key=len, reverse=True):
+        if len(component) < CLUSTER_MIN_SIZE:
+            continue
+        if free_ids:
+            cluster_id = free_ids.pop()
+        else:
+            cluster_id = next_id
+            next_id += 1
+        new_clusters.append(make_cluster(cluster_id, component, edges_by_member))
+
+    graph['clusters'] = sorted(kept + new_clusters, key=lambda c: c['id'])
+    graph['member_to_cluster'] = {
+        name: cluster['id'] for cluster in graph['clusters'] for name in cluster['members']
+    }
+    return len(new_clusters)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='국회의원 연결망 증분 갱신')
+    parser.add_argument('--full', action='store_true', help='상태 초기화 후 전체 재계산')
+    return parser.parse_args()
+
+def main(args):
+    print("🕸️  국회의원 연결망 증분 갱신\n")
+    graph = read_json(GRAPH_FILE)
+
+    if args.full or not STATE_FILE.exists():
+        print("🔄 상태 초기화 (이슈 추적 기사 + 현재 그래프의 위원회)")
+        state = bootstrap_state(graph)
+    else:
+        state = load_state()
+
+    added, new_articles = ingest_news(state, read_json(NEWS_FILE))
+    print(f"📰 새 기사: {new_articles:,}건, 새 이슈가 생긴 의원: {len(added)}명")
+
+    if args.full:
+        rebuild_edges(graph, state)
+        graph['clusters'] = []
+        seeds = set(strong_adjacency(graph['member_connections']))
+    else:
+        if not added:
+            save_state(state)
+            print("✅ 변경 없음 (그래프 유지)")
+            return
+        seeds = update_edges(graph, state, added)
+        print(f"🔗 바뀐 간선이 닿는 의원: {len(seeds)}명")
+
+    reclustered = recluster(graph, seeds)
+
+    state['graph_version'] += 1
+    graph['metadata']['graph_version'] = state['graph_version']
+    graph['metadata']['last_updated'] = datetime.now().isoformat()
+
+    with gzip.open(GRAPH_FILE, 'wt', encoding='utf-8') as f:
+        json.dump(graph, f, ensure_ascii=False, indent=2)
+    save_state(state)
+
+    stats = graph['connection_stats']
+    print(f"✅ 간선 {stats['total_connections']:,}개 (기사 {stats['article_only']:,}, 위원회 {stats['committee_only']:,}, 둘 다 {stats['both']:,})")
+    print(f"✅ 클러스터 {len(graph['clusters'])}개 (다시 계산 {reclustered}개)")
+    print(f"💾 저장 완료: {GRAPH_FILE} (graph_version {state['graph_version']})")
+
+if __name__ == '__main__':
+    main(parse_args())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+읍면동 지역 카드 생성
+/api/emdong/<code>/enhanced 응답을 읍면동 코드별로 미리 조인해 저장
+
+조인 대상:
+    sgis_national_regions.json   - 기본 정보
+    sgis_comprehensive_stats.json - 사업체, 주택 등
+    code_mapping.json             - SGIS 코드 → 주민등록 코드
+    jumin_population_2025.json    - 주민등록 인구/가구 (우선 사용)
+    jumin_growth_2025.json        - 인구증감 (2025년 9월)
+
+위 파일을 다시 만들었다면 이 스크립트도 다시 실행해야 함
+(Vercel 배포 시에는 buildCommand에서 번들 빌드 전에 실행)
+헤더의 source_versions({파일명: [mtime_ns, size]}, build_data_bundle.py와 동일)가
+원본과 다르면 api/index.py는 카드 파일을 무시하고 원본 파일에서 직접 조인
+
+사용법:
+    python build_region_cards.py
+"""
+import gzip
+import json
+from pathlib import Path
+
+DATA_DIR = Path('insightforge-web/data')
+OUTPUT_FILE = DATA_DIR / 'emdong_region_cards.json'
+SOURCE_FILES = [
+    'sgis_national_regions.json',
+    'sgis_comprehensive_stats.json',
+    'code_mapping.json',
+    'jumin_population_2025.json',
+    'jumin_growth_2025.json'
+]
+GROWTH_MONTH = '2025년09월'
+
+def source_path(filename):
+    """실제로 읽을 파일 경로 (gzip 우선, 없으면 None)"""
+    for path in (DATA_DIR / (filename + '.gz'), DATA_DIR / filename):
+        if path.exists():
+            return path
+    return None
+
+def source_version(filename):
+    """원본 파일 버전 [mtime_ns, size] (없으면 None)"""
+    path = source_path(filename)
+    if path is None:
+        return None
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+def read_json(filename):
+    """데이터 파일 읽기 (gzip 우선, 없으면 빈 dict)"""
+    path = source_path(filename)
+    if path is None:
+        print(f"   ⚠️  {filename} 없음")
+        return {}
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def iter_emdong(national):
+    """sgis_national_regions.json → (읍면동 코드, 레코드)"""
+    for sido_data in national.get('regions', {}).values():
+        for sigungu in sido_data.get('sigungu_list', []):
+            if not sigungu.get('sigungu_code'):
+                continue
+            for emdong in sigungu.get('emdong_list', []):
+                if emdong.get('emdong_code'):
+                    yield emdong['emdong_code'], emdong
+
+def build_card(base_data, emdong_stats, jumin_info, growth_info):
+    """읍면동 1개의 카드 - 주민등록 데이터 우선"""
+    card = {
+        **base_data,
+        **emdong_stats
+    }
+
+    # 주민등록 데이터로 가구/인구 덮어쓰기 (더 정확함)
+    if jumin_info:
+        card['household'] = {
+            'household_cnt': jumin_info.get('household_cnt', 0),
+            'family_member_cnt': jumin_info.get('total_population', 0),
+            'avg_family_member_cnt': jumin_info.get('avg_household_size', 0),
+            'male_population': jumin_info.get('male_population', 0),
+            'female_population': jumin_info.get('female_population', 0)
+        }
+        card['data_source'] = '주민등록 2025-09'
+        card['data_year'] = '2025-09'
+
+    # 인구증감 데이터 추가
+    if growth_info and 'data' in growth_info:
+        growth_cols = growth_info['data']
+        card['population_growth'] = {
+            'prev_month': growth_cols.get(f'{GROWTH_MONTH}_전월인구수_계', 0),
+            'curr_month': growth_cols.get(f'{GROWTH_MONTH}_당월인구수_계', 0),
+            'change': growth_cols.get(f'{GROWTH_MONTH}_인구증감_계', 0),
+            'male_change': growth_cols.get(f'{GROWTH_MONTH}_인구증감_남자인구수', 0),
+            'female_change': growth_cols.get(f'{GROWTH_MONTH}_인구증감_여자인구수', 0)
+        }
+
+    return card
+
+def main():
+    print("🗂️  읍면동 지역 카드 생성\n")
+    # 읽기 전에 버전 기록 (조인 도중 원본이 바뀌면 다음 실행까지 카드 파일이 무시되도록)
+    source_versions = {filename: source_version(filename) for filename in SOURCE_FILES}
+    national, comprehensive, code_mapping, jumin, growth = (read_json(f) for f in SOURCE_FILES)
+
+    stats_regions = comprehensive.get('regions', {})
+    mapping_dict = code_mapping.get('mapping', {})
+    jumin_regions = jumin.get('regions', {})
+    growth_regions = growth.get('regions', {})
+
+    # 기본 정보가 없는 코드도 통계/주민등록 데이터가 있으면 카드 생성 (API 응답과 동일)
+    base_records = dict(iter_emdong(national))
+    all_codes = dict.fromkeys([*base_records, *stats_regions, *mapping_dict])
+
+    cards = {}
+    with_jumin = 0
+    for emdong_code in all_codes:
+        base_data = base_records.get(emdong_code, {})
+        jumin_code = mapping_dict[emdong_code]['jumin_code'] if emdong_code in mapping_dict else None
+        jumin_info = jumin_regions.get(jumin_code, {}) if jumin_code else {}
+        growth_info = growth_regions.get(jumin_code, {}) if jumin_code else {}
+        cards[emdong_code] = build_card(base_data, stats_regions.get(emdong_code, {}), jumin_info, growth_info)
+        if jumin_info:
+            with_jumin += 1
+
+    output = {
+        'source_files': SOURCE_FILES,
+        'source_versions': source_versions,
+        'total_regions': len(cards),
+        'regions': cards
+    }
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
+
+    print(f"✅ 카드 생성 완료: {len(cards):,}개 읍면동 (주민등록 매칭 {with_jumin:,}개)")
+    print(f"💾 저장 완료: {OUTPUT_FILE}")
+    print(f"   파일 크기: {OUTPUT_FILE.stat().st_size / 1024 / 1024:.1f} MB")
+
+if __name__ == '__main__':
+    main()
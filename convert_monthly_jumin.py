@@ -2,23 +2,160 @@
 """
 월별 주민등록 인구 데이터 변환
 2022-2025년 데이터를 JSON으로 변환
++ 열 저장소(jumin_monthly_columnar.bin.gz) 생성
+
+사용법:
+    python convert_monthly_jumin.py              # CSV → JSON + 열 저장소
+    python convert_monthly_jumin.py --from-json  # 기존 JSON → 열 저장소만 생성
 """
 
+import numpy as np
 import pandas as pd
 import json
 from pathlib import Path
+from array import array
 import glob
-import re
+import gzip
+import sys
 
-def parse_number(val):
-    """쉼표 제거하고 숫자로 변환"""
-    if pd.isna(val):
-        return 0
-    s = str(val).replace(',', '').strip()
-    try:
-        return int(float(s))
-    except:
-        return 0
+# 열 저장소 형식: 매직 + 헤더 길이(4바이트) + 헤더 JSON + 열별 리틀엔디언 배열
+COLUMNAR_MAGIC = b'IFCOL1\n'
+MONTHLY_FIELDS = ('population', 'male', 'female', 'household', 'change')
+
+def write_columnar_store(monthly_data, output_file, metadata):
+    """지역별 월 데이터를 열 저장소로 저장
+    
+    지역 i의 행 범위는 offsets[i]:offsets[i+1], month 열은 months 목록의 인덱스
+    """
+    months = sorted({m['date'] for region in monthly_data.values() for m in region['monthly']})
+    month_pos = {date: i for i, date in enumerate(months)}
+    
+    codes = []
+    names = []
+    offsets = array('I', [0])
+    columns = {'month': array('H')}
+    for field in MONTHLY_FIELDS:
+        columns[field] = array('i')
+    
+    for code, region in monthly_data.items():
+        codes.append(code)
+        names.append(region['name'])
+        for m in region['monthly']:
+            columns['month'].append(month_pos[m['date']])
+            for field in MONTHLY_FIELDS:
+                columns[field].append(m[field])
+        offsets.append(len(columns['month']))
+    
+    all_columns = {'offsets': offsets, **columns}
+    header = {
+        **metadata,
+        'months': months,
+        'codes': codes,
+        'names': names,
+        'columns': [
+            {'name': name, 'typecode': arr.typecode, 'length': len(arr)}
+            for name, arr in all_columns.items()
+        ]
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    
+    with gzip.open(output_file, 'wb') as f:
+        f.write(COLUMNAR_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, 'little'))
+        f.write(header_bytes)
+        for arr in all_columns.values():
+            if sys.byteorder != 'little':
+                arr = array(arr.typecode, arr)
+                arr.byteswap()
+            f.write(arr.tobytes())
+    
+    return len(columns['month'])
+
+FROM_JSON = '--from-json' in sys.argv
+
+# 월별 컬럼 필드 (출력 키 → CSV 헤더 접미사)
+CSV_FIELDS = {
+    'population': '총인구수',
+    'male': '남자 인구수',
+    'female': '여자 인구수',
+    'household': '세대수'
+}
+
+def parse_month_layout(columns):
+    """헤더를 한 번만 해석 → [(연도 문자열, 월 문자열, {필드: 컬럼명})]
+    
+    "2022년01월_총인구수" → ('2022', '01', {'population': '2022년01월_총인구수', ...})
+    """
+    layout = []
+    for col in columns:
+        if '_총인구수' in col and '년' in col and '월' in col:
+            year_month = col.split('_')[0]  # "2022년01월"
+            year_str = year_month.split('년')[0]
+            month_str = year_month.split('년')[1].replace('월', '').zfill(2)
+            if not (year_str.isdigit() and month_str.isdigit()):
+                continue
+            layout.append((year_str, month_str, {
+                field: f'{year_month}_{suffix}' for field, suffix in CSV_FIELDS.items()
+            }))
+    return layout
+
+def parse_number_column(df, col):
+    """숫자 열 일괄 변환 (쉼표 제거, 소수점 버림, 결측/오류는 0)"""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=np.int64)
+    values = pd.to_numeric(
+        df[col].astype(str).str.replace(',', '', regex=False).str.strip(),
+        errors='coerce'
+    ).to_numpy(dtype=np.float64)
+    values = np.where(np.isfinite(values), np.trunc(values), 0)
+    return values.astype(np.int64)
+
+def convert_file(df, monthly_data):
+    """CSV 1개 → monthly_data에 월별 레코드 추가 (열 단위 벡터 변환)"""
+    layout = parse_month_layout(df.columns)
+    
+    # 행정구역 파싱 (예: "전국  (1000000000)")
+    admin_cells = df['행정구역'].astype(str).str.strip()
+    codes = admin_cells.str.extract(r'\((\d+)\)', expand=False).tolist()
+    names = admin_cells.str.split('(').str[0].str.strip().tolist()
+    
+    # (행, 월, 필드) 블록을 한 번에 변환
+    block = np.zeros((len(df), len(layout), len(CSV_FIELDS)), dtype=np.int64)
+    for j, (_, _, cols) in enumerate(layout):
+        for k, field in enumerate(CSV_FIELDS):
+            block[:, j, k] = parse_number_column(df, cols[field])
+    rows = block.tolist()
+    
+    months = [(int(year_str), int(month_str), f'{year_str}-{month_str}') for year_str, month_str, _ in layout]
+    for admin_code, admin_name, row in zip(codes, names, rows):
+        if not isinstance(admin_code, str):
+            continue
+        
+        # 첫 발견 시 초기화, 이후엔 추가만
+        if admin_code not in monthly_data:
+            monthly_data[admin_code] = {
+                'code': admin_code,
+                'name': admin_name,
+                'monthly': []
+            }
+        elif admin_name:
+            # 이름 업데이트 (최신 것 사용)
+            monthly_data[admin_code]['name'] = admin_name
+        
+        monthly = monthly_data[admin_code]['monthly']
+        for (year, month, date), (total_pop, male_pop, female_pop, household) in zip(months, row):
+            if total_pop == 0:
+                continue
+            monthly.append({
+                'year': year,
+                'month': month,
+                'date': date,
+                'population': total_pop,
+                'male': male_pop,
+                'female': female_pop,
+                'household': household,
+                'change': 0  # 나중에 계산
+            })
 
 # 데이터 수집
 monthly_data = {}
@@ -30,6 +167,17 @@ target_files = sorted([f for f in human_files
                       if '%EC%9D%B8%EA%B5%AC%EC%A6%9D%EA%B0%90' not in f 
                       and any(str(y) in f for y in range(2018, 2026))])
 
+if FROM_JSON:
+    # 기존 JSON(.json 또는 .json.gz)에서 지역별 월 데이터 읽기
+    json_file = Path('insightforge-web/data/jumin_monthly_full.json')
+    if json_file.exists():
+        with open(json_file, 'r', encoding='utf-8') as f:
+            monthly_data = json.load(f)['regions']
+    else:
+        with gzip.open(str(json_file) + '.gz', 'rt', encoding='utf-8') as f:
+            monthly_data = json.load(f)['regions']
+    target_files = []
+
 print(f'📁 발견된 파일: {len(target_files)}개\n')
 
 for file_path in target_files:
@@ -37,65 +185,7 @@ for file_path in target_files:
     
     try:
         df = pd.read_csv(file_path, encoding='cp949')
-        
-        # 각 행은 하나의 행정구역
-        for _, row in df.iterrows():
-            try:
-                # 행정구역 파싱 (예: "전국  (1000000000)")
-                admin_cell = str(row['행정구역']).strip()
-                code_match = re.search(r'\((\d+)\)', admin_cell)
-                if not code_match:
-                    continue
-                
-                admin_code = code_match.group(1)
-                admin_name = admin_cell.split('(')[0].strip()
-                
-                # 첫 발견 시 초기화, 이후엔 추가만
-                if admin_code not in monthly_data:
-                    monthly_data[admin_code] = {
-                        'code': admin_code,
-                        'name': admin_name,
-                        'monthly': []
-                    }
-                else:
-                    # 이름 업데이트 (최신 것 사용)
-                    if admin_name:
-                        monthly_data[admin_code]['name'] = admin_name
-                
-                # 각 월별 컬럼 파싱
-                for col in df.columns:
-                    if '_총인구수' in col and '년' in col and '월' in col:
-                        # "2022년01월_총인구수" -> "2022", "01"
-                        year_month = col.split('_')[0]  # "2022년01월"
-                        year_str = year_month.split('년')[0]
-                        month_str = year_month.split('년')[1].replace('월', '').zfill(2)
-                        
-                        total_col = f'{year_month}_총인구수'
-                        male_col = f'{year_month}_남자 인구수'
-                        female_col = f'{year_month}_여자 인구수'
-                        household_col = f'{year_month}_세대수'
-                        
-                        total_pop = parse_number(row.get(total_col, 0))
-                        male_pop = parse_number(row.get(male_col, 0))
-                        female_pop = parse_number(row.get(female_col, 0))
-                        household = parse_number(row.get(household_col, 0))
-                        
-                        if total_pop == 0:
-                            continue
-                        
-                        monthly_data[admin_code]['monthly'].append({
-                            'year': int(year_str),
-                            'month': int(month_str),
-                            'date': f'{year_str}-{month_str}',
-                            'population': total_pop,
-                            'male': male_pop,
-                            'female': female_pop,
-                            'household': household,
-                            'change': 0  # 나중에 계산
-                        })
-                
-            except Exception as e:
-                continue
+        convert_file(df, monthly_data)
         
         print(f'   ✅ 완료\n')
         
@@ -107,11 +197,13 @@ for file_path in target_files:
 for code in monthly_data:
     monthly_data[code]['monthly'].sort(key=lambda x: (x['year'], x['month']))
     
-    # 증감 계산
-    for i in range(1, len(monthly_data[code]['monthly'])):
-        curr = monthly_data[code]['monthly'][i]
-        prev = monthly_data[code]['monthly'][i-1]
-        curr['change'] = curr['population'] - prev['population']
+    # 증감 계산 (전월 대비 차분, 첫 달은 0)
+    monthly = monthly_data[code]['monthly']
+    if len(monthly) < 2:
+        continue
+    changes = np.diff([m['population'] for m in monthly]).tolist()
+    for m, change in zip(monthly[1:], changes):
+        m['change'] = change
 
 # 통계
 total_regions = len(monthly_data)
@@ -145,8 +237,21 @@ output = {
 }
 
 output_file = 'insightforge-web/data/jumin_monthly_full.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(output, f, ensure_ascii=False, indent=2)
+if not FROM_JSON:
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    
+    print(f'\n💾 저장 완료: {output_file}')
+    print(f'   파일 크기: {Path(output_file).stat().st_size / 1024 / 1024:.1f} MB')
+
+# 열 저장소 (API 서버용: 필드별 연속 숫자 배열)
+columnar_file = 'insightforge-web/data/jumin_monthly_columnar.bin.gz'
+row_count = write_columnar_store(
+    monthly_data,
+    columnar_file,
+    {k: v for k, v in output.items() if k != 'regions'}
+)
 
-print(f'\n💾 저장 완료: {output_file}')
-print(f'   파일 크기: {Path(output_file).stat().st_size / 1024 / 1024:.1f} MB')
+print(f'\n💾 열 저장소 저장 완료: {columnar_file}')
+print(f'   행 수: {row_count:,}')
+print(f'   파일 크기: {Path(columnar_file).stat().st_size / 1024 / 1024:.1f} MB')
@@ -2,221 +2,272 @@
 """
 주민등록 인구 데이터 변환 (2008-2025년 9월)
 human/ 폴더의 월간 데이터를 연간 데이터로 집계
+
+- CSV 파일을 프로세스 풀에서 병렬로 파싱 (숫자 열은 열 단위 벡터 연산)
+- 파일 해시 매니페스트를 저장해 월간 갱신 시 새로 추가/변경된 CSV만 다시 파싱하고
+  기존 결과(population_yearly_data.json)에 병합
+
+사용법:
+    python convert_population_data.py          # 증분 갱신
+    python convert_population_data.py --full   # 전체 재생성
 """
 
 import pandas as pd
 import json
-import glob
+import gzip
+import hashlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import os
 import re
 
-# 결과 저장용
-population_by_year = {}
-population_change_by_year = {}
-
-print("📊 주민등록 인구 데이터 변환 시작 (2008-2025년 9월)\n")
-
-# 1. 인구 및 세대 현황 데이터 (human/)
-human_files = sorted([f for f in os.listdir('human') if f.endswith('.csv')])
-print(f"📁 인구 파일: {len(human_files)}개")
-
-for filename in human_files:
-    file_path = os.path.join('human', filename)
-    
-    # 연도 추출 (예: 201501_201512)
-    year_match = re.search(r'(\d{4})\d{2}_', filename)
-    if not year_match:
-        continue
-    
-    year = int(year_match.group(1))
-    
-    if year < 2008:
-        continue
-    
-    print(f"   {year}년 처리 중...")
-    
+OUTPUT_FILE = 'insightforge-web/data/population_yearly_data.json'
+MANIFEST_FILE = 'insightforge-web/data/population_yearly_manifest.json'
+MANIFEST_VERSION = 1
+
+# 원본 폴더 → 결과 섹션
+SOURCES = {
+    'human': 'population',
+    'humanre': 'population_change'
+}
+
+FULL_REBUILD = '--full' in sys.argv
+
+def file_hash(path):
+    """파일 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def parse_numeric(df, cols):
+    """숫자 열 벡터 파싱 (쉼표 제거, 변환 불가 값은 NaN)"""
+    return pd.DataFrame({
+        col: pd.to_numeric(
+            df[col].astype(str).str.replace(',', '', regex=False).str.strip(),
+            errors='coerce'
+        )
+        for col in cols
+    }, index=df.index)
+
+def avg_columns(df, cols):
+    """행별 월 평균 (유효 값 없으면 0)"""
+    return parse_numeric(df, cols).mean(axis=1).fillna(0).astype('int64').tolist()
+
+def sum_columns(df, cols):
+    """행별 월 합계 (유효 값 없으면 0)"""
+    return parse_numeric(df, cols).sum(axis=1, min_count=1).fillna(0).astype('int64').tolist()
+
+def read_year_csv(file_path, year):
+    """CSV 읽기 → (DataFrame, 해당 연도 열) / 형식이 맞지 않으면 경고 문자열"""
+    df = pd.read_csv(file_path, encoding='cp949')
+    df.columns = df.columns.str.strip()
+
+    if '행정구역' not in df.columns:
+        return None, "행정구역 열 없음"
+
+    # 해당 연도의 모든 월 데이터 추출
+    year_cols = [col for col in df.columns if col.startswith(f'{year}년')]
+    if len(year_cols) == 0:
+        return None, f"{year}년 데이터 없음"
+
+    return df, year_cols
+
+def parse_population(df, year_cols):
+    """인구 및 세대 현황 → {행정구역: {...}}"""
+    # 총인구수, 세대수 컬럼 찾기
+    pop_cols = [col for col in year_cols if '총인구수' in col]
+    household_cols = [col for col in year_cols if '세대수' in col]
+    male_cols = [col for col in year_cols if '남자 인구수' in col or '남자인구수' in col]
+    female_cols = [col for col in year_cols if '여자 인구수' in col or '여자인구수' in col]
+
+    regions = df['행정구역'].astype(str).str.strip().tolist()
+    total_pop = avg_columns(df, pop_cols)
+    households = avg_columns(df, household_cols)
+    male = avg_columns(df, male_cols) if male_cols else [None] * len(df)
+    female = avg_columns(df, female_cols) if female_cols else [None] * len(df)
+
+    records = {}
+    for region, pop, hh, m, f in zip(regions, total_pop, households, male, female):
+        if pop > 0:
+            records[region] = {
+                'total_population': pop,
+                'households': hh,
+                'male': m,
+                'female': f
+            }
+    return records
+
+def parse_population_change(df, year_cols):
+    """인구 증감 → {행정구역: {...}}"""
+    # 인구증감 관련 컬럼 찾기
+    column_groups = {
+        'births': [col for col in year_cols if '출생' in col],
+        'deaths': [col for col in year_cols if '사망' in col],
+        'move_in': [col for col in year_cols if '전입' in col],
+        'move_out': [col for col in year_cols if '전출' in col],
+        'net_change': [col for col in year_cols if '증감' in col]
+    }
+
+    regions = df['행정구역'].astype(str).str.strip().tolist()
+    values = {
+        key: sum_columns(df, cols) if cols else [None] * len(df)
+        for key, cols in column_groups.items()
+    }
+
+    records = {}
+    for i, region in enumerate(regions):
+        records[region] = {key: column[i] for key, column in values.items()}
+    return records
+
+def parse_file(folder, filename, year):
+    """워커: CSV 1개 파싱 → (folder, filename, year, records, 경고/에러)"""
     try:
-        # CSV 읽기
-        df = pd.read_csv(file_path, encoding='cp949')
-        df.columns = df.columns.str.strip()
-        
-        # 행정구역 열 확인
-        if '행정구역' not in df.columns:
-            print(f"      ⚠️  행정구역 열 없음")
-            continue
-        
-        # 해당 연도의 모든 월 데이터 추출
-        year_cols = [col for col in df.columns if col.startswith(f'{year}년')]
-        
-        if len(year_cols) == 0:
-            print(f"      ⚠️  {year}년 데이터 없음")
-            continue
-        
-        # 총인구수, 세대수 컬럼 찾기
-        pop_cols = [col for col in year_cols if '총인구수' in col]
-        household_cols = [col for col in year_cols if '세대수' in col]
-        male_cols = [col for col in year_cols if '남자 인구수' in col or '남자인구수' in col]
-        female_cols = [col for col in year_cols if '여자 인구수' in col or '여자인구수' in col]
-        
-        if year not in population_by_year:
-            population_by_year[year] = {}
-        
-        # 각 행정구역별로 처리
-        for idx, row in df.iterrows():
-            region = str(row['행정구역']).strip()
-            
-            # 숫자에서 쉼표 제거하고 평균 계산
-            def parse_and_avg(cols):
-                values = []
-                for col in cols:
-                    val = str(row[col]).replace(',', '').strip()
-                    try:
-                        v = float(val)
-                        if not pd.isna(v):
-                            values.append(v)
-                    except:
-                        pass
-                if values:
-                    avg = sum(values) / len(values)
-                    return int(avg) if not pd.isna(avg) else 0
-                return 0
-            
-            total_pop = parse_and_avg(pop_cols)
-            households = parse_and_avg(household_cols)
-            male = parse_and_avg(male_cols) if male_cols else None
-            female = parse_and_avg(female_cols) if female_cols else None
-            
-            if total_pop > 0:
-                population_by_year[year][region] = {
-                    'total_population': total_pop,
-                    'households': households,
-                    'male': male,
-                    'female': female
-                }
-        
-        region_count = len(population_by_year[year])
-        print(f"      ✅ {region_count}개 행정구역")
-        
+        df, year_cols = read_year_csv(os.path.join(folder, filename), year)
+        if df is None:
+            return folder, filename, year, None, year_cols
+
+        if SOURCES[folder] == 'population':
+            records = parse_population(df, year_cols)
+        else:
+            records = parse_population_change(df, year_cols)
+        return folder, filename, year, records, None
     except Exception as e:
-        print(f"      ❌ 에러: {e}")
-        import traceback
-        traceback.print_exc()
-
-# 2. 인구 증감 데이터 (humanre/)
-humanre_files = sorted([f for f in os.listdir('humanre') if f.endswith('.csv')])
-print(f"\n📁 인구증감 파일: {len(humanre_files)}개")
-
-for filename in humanre_files:
-    file_path = os.path.join('humanre', filename)
-    
-    # 연도 추출
-    year_match = re.search(r'(\d{4})\d{2}_', filename)
-    if not year_match:
-        continue
-    
-    year = int(year_match.group(1))
-    
-    if year < 2008:
-        continue
-    
-    print(f"   {year}년 처리 중...")
-    
-    try:
-        df = pd.read_csv(file_path, encoding='cp949')
-        df.columns = df.columns.str.strip()
-        
-        if '행정구역' not in df.columns:
-            print(f"      ⚠️  행정구역 열 없음")
-            continue
-        
-        # 해당 연도의 모든 월 데이터 추출
-        year_cols = [col for col in df.columns if col.startswith(f'{year}년')]
-        
-        if len(year_cols) == 0:
-            print(f"      ⚠️  {year}년 데이터 없음")
+        return folder, filename, year, None, f"에러: {e}"
+
+def scan_sources():
+    """원본 CSV 목록 → {'폴더/파일명': {'folder', 'filename', 'year', 'sha256'}}"""
+    files = {}
+    for folder in SOURCES:
+        if not os.path.isdir(folder):
             continue
-        
-        # 인구증감 관련 컬럼 찾기
-        birth_cols = [col for col in year_cols if '출생' in col]
-        death_cols = [col for col in year_cols if '사망' in col]
-        movein_cols = [col for col in year_cols if '전입' in col]
-        moveout_cols = [col for col in year_cols if '전출' in col]
-        change_cols = [col for col in year_cols if '증감' in col]
-        
-        if year not in population_change_by_year:
-            population_change_by_year[year] = {}
-        
-        # 각 행정구역별로 처리
-        for idx, row in df.iterrows():
-            region = str(row['행정구역']).strip()
-            
-            def parse_and_sum(cols):
-                values = []
-                for col in cols:
-                    val = str(row[col]).replace(',', '').strip()
-                    try:
-                        v = float(val)
-                        if not pd.isna(v):
-                            values.append(v)
-                    except:
-                        pass
-                if values:
-                    total = sum(values)
-                    return int(total) if not pd.isna(total) else 0
-                return 0
-            
-            births = parse_and_sum(birth_cols) if birth_cols else None
-            deaths = parse_and_sum(death_cols) if death_cols else None
-            move_in = parse_and_sum(movein_cols) if movein_cols else None
-            move_out = parse_and_sum(moveout_cols) if moveout_cols else None
-            net_change = parse_and_sum(change_cols) if change_cols else None
-            
-            population_change_by_year[year][region] = {
-                'births': births,
-                'deaths': deaths,
-                'move_in': move_in,
-                'move_out': move_out,
-                'net_change': net_change
+        for filename in sorted(f for f in os.listdir(folder) if f.endswith('.csv')):
+            # 연도 추출 (예: 201501_201512)
+            year_match = re.search(r'(\d{4})\d{2}_', filename)
+            if not year_match:
+                continue
+
+            year = int(year_match.group(1))
+            if year < 2008:
+                continue
+
+            files[f'{folder}/{filename}'] = {
+                'folder': folder,
+                'filename': filename,
+                'year': year,
+                'sha256': file_hash(os.path.join(folder, filename))
             }
-        
-        region_count = len(population_change_by_year[year])
-        print(f"      ✅ {region_count}개 행정구역")
-        
-    except Exception as e:
-        print(f"      ❌ 에러: {e}")
-        import traceback
-        traceback.print_exc()
-
-# 통합 데이터 생성
-integrated_data = {}
-all_years = sorted(set(list(population_by_year.keys()) + list(population_change_by_year.keys())))
-
-print(f"\n📊 데이터 통합 중...")
-for year in all_years:
-    integrated_data[str(year)] = {
-        'population': population_by_year.get(year, {}),
-        'population_change': population_change_by_year.get(year, {})
+    return files
+
+def load_previous():
+    """기존 결과 + 매니페스트 로드 (둘 중 하나라도 없으면 None)"""
+    if not os.path.exists(MANIFEST_FILE):
+        return None, None
+
+    with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None, None
+
+    if os.path.exists(OUTPUT_FILE):
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f), manifest['files']
+    if os.path.exists(OUTPUT_FILE + '.gz'):
+        with gzip.open(OUTPUT_FILE + '.gz', 'rt', encoding='utf-8') as f:
+            return json.load(f), manifest['files']
+    return None, None
+
+def main():
+    print("📊 주민등록 인구 데이터 변환 시작 (2008-2025년 9월)\n")
+
+    sources = scan_sources()
+    for folder in SOURCES:
+        count = sum(1 for info in sources.values() if info['folder'] == folder)
+        print(f"📁 {folder}/: {count}개 파일")
+
+    integrated_data, previous_files = (None, None) if FULL_REBUILD else load_previous()
+    if integrated_data is None:
+        integrated_data, previous_files = {}, {}
+        print("\n🔄 전체 재생성")
+
+    # (섹션, 연도) 단위로 다시 계산 - 같은 연도 파일이 여러 개면 그룹 전체를 다시 파싱
+    groups = {}
+    for key, info in sources.items():
+        groups.setdefault((info['folder'], info['year']), []).append(key)
+    previous_groups = {}
+    for key, info in previous_files.items():
+        previous_groups.setdefault((info['folder'], info['year']), {})[key] = info['sha256']
+
+    dirty = {
+        group for group, keys in groups.items()
+        if previous_groups.get(group) != {key: sources[key]['sha256'] for key in keys}
+    }
+    removed = set(previous_groups) - set(groups)
+
+    print(f"\n🔍 변경 감지: 재파싱 {len(dirty)}개 그룹, 삭제 {len(removed)}개 그룹")
+
+    for folder, year in removed:
+        integrated_data.get(str(year), {}).pop(SOURCES[folder], None)
+
+    jobs = [sources[key] for group in sorted(dirty) for key in groups[group]]
+    results = {}
+    failed = set()  # 파싱 실패 파일이 있는 그룹 - 이전 결과 유지, 매니페스트에서 빼서 다음 실행 때 재시도
+    if jobs:
+        with ProcessPoolExecutor() as pool:
+            futures = [pool.submit(parse_file, job['folder'], job['filename'], job['year']) for job in jobs]
+            for future in futures:
+                folder, filename, year, records, message = future.result()
+                if records is None:
+                    print(f"   ⚠️  {folder}/{filename}: {message}")
+                    failed.add((folder, year))
+                    continue
+                print(f"   ✅ {folder}/{filename} ({year}년): {len(records)}개 행정구역")
+                # 같은 연도 파일은 파일명 순서대로 덮어쓰기 (jobs 순서 = 파일명 순서)
+                results.setdefault((folder, year), {}).update(records)
+
+    for folder, year in dirty - failed:
+        year_data = integrated_data.setdefault(str(year), {})
+        year_data[SOURCES[folder]] = results.get((folder, year), {})
+
+    # 통합 데이터 정리 (연도 순, 섹션 누락 시 빈 dict)
+    integrated_data = {
+        year: {section: integrated_data[year].get(section, {}) for section in SOURCES.values()}
+        for year in sorted(integrated_data, key=int)
+        if any(group_year == int(year) for _, group_year in groups)
     }
-    
-    pop_count = len(population_by_year.get(year, {}))
-    change_count = len(population_change_by_year.get(year, {}))
-    print(f"   {year}년: 인구 {pop_count}개 구역, 증감 {change_count}개 구역")
-
-# 저장
-output_file = 'insightforge-web/data/population_yearly_data.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(integrated_data, f, ensure_ascii=False, indent=2)
-
-print(f"\n✅ 변환 완료!")
-print(f"   연도: {all_years}")
-print(f"   저장: {output_file}")
-print(f"\n📈 통계:")
-for year in all_years:
-    pop_regions = len(integrated_data[str(year)]['population'])
-    if pop_regions > 0:
-        sample_region = list(integrated_data[str(year)]['population'].keys())[0]
-        sample_data = integrated_data[str(year)]['population'][sample_region]
-        print(f"   {year}년: {pop_regions}개 구역")
-        print(f"      예시 ({sample_region}): 인구 {sample_data.get('total_population', 0):,}명")
+    all_years = [int(year) for year in integrated_data]
+
+    print(f"\n📊 데이터 통합 중...")
+    for year, year_data in integrated_data.items():
+        print(f"   {year}년: 인구 {len(year_data['population'])}개 구역, 증감 {len(year_data['population_change'])}개 구역")
+
+    # 저장
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(integrated_data, f, ensure_ascii=False, indent=2)
+
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        manifest_files = {
+            key: info for key, info in sources.items()
+            if (info['folder'], info['year']) not in failed
+        }
+        json.dump({'version': MANIFEST_VERSION, 'files': manifest_files}, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ 변환 완료!")
+    if failed:
+        print(f"   ⚠️  실패 그룹 {len(failed)}개는 다음 실행 때 다시 파싱")
+    print(f"   연도: {all_years}")
+    print(f"   저장: {OUTPUT_FILE}")
+    print(f"   매니페스트: {MANIFEST_FILE}")
+    print(f"\n📈 통계:")
+    for year, year_data in integrated_data.items():
+        pop_regions = len(year_data['population'])
+        if pop_regions > 0:
+            sample_region = list(year_data['population'].keys())[0]
+            sample_data = year_data['population'][sample_region]
+            print(f"   {year}년: {pop_regions}개 구역")
+            print(f"      예시 ({sample_region}): 인구 {sample_data.get('total_population', 0):,}명")
 
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,42 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from fastapi.responses import JSONResponse, Response
+from typing import Dict, List, Any, Optional, Set, Tuple
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from contextvars import ContextVar
+from array import array
+from bisect import bisect_left, bisect_right
+import asyncio
+import gzip
+import hashlib
+import heapq
+import html
 import json
+import math
 import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+try:
+    import redis
+except ImportError:  # redis 패키지가 없으면 프로세스 내 공유 캐시로 동작
+    redis = None
+
 app = FastAPI(
     title="InsightForge API",
     description="지역 통계 및 정치인 분석 API",
     version="1.0.0"
 )
 
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 도메인만 허용
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # 데이터 디렉토리 (로컬 테스트 시)
 if os.path.exists("/app/data"):
     DATA_DIR = Path("/app/data")
@@ -33,31 +45,841 @@ else:
 
 print(f"📁 데이터 디렉토리: {DATA_DIR}")
 
+# 데이터 파일 캐시 (메모리 예산 + 근사 크기 계산 + LRU/LFU 제거 + 고정 파일)
+# 예산은 소프트 한도: 고정 파일과 방금 로드한 파일은 예산을 넘어도 유지
+# 파일을 제거할 때 그 파일로 만든 파생 인덱스도 함께 제거 (인덱스가 디코딩된 레코드를 계속 참조하므로)
+DATA_CACHE_BUDGET = int(float(os.environ.get("DATA_CACHE_BUDGET_MB", "256")) * 1024 * 1024)
+DATA_CACHE_POLICY = os.environ.get("DATA_CACHE_POLICY", "lru").lower()  # lru | lfu
+DATA_CACHE_PINNED = set(filter(None, os.environ.get(
+    "DATA_CACHE_PINNED",
+    "sgis_national_regions.json,sgis_comprehensive_stats.json,code_mapping.json"
+).split(",")))
+SIZE_SAMPLE = 16  # 크기 계산 시 컨테이너당 표본 수
+
+data_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "derived_evictions": 0}
+
+def approximate_size(value: Any, depth: int = 0) -> int:
+    """디코딩된 JSON 객체의 근사 메모리 크기 (표본 추출 후 외삽)
+    
+    json 디코더가 재사용하는 중첩 dict 키와 작은 정수 캐시는 제외
+    """
+    if value is None or isinstance(value, bool) or (isinstance(value, int) and -5 <= value <= 256):
+        return 0
+    size = sys.getsizeof(value)
+    if isinstance(value, dict) and value:
+        n = len(value)
+        step = max(n // SIZE_SAMPLE, 1)
+        items = [item for i, item in enumerate(value.items()) if i % step == 0][:SIZE_SAMPLE]
+        sampled = sum((approximate_size(k) if depth == 0 else 0) + approximate_size(v, depth + 1) for k, v in items)
+        size += sampled * n // len(items)
+    elif isinstance(value, list) and value:
+        n = len(value)
+        items = value[::max(n // SIZE_SAMPLE, 1)][:SIZE_SAMPLE]
+        size += sum(approximate_size(v, depth + 1) for v in items) * n // len(items)
+    return size
+
+class BoundedDataCache(MutableMapping):
+    """파일명 → 디코딩된 데이터 (메모리 예산 초과 시 고정되지 않은 파일부터 제거)"""
+    
+    def __init__(self, entries: Optional["BoundedDataCache"] = None,
+                 derived: Optional[Dict[str, Any]] = None):
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._hits: Dict[str, int] = {}
+        self._derived = derived if derived is not None else {}  # 같은 스냅샷의 파생 인덱스
+        self._lock = threading.RLock()  # 요청 스레드(to_thread 로드)와 이벤트 루프가 함께 접근
+        if entries is not None:
+            with entries._lock:
+                self._data.update(entries._data)
+                self._sizes.update(entries._sizes)
+                self._hits.update(entries._hits)
+    
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self._sizes.values())
+    
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            self._hits[key] += 1
+            data_cache_stats["hits"] += 1
+            return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        size = approximate_size(value)
+        with self._lock:
+            if key not in self._data:
+                data_cache_stats["misses"] += 1
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._sizes[key] = size
+            self._hits.setdefault(key, 0)
+            self._evict(keep=key)
+    
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._data[key]
+            del self._sizes[key]
+            del self._hits[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+    
+    def __iter__(self):
+        return iter(list(self._data))
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def _evict(self, keep: str) -> None:
+        total = self.total_bytes
+        while total > DATA_CACHE_BUDGET:
+            candidates = [k for k in self._data if k != keep and k not in DATA_CACHE_PINNED]
+            if not candidates:
+                break
+            if DATA_CACHE_POLICY == "lfu":
+                # 적중 횟수가 가장 적은 파일 (같으면 오래 안 쓴 파일)
+                victim = min(candidates, key=lambda k: self._hits[k])
+            else:
+                victim = candidates[0]
+            total -= self._sizes[victim]
+            del self[victim]
+            data_cache_stats["evictions"] += 1
+            self._evict_derived(victim)
+    
+    def _evict_derived(self, filename: str) -> None:
+        """제거된 파일로 만든 파생 인덱스 제거 (다음 조회 때 파일과 함께 다시 생성)"""
+        for name, (dependencies, _) in list(self._derived.items()):
+            if filename in dependencies:
+                self._derived.pop(name, None)
+                data_cache_stats["derived_evictions"] += 1
+    
+    def usage(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {"file": key, "bytes": self._sizes[key], "hits": self._hits[key], "pinned": key in DATA_CACHE_PINNED}
+                for key in self._data
+            ]
+
+# 데이터 스냅샷 (파일 캐시 + 파일 버전 + 파생 인덱스)
+# 파일이 다시 생성되면 백그라운드에서 새 스냅샷을 만들어 current_snapshot을 한 번에 교체하고,
+# 요청은 시작 시점의 스냅샷을 끝까지 사용
+class DataSnapshot:
+    def __init__(self, files: Optional[BoundedDataCache] = None,
+                 versions: Optional[Dict[str, Tuple[int, int]]] = None,
+                 derived: Optional[Dict[str, Any]] = None):
+        self.versions = dict(versions or {})
+        self.derived = dict(derived or {})
+        self.files = BoundedDataCache(files, self.derived)
+    
+    def derived_usage(self) -> List[Dict[str, Any]]:
+        """파생 인덱스별 근사 크기 (파일 레코드를 공유하는 인덱스는 공유분까지 포함)"""
+        return [
+            {"name": name, "bytes": approximate_size(value)}
+            for name, (_, value) in list(self.derived.items())
+        ]
+
+current_snapshot = DataSnapshot()
+
+# 요청(또는 재로드 작업)에 고정된 스냅샷 - 없으면 현재 스냅샷
+request_snapshot: ContextVar[Optional[DataSnapshot]] = ContextVar("request_snapshot", default=None)
+
+def active_snapshot() -> DataSnapshot:
+    return request_snapshot.get() or current_snapshot
+
+class SnapshotView(MutableMapping):
+    """활성 스냅샷의 dict 하나를 가리키는 뷰"""
+    
+    def __init__(self, attr: str):
+        self._attr = attr
+    
+    def _target(self) -> Dict[str, Any]:
+        return getattr(active_snapshot(), self._attr)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._target()[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._target()[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        del self._target()[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._target()
+    
+    def __iter__(self):
+        return iter(self._target())
+    
+    def __len__(self) -> int:
+        return len(self._target())
+
 # 데이터 캐시
-data_cache: Dict[str, Any] = {}
-aggregated_cache: Dict[str, Any] = {}  # 집계된 데이터 캐시
+data_cache = SnapshotView("files")
+data_versions = SnapshotView("versions")  # 로드된 파일 버전 (파일명 -> (mtime_ns, size))
+
+# 현재 요청이 읽은 데이터 파일 (응답 캐시 무효화 기준)
+data_dependencies: ContextVar[Optional[Set[str]]] = ContextVar("data_dependencies", default=None)
+
+def file_version(path: Path) -> Tuple[int, int]:
+    """파일 버전 (수정 시각, 크기)"""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+def source_version(filename: str) -> Optional[List[int]]:
+    """디스크상의 원본 파일 버전 (load_json_file과 같은 우선순위: 일반 파일 → gzip)"""
+    for path in (DATA_DIR / filename, DATA_DIR / (filename + '.gz')):
+        if path.exists():
+            return list(file_version(path))
+    return None
+
+def track_data_dependency(filename: str) -> None:
+    dependencies = data_dependencies.get()
+    if dependencies is not None:
+        dependencies.add(filename)
 
 def load_json_file(filename: str) -> Any:
-    """JSON 파일 로드 및 캐싱"""
-    if filename in data_cache:
-        return data_cache[filename]
+    """JSON 파일 로드 및 캐싱 (gzip 지원)"""
+    track_data_dependency(filename)
+    cached = data_cache.get(filename)
+    if cached is not None:
+        return cached
     
+    file_path = DATA_DIR / filename
+    gz_path = DATA_DIR / (filename + '.gz')
+    if not file_path.exists() and not gz_path.exists():
+        raise HTTPException(status_code=404, detail=f"{filename} 파일을 찾을 수 없습니다")
+    
+    try:
+        if file_path.exists():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data_versions[filename] = file_version(file_path)
+        else:
+            with gzip.open(gz_path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+            data_versions[filename] = file_version(gz_path)
+        data_cache[filename] = data
+        return data
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 로드 실패: {str(e)}")
+
+# 월별 주민등록 인구 열 저장소 (convert_monthly_jumin.py 생성)
+# 형식: 매직 + 헤더 길이(4바이트) + 헤더 JSON + 열별 리틀엔디언 배열
+MONTHLY_STORE_FILE = "jumin_monthly_columnar.bin.gz"
+COLUMNAR_MAGIC = b"IFCOL1\n"
+MONTHLY_FIELDS = ("population", "male", "female", "household", "change")
+
+def read_columnar_file(filename: str) -> Tuple[Dict[str, Any], Dict[str, array]]:
+    """열 저장소 파일 → (헤더, 열 이름별 배열)"""
     file_path = DATA_DIR / filename
     if not file_path.exists():
         raise HTTPException(status_code=404, detail=f"{filename} 파일을 찾을 수 없습니다")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            data_cache[filename] = data
-            return data
+        with gzip.open(file_path, 'rb') as f:
+            if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+                raise ValueError("열 저장소 형식이 아닙니다")
+            header_len = int.from_bytes(f.read(4), 'little')
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            
+            columns: Dict[str, array] = {}
+            for column in header['columns']:
+                arr = array(column['typecode'])
+                arr.frombytes(f.read(column['length'] * arr.itemsize))
+                if sys.byteorder != 'little':
+                    arr.byteswap()
+                columns[column['name']] = arr
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 로드 실패: {str(e)}")
+    
+    data_versions[filename] = file_version(file_path)
+    return header, columns
+
+def load_monthly_store() -> Dict[str, Any]:
+    """월별 인구 열 저장소 로드 및 캐싱 (지역 코드 인덱스 + 필드별 배열)"""
+    track_data_dependency(MONTHLY_STORE_FILE)
+    cached = data_cache.get(MONTHLY_STORE_FILE)
+    if cached is not None:
+        return cached
+    
+    header, columns = read_columnar_file(MONTHLY_STORE_FILE)
+    store = {
+        "metadata": {k: v for k, v in header.items() if k not in ("months", "codes", "names", "columns")},
+        "months": header['months'],
+        "codes": {code: i for i, code in enumerate(header['codes'])},
+        "names": header['names'],
+        "offsets": columns.pop('offsets'),
+        "columns": columns
+    }
+    data_cache[MONTHLY_STORE_FILE] = store
+    return store
+
+def get_monthly_series(code: str, start: Optional[str] = None, end: Optional[str] = None,
+                       as_columns: bool = False) -> Optional[Any]:
+    """지역 코드의 월별 인구 시계열 (start/end: 'YYYY-MM', 배열 슬라이스로 범위 조회)"""
+    store = load_monthly_store()
+    row = store["codes"].get(code)
+    if row is None:
+        return None
+    
+    lo, hi = store["offsets"][row], store["offsets"][row + 1]
+    month_col = store["columns"]["month"]
+    if start:
+        lo = bisect_left(month_col, bisect_left(store["months"], start), lo, hi)
+    if end:
+        hi = bisect_left(month_col, bisect_right(store["months"], end), lo, hi)
+    
+    dates = [store["months"][i] for i in month_col[lo:hi]]
+    values = {field: store["columns"][field][lo:hi].tolist() for field in MONTHLY_FIELDS}
+    
+    if as_columns:
+        return {"dates": dates, **values}
+    
+    return [
+        {
+            "year": int(date[:4]),
+            "month": int(date[5:7]),
+            "date": date,
+            **{field: values[field][i] for field in MONTHLY_FIELDS}
+        }
+        for i, date in enumerate(dates)
+    ]
 
 # ============================================
 # 기본 엔드포인트
 # ============================================
 
+# 비동기 데이터 접근
+# 파일 읽기/디코딩은 스레드 풀에서 실행해 이벤트 루프를 막지 않고,
+# 같은 파일에 대한 동시 첫 요청은 진행 중인 로드 1개를 함께 기다림 (single-flight)
+inflight_loads: Dict[str, "asyncio.Future[Any]"] = {}
+
+async def single_flight(key: str, func, *args) -> Any:
+    """key별로 진행 중인 작업을 공유하며 func(*args)를 스레드 풀에서 실행"""
+    future = inflight_loads.get(key)
+    if future is None:
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        inflight_loads[key] = future
+        future.add_done_callback(lambda _: inflight_loads.pop(key, None))
+    # 기다리던 요청이 취소되어도 공유 로드는 계속 진행
+    return await asyncio.shield(future)
+
+async def load_json_file_async(filename: str) -> Any:
+    """load_json_file의 비동기 버전 (캐시 적중 시 즉시 반환)"""
+    track_data_dependency(filename)
+    cached = data_cache.get(filename)
+    if cached is not None:
+        return cached
+    return await single_flight(f"file:{filename}", load_json_file, filename)
+
+async def load_monthly_store_async() -> Dict[str, Any]:
+    """load_monthly_store의 비동기 버전"""
+    track_data_dependency(MONTHLY_STORE_FILE)
+    cached = data_cache.get(MONTHLY_STORE_FILE)
+    if cached is not None:
+        return cached
+    return await single_flight(f"file:{MONTHLY_STORE_FILE}", load_monthly_store)
+
+# 구별 토픽/키워드 행렬 (build_district_topics.py 생성, 같은 열 저장소 형식)
+# 구 × 단어 빈도 CSR(행마다 빈도순), 구 × 토픽 비중, 토픽 × 상위 단어 CSR
+TOPIC_STORE_FILE = "district_topics.bin.gz"
+
+def load_topic_store() -> Dict[str, Any]:
+    """구별 토픽 행렬 로드 및 캐싱 (구 이름 인덱스 + CSR 배열)"""
+    track_data_dependency(TOPIC_STORE_FILE)
+    cached = data_cache.get(TOPIC_STORE_FILE)
+    if cached is not None:
+        return cached
+
+    header, columns = read_columnar_file(TOPIC_STORE_FILE)
+    store = {
+        "analysis_date": header.get('analysis_date'),
+        "sources": header.get('sources', []),
+        "districts": {gu: i for i, gu in enumerate(header['districts'])},
+        "article_counts": header['article_counts'],
+        "topic_count": header['topic_count'],
+        "vocab": header['vocab'],
+        "columns": columns
+    }
+    data_cache[TOPIC_STORE_FILE] = store
+    return store
+
+async def load_topic_store_async() -> Dict[str, Any]:
+    """load_topic_store의 비동기 버전"""
+    track_data_dependency(TOPIC_STORE_FILE)
+    cached = data_cache.get(TOPIC_STORE_FILE)
+    if cached is not None:
+        return cached
+    return await single_flight(f"file:{TOPIC_STORE_FILE}", load_topic_store)
+
+# 키워드 트렌드 저장소 (build_keyword_trends.py 생성, 같은 열 저장소 형식)
+# 대상(의원/구)별 단어 행마다 일별 누적 빈도 (prefix[d] = 0..d-1일 합)
+TREND_STORE_FILE = "keyword_trends.bin.gz"
+
+def load_trend_store() -> Dict[str, Any]:
+    """키워드 트렌드 저장소 로드 및 캐싱 ((종류, 이름) 인덱스 + 누적 빈도 배열)"""
+    track_data_dependency(TREND_STORE_FILE)
+    cached = data_cache.get(TREND_STORE_FILE)
+    if cached is not None:
+        return cached
+
+    header, columns = read_columnar_file(TREND_STORE_FILE)
+    store = {
+        "start_date": datetime.strptime(header['start_date'], "%Y-%m-%d").date(),
+        "day_count": header['day_count'],
+        "entities": {(e['kind'], e['name']): i for i, e in enumerate(header['entities'])},
+        "vocab": header['vocab'],
+        "columns": columns
+    }
+    data_cache[TREND_STORE_FILE] = store
+    return store
+
+async def load_trend_store_async() -> Dict[str, Any]:
+    """load_trend_store의 비동기 버전"""
+    track_data_dependency(TREND_STORE_FILE)
+    cached = data_cache.get(TREND_STORE_FILE)
+    if cached is not None:
+        return cached
+    return await single_flight(f"file:{TREND_STORE_FILE}", load_trend_store)
+
+# 공유 캐시 (docker-compose의 redis 서비스, REDIS_URL)
+# 워커별 로컬 LRU → Redis 순으로 조회해 집계 결과와 인코딩된 응답을 워커 간에 공유
+# REDIS_URL이 없거나 연결할 수 없으면 프로세스 내 저장소(테스트/로컬 실행용)로 대체
+REDIS_URL = os.environ.get("REDIS_URL")
+SHARED_CACHE_PREFIX = "insightforge:"
+
+class InProcessSharedCache:
+    """Redis 대체용 프로세스 내 저장소 (값은 bytes)"""
+    name = "memory"
+    
+    def __init__(self):
+        self._store: Dict[str, bytes] = {}
+    
+    def get(self, key: str) -> Optional[bytes]:
+        return self._store.get(key)
+    
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self._store[key] = value
+    
+    def add(self, key: str, value: bytes, ex: Optional[int] = None) -> bool:
+        """키가 없을 때만 저장 (워커 간 잠금용)"""
+        if key in self._store:
+            return False
+        self._store[key] = value
+        return True
+    
+    def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+class RedisSharedCache:
+    """Redis 저장소 (값은 bytes)"""
+    name = "redis"
+    
+    def __init__(self, url: str):
+        self._client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+        self._client.ping()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+    
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self._client.set(key, value, ex=ex)
+    
+    def add(self, key: str, value: bytes, ex: Optional[int] = None) -> bool:
+        return bool(self._client.set(key, value, ex=ex, nx=True))
+    
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+def create_shared_cache():
+    """REDIS_URL이 있으면 Redis, 아니면 프로세스 내 저장소"""
+    if REDIS_URL and redis is not None:
+        try:
+            return RedisSharedCache(REDIS_URL)
+        except Exception as e:
+            print(f"⚠️  Redis 연결 실패 ({e}) - 프로세스 내 캐시 사용")
+    elif REDIS_URL:
+        print("⚠️  redis 패키지 없음 - 프로세스 내 캐시 사용")
+    return InProcessSharedCache()
+
+class TieredCache:
+    """워커 로컬 LRU(디코딩된 값) + 공유 저장소(인코딩된 bytes)
+    
+    공유 저장소 오류는 캐시 미스로 처리 (Redis 장애 시에도 API는 계속 동작)
+    """
+    
+    def __init__(self, shared, namespace: str, encode, decode,
+                 max_entries: int, ttl: Optional[int] = None):
+        self.shared = shared
+        self.namespace = SHARED_CACHE_PREFIX + namespace + ":"
+        self.encode = encode
+        self.decode = decode
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local: "OrderedDict[str, Any]" = OrderedDict()
+    
+    def get(self, key: str) -> Any:
+        if key in self._local:
+            self._local.move_to_end(key)
+            return self._local[key]
+        try:
+            raw = self.shared.get(self.namespace + key)
+        except Exception as e:
+            print(f"⚠️  공유 캐시 조회 실패: {e}")
+            return None
+        if raw is None:
+            return None
+        value = self.decode(raw)
+        self._remember(key, value)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        self._remember(key, value)
+        try:
+            self.shared.set(self.namespace + key, self.encode(value), ex=self.ttl)
+        except Exception as e:
+            print(f"⚠️  공유 캐시 저장 실패: {e}")
+    
+    def _remember(self, key: str, value: Any) -> None:
+        self._local[key] = value
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+def encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def decode_json(raw: bytes) -> Any:
+    return json.loads(raw)
+
+shared_backend = create_shared_cache()
+print(f"🗄️  공유 캐시: {shared_backend.name}")
+
+# 집계 데이터 캐시 (원본 파일 버전별 키 → 워커 간 공유, 한 워커만 집계)
+AGGREGATE_FILES = (
+    "sgis_national_regions.json",
+    "sgis_comprehensive_stats.json",
+    "sgis_commercial_stats.json",
+    "sgis_tech_stats.json"
+)
+AGGREGATE_KEYS = ("sido", "sigungu", "commercial", "tech")
+AGGREGATE_LOCK_TIMEOUT = 120  # 초
+
+class SharedAggregates:
+    """집계 결과 (dict처럼 사용, 원본 파일 버전이 키에 포함됨)"""
+    
+    def __init__(self):
+        self.store = TieredCache(shared_backend, "aggregated", encode_json, decode_json,
+                                 max_entries=len(AGGREGATE_KEYS))
+    
+    def version_key(self) -> str:
+        versions = [source_version(filename) for filename in AGGREGATE_FILES]
+        return hashlib.sha1(encode_json(versions)).hexdigest()[:16]
+    
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+    
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+    
+    def __setitem__(self, name: str, value: Any) -> None:
+        self.store.set(f"{self.version_key()}:{name}", value)
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        for filename in AGGREGATE_FILES:
+            track_data_dependency(filename)
+        value = self.store.get(f"{self.version_key()}:{name}")
+        return default if value is None else value
+
+aggregated_cache = SharedAggregates()  # 집계된 데이터 캐시
+
+# 워커 로컬 파생 인덱스 (직렬화하지 않는 구조라 공유 캐시에 넣지 않음)
+# 이름 -> (생성 중 읽은 파일, 값) - 읽은 파일이 재로드되면 다시 생성
+index_cache = SnapshotView("derived")
+derived_builders: Dict[str, Any] = {}
+
+def get_derived(name: str, builder) -> Any:
+    """워커 로컬 파생 데이터 조회 (최초 호출 시 생성하며 읽은 파일을 기록)"""
+    cached = index_cache.get(name)
+    if cached is None:
+        dependencies: Set[str] = set()
+        token = data_dependencies.set(dependencies)
+        try:
+            value = builder()
+        finally:
+            data_dependencies.reset(token)
+        cached = (tuple(sorted(dependencies)), value)
+        index_cache[name] = cached
+        derived_builders[name] = builder
+    
+    for filename in cached[0]:
+        track_data_dependency(filename)
+    return cached[1]
+
+# 다년도 통계 양방향 인덱스
+# 파일은 연도 우선(regions_by_year[연도][코드])이지만 대부분의 요청은 지역 우선이므로
+# 로드 시 지역 → 연도 방향으로 한 번 전치해 두 방향 모두 키 조회로 처리 (레코드는 공유)
+MULTIYEAR_FILES = ("sgis_multiyear_stats.json", "sgis_enhanced_multiyear_stats.json")
+
+def build_multiyear_index(filename: str) -> Dict[str, Any]:
+    """regions_by_year → {"by_year": 연도 → 코드 → 레코드, "by_region": 코드 → 연도 → 레코드, "years"}"""
+    by_year = load_json_file(filename).get('regions_by_year', {})
+    years = sorted(by_year)
+    by_region: Dict[str, Dict[str, Any]] = {}
+    for year in years:
+        for code, record in by_year[year].items():
+            by_region.setdefault(code, {})[year] = record
+    return {"by_year": by_year, "by_region": by_region, "years": years}
+
+def get_multiyear_index(filename: str) -> Dict[str, Any]:
+    return get_derived(f"multiyear:{filename}", lambda: build_multiyear_index(filename))
+
+async def get_derived_async(name: str, builder) -> Any:
+    """get_derived의 비동기 버전 - 최초 생성은 스레드 풀에서 1회만"""
+    if name not in index_cache:
+        await single_flight(f"index:{name}", get_derived, name, builder)
+    # 생성을 기다린 요청도 자기 컨텍스트에 의존 파일을 기록하도록 get_derived로 반환
+    return get_derived(name, builder)
+
+async def get_multiyear_index_async(filename: str) -> Dict[str, Any]:
+    return await get_derived_async(f"multiyear:{filename}", lambda: build_multiyear_index(filename))
+
+# 지역 계층 보조 인덱스 (sgis_comprehensive_stats.json 기준, 상위 코드 → 하위 코드)
+# 시군구의 읍면동 목록 행도 함께 만들어 두고 지표별 정렬 순서를 미리 계산
+EMDONG_SORT_KEYS = ("population", "household_cnt", "avg_family_size", "house_cnt", "company_cnt", "worker_cnt")
+
+def build_emdong_row(emdong_cd: str, emdong_stats: Dict[str, Any], enhanced_2023: Dict[str, Any]) -> Dict[str, Any]:
+    """읍면동 목록 행 (연령별 데이터의 정확한 인구 우선)"""
+    enhanced = enhanced_2023.get(emdong_cd, {})
+    accurate_pop = enhanced.get('basic', {}).get('total_population', 0)
+    
+    # 정확한 인구가 있으면 사용
+    if accurate_pop > 0:
+        population = accurate_pop
+        avg_size = emdong_stats.get('household', {}).get('avg_family_member_cnt', 2.0)
+        household_cnt = round(population / avg_size)
+    else:
+        population = emdong_stats.get('household', {}).get('family_member_cnt', 0)
+        household_cnt = emdong_stats.get('household', {}).get('household_cnt', 0)
+    
+    return {
+        "code": emdong_cd,
+        "name": emdong_stats.get('emdong_name', ''),
+        "full_address": emdong_stats.get('full_address', ''),
+        "household_cnt": household_cnt,
+        "population": population,
+        "avg_family_size": emdong_stats.get('household', {}).get('avg_family_member_cnt', 0),
+        "house_cnt": emdong_stats.get('house', {}).get('house_cnt', 0),
+        "company_cnt": emdong_stats.get('company', {}).get('corp_cnt', 0),
+        "worker_cnt": emdong_stats.get('company', {}).get('tot_worker', 0),
+        "x_coord": emdong_stats.get('x_coord', ''),
+        "y_coord": emdong_stats.get('y_coord', '')
+    }
+
+def build_region_hierarchy() -> Dict[str, Any]:
+    """시도 → 시군구, 시군구 → 읍면동 코드 (통계 파일 순서 유지) + 시군구별 읍면동 행/정렬 순서"""
+    stats_regions = load_json_file("sgis_comprehensive_stats.json").get('regions', {})
+    
+    # 연령별 상세 데이터 (정확한 인구)
+    try:
+        enhanced_2023 = get_multiyear_index("sgis_enhanced_multiyear_stats.json")["by_year"].get('2023', {})
+    except:
+        enhanced_2023 = {}
+    
+    sido_children: Dict[str, List[str]] = {}
+    sigungu_children: Dict[str, List[str]] = {}
+    sigungu_names: Dict[str, str] = {}
+    emdong_rows: Dict[str, List[Dict[str, Any]]] = {}
+    for emdong_cd, emdong_stats in stats_regions.items():
+        sigungu_cd = emdong_stats.get('sigungu_code')
+        if not sigungu_cd:
+            continue
+        if sigungu_cd not in sigungu_children:
+            sigungu_children[sigungu_cd] = []
+            emdong_rows[sigungu_cd] = []
+            sigungu_names[sigungu_cd] = emdong_stats.get('sigungu_name', '')
+            sido_children.setdefault(emdong_stats.get('sido_code', ''), []).append(sigungu_cd)
+        elif not sigungu_names[sigungu_cd]:
+            sigungu_names[sigungu_cd] = emdong_stats.get('sigungu_name', '')
+        sigungu_children[sigungu_cd].append(emdong_cd)
+        emdong_rows[sigungu_cd].append(build_emdong_row(emdong_cd, emdong_stats, enhanced_2023))
+    
+    # 지표별 내림차순 정렬 (같은 값은 원래 순서 유지)
+    sorted_rows = {
+        key: {
+            sigungu_cd: sorted(rows, key=lambda row: row[key] or 0, reverse=True)
+            for sigungu_cd, rows in emdong_rows.items()
+        }
+        for key in EMDONG_SORT_KEYS
+    }
+    
+    return {
+        "sido": sido_children,
+        "sigungu": sigungu_children,
+        "sigungu_names": sigungu_names,
+        "emdong_rows": emdong_rows,
+        "sorted_rows": sorted_rows
+    }
+
+async def get_region_hierarchy_async() -> Dict[str, Any]:
+    return await get_derived_async("region_hierarchy", build_region_hierarchy)
+
+def build_region_key_lookup(filename: str) -> Dict[str, str]:
+    """regions 키의 모든 부분 문자열 → 그 문자열을 포함하는 첫 번째 키 (순차 탐색과 같은 결과)"""
+    lookup: Dict[str, str] = {}
+    for key in load_json_file(filename).get('regions', {}):
+        for start in range(len(key)):
+            for end in range(start + 1, len(key) + 1):
+                lookup.setdefault(key[start:end], key)
+    return lookup
+
+# 응답 캐시 (경로 + 파라미터 → 인코딩된 본문, gzip 본문, ETag, 의존 파일 버전)
+# 요청 처리 중 load_json_file로 읽은 파일을 의존 파일로 기록하고,
+# 의존 파일 버전이 그대로면 엔드포인트를 다시 실행하지 않고 저장된 본문을 그대로 응답
+RESPONSE_CACHE_MAX_ENTRIES = 512
+RESPONSE_CACHE_TTL = 24 * 60 * 60  # 공유 저장소 보관 기간 (초)
+RESPONSE_GZIP_MIN_BYTES = 1024
+
+def encode_response_entry(entry: Dict[str, Any]) -> bytes:
+    """응답 캐시 항목 → 헤더 길이(4바이트) + 헤더 JSON + 본문 + gzip 본문"""
+    header = {k: v for k, v in entry.items() if k not in ("body", "gzip")}
+    header["body_length"] = len(entry["body"])
+    header_bytes = encode_json(header)
+    return (len(header_bytes).to_bytes(4, 'little') + header_bytes
+            + entry["body"] + (entry["gzip"] or b""))
+
+def decode_response_entry(raw: bytes) -> Dict[str, Any]:
+    header_end = 4 + int.from_bytes(raw[:4], 'little')
+    entry = json.loads(raw[4:header_end])
+    body_end = header_end + entry.pop("body_length")
+    entry["body"] = raw[header_end:body_end]
+    entry["gzip"] = raw[body_end:] or None
+    return entry
+
+response_cache = TieredCache(shared_backend, "response", encode_response_entry, decode_response_entry,
+                             max_entries=RESPONSE_CACHE_MAX_ENTRIES, ttl=RESPONSE_CACHE_TTL)
+
+def dependency_version(filenames: List[str], snapshot: DataSnapshot) -> List[Optional[List[int]]]:
+    """스냅샷 기준 파일 버전 (본문을 만든 데이터와 일치)
+    
+    아직 이 스냅샷에 로드되지 않은 파일은 다음 요청이 읽게 될 디스크 버전
+    """
+    return [
+        list(snapshot.versions[filename]) if filename in snapshot.versions else source_version(filename)
+        for filename in filenames
+    ]
+
+def is_fresh_entry(entry: Optional[Dict[str, Any]]) -> bool:
+    """캐시 항목이 현재 스냅샷 기준으로 유효한지 (스냅샷 교체 전에는 디스크가 바뀌어도 유효)"""
+    return bool(entry) and entry["version"] == dependency_version(entry["dependencies"], current_snapshot)
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding의 q값 기준 gzip 허용 여부 (gzip 항목 우선, 없으면 *)"""
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+def build_cached_response(entry: Dict[str, Any], request: Request) -> Response:
+    """캐시 항목 → 응답 (If-None-Match 일치 시 304, gzip 수락 시 압축 본문)"""
+    headers = {"ETag": entry["etag"], "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or entry["etag"] in [
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ]:
+        return Response(status_code=304, headers=headers)
+    
+    if entry["gzip"] is not None and accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(entry["gzip"], media_type=entry["media_type"], headers=headers)
+    return Response(entry["body"], media_type=entry["media_type"], headers=headers)
+
+inflight_responses: Dict[str, asyncio.Event] = {}
+
+def finish_response_entry(key: str, entry: Dict[str, Any]) -> None:
+    """응답 캐시 항목 완성 (gzip 본문, ETag) 후 저장"""
+    body = entry["body"]
+    entry["gzip"] = gzip.compress(body, compresslevel=6) if len(body) >= RESPONSE_GZIP_MIN_BYTES else None
+    entry["etag"] = f'"{hashlib.sha1(body).hexdigest()}"'
+    response_cache.set(key, entry)
+
+@app.middleware("http")
+async def response_cache_middleware(request: Request, call_next):
+    """읽기 전용 API 응답 캐시 - 의존 파일 버전이 같으면 엔드포인트 실행 없이 응답"""
+    if request.method != "GET" or not request.url.path.startswith("/api/"):
+        return await call_next(request)
+    
+    key = request.url.path + "?" + "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    entry = response_cache.get(key)
+    if is_fresh_entry(entry):
+        return build_cached_response(entry, request)
+    
+    # 같은 응답을 만드는 중인 요청이 있으면 끝날 때까지 기다렸다가 캐시에서 응답
+    pending = inflight_responses.get(key)
+    if pending is not None:
+        await pending.wait()
+        entry = response_cache.get(key)
+        if is_fresh_entry(entry):
+            return build_cached_response(entry, request)
+        return await call_next(request)
+    
+    inflight_responses[key] = asyncio.Event()
+    try:
+        dependencies: Set[str] = set()
+        token = data_dependencies.set(dependencies)
+        snapshot = current_snapshot
+        snapshot_token = request_snapshot.set(snapshot)
+        try:
+            response = await call_next(request)
+        finally:
+            request_snapshot.reset(snapshot_token)
+            data_dependencies.reset(token)
+        
+        if response.status_code != 200 or "content-encoding" in response.headers:
+            return response
+        
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        ordered = sorted(dependencies)
+        entry = {
+            "dependencies": ordered,
+            "version": dependency_version(ordered, snapshot),
+            "body": body,
+            "media_type": response.headers.get("content-type", "application/json")
+        }
+        # 압축/해시/공유 캐시 저장은 큰 본문일수록 오래 걸리므로 스레드 풀에서 처리
+        await asyncio.to_thread(finish_response_entry, key, entry)
+    finally:
+        inflight_responses.pop(key).set()
+    
+    return build_cached_response(entry, request)
+
+# CORS 설정 (응답 캐시 미들웨어보다 나중에 등록 → 바깥에서 캐시 응답에도 CORS 헤더 추가)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # 프로덕션에서는 특정 도메인만 허용
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 @app.get("/")
 async def root():
     """API 루트"""
@@ -67,6 +889,7 @@ async def root():
         "endpoints": {
             "regions": "/api/regions",
             "lda": "/api/lda/*",
+            "trends": "/api/trends",
             "politicians": "/api/politicians/*",
             "network": "/api/network/*",
             "search": "/api/search"
@@ -76,14 +899,75 @@ async def root():
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    return {"status": "healthy"}
+    return {"status": "healthy", "cache": shared_backend.name}
+
+@app.get("/metrics")
+async def metrics():
+    """데이터 캐시 지표 (Prometheus 텍스트 형식)"""
+    snapshot = active_snapshot()
+    files = snapshot.files
+    derived = snapshot.derived_usage()
+    lines = [
+        "# TYPE insightforge_data_cache_hits_total counter",
+        f"insightforge_data_cache_hits_total {data_cache_stats['hits']}",
+        "# TYPE insightforge_data_cache_misses_total counter",
+        f"insightforge_data_cache_misses_total {data_cache_stats['misses']}",
+        "# TYPE insightforge_data_cache_evictions_total counter",
+        f"insightforge_data_cache_evictions_total {data_cache_stats['evictions']}",
+        "# TYPE insightforge_data_cache_bytes gauge",
+        f"insightforge_data_cache_bytes {files.total_bytes}",
+        "# TYPE insightforge_data_cache_budget_bytes gauge",
+        f"insightforge_data_cache_budget_bytes {DATA_CACHE_BUDGET}",
+        "# TYPE insightforge_data_cache_entries gauge",
+        f"insightforge_data_cache_entries {len(files)}",
+        "# TYPE insightforge_derived_index_evictions_total counter",
+        f"insightforge_derived_index_evictions_total {data_cache_stats['derived_evictions']}",
+        "# TYPE insightforge_derived_index_bytes gauge",
+        f"insightforge_derived_index_bytes {sum(entry['bytes'] for entry in derived)}",
+        "# TYPE insightforge_data_cache_file_bytes gauge"
+    ]
+    for entry in files.usage():
+        lines.append(f'insightforge_data_cache_file_bytes{{file="{entry["file"]}",pinned="{str(entry["pinned"]).lower()}"}} {entry["bytes"]}')
+    lines.append("# TYPE insightforge_derived_index_entry_bytes gauge")
+    for entry in derived:
+        lines.append(f'insightforge_derived_index_entry_bytes{{name="{entry["name"]}"}} {entry["bytes"]}')
+    return Response("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 (워밍업 완료 전 503) - 항목별 소요 시간 포함"""
+    ready = warmup_state["status"] in ("ready", "skipped")
+    return JSONResponse({"ready": ready, **warmup_state}, status_code=200 if ready else 503)
 
 # ============================================
 # 지역 데이터 API
 # ============================================
 
+def wait_for_shared_aggregates() -> bool:
+    """다른 워커가 집계 중이면 공유 캐시에 결과가 올라올 때까지 대기"""
+    deadline = time.monotonic() + AGGREGATE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        if all(key in aggregated_cache for key in AGGREGATE_KEYS):
+            return True
+        time.sleep(0.2)
+    return False
+
 def aggregate_data_on_startup():
-    """앱 시작 시 데이터 미리 집계"""
+    """앱 시작 시 데이터 미리 집계 (공유 캐시에 이미 있으면 원본을 로드하지 않음)"""
+    if all(key in aggregated_cache for key in AGGREGATE_KEYS):
+        print("✅ 공유 캐시의 집계 데이터 사용")
+        return
+    
+    lock_key = f"{SHARED_CACHE_PREFIX}lock:aggregated:{aggregated_cache.version_key()}"
+    try:
+        locked = shared_backend.add(lock_key, b"1", ex=AGGREGATE_LOCK_TIMEOUT)
+    except Exception as e:
+        print(f"⚠️  공유 캐시 잠금 실패: {e}")
+        locked = True
+    if not locked and wait_for_shared_aggregates():
+        print("✅ 다른 워커의 집계 데이터 사용")
+        return
+    
     try:
         print("📊 데이터 집계 시작...")
         
@@ -151,23 +1035,176 @@ def aggregate_data_on_startup():
         
     except Exception as e:
         print(f"❌ 데이터 집계 실패: {e}")
+    finally:
+        if locked:
+            try:
+                shared_backend.delete(lock_key)
+            except Exception:
+                pass
+
+# 워밍업 매니페스트 (트래픽 받기 전에 미리 로드할 파일 / 생성할 집계·인덱스)
+# 파일은 스레드 풀에서 병렬 로드, 집계·인덱스는 순서대로 생성
+# WARMUP_MANIFEST 환경변수로 같은 형식의 JSON 파일을 지정하면 배포별로 교체 가능
+# 집계 원본 4개 파일은 집계 항목이 필요할 때만 로드 (공유 캐시에 있으면 생략)
+WARMUP_MANIFEST: Dict[str, List[str]] = {
+    "files": [
+        "code_mapping.json",
+        "sgis_enhanced_multiyear_stats.json",
+        "sgis_multiyear_stats.json",
+        "assembly_by_region.json",
+        "assembly_network_graph.json",
+        "assembly_member_lda_analysis.json",
+        "issue_articles_tracking.json"
+    ],
+    "indexes": ["aggregates", "monthly_store", "topic_store", "trend_store", "search_index", "multiyear_index", "region_hierarchy", "politician_directory", "network_graph"]
+}
+WARMUP_BUILDERS = {
+    "aggregates": lambda: single_flight("aggregate", aggregate_data_on_startup),
+    "monthly_store": lambda: load_monthly_store_async(),
+    "topic_store": lambda: load_topic_store_async(),
+    "trend_store": lambda: load_trend_store_async(),
+    "search_index": lambda: get_search_index_async(),  # 아래에 정의됨
+    "multiyear_index": lambda: asyncio.gather(*(get_multiyear_index_async(f) for f in MULTIYEAR_FILES)),
+    "region_hierarchy": lambda: get_region_hierarchy_async(),
+    "politician_directory": lambda: get_derived_async("politician_directory", build_politician_directory),  # 아래에 정의됨
+    "network_graph": lambda: get_network_graph_async()
+}
+warmup_state: Dict[str, Any] = {"status": "pending", "items": [], "elapsed_ms": None}
+
+def load_warmup_manifest() -> Dict[str, List[str]]:
+    """워밍업 매니페스트 (WARMUP_MANIFEST 환경변수의 JSON 파일 우선)"""
+    manifest_path = os.environ.get("WARMUP_MANIFEST")
+    if manifest_path:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️  워밍업 매니페스트 로드 실패 ({manifest_path}): {e}")
+    return WARMUP_MANIFEST
+
+async def timed_warmup(kind: str, name: str, loader) -> Dict[str, Any]:
+    """워밍업 항목 1개 실행 + 소요 시간 기록"""
+    started = time.perf_counter()
+    error = None
+    try:
+        await loader()
+    except HTTPException as e:
+        error = str(e.detail)
+    except Exception as e:
+        error = str(e)
+    
+    item = {"kind": kind, "name": name, "ok": error is None,
+            "ms": round((time.perf_counter() - started) * 1000, 1)}
+    if error:
+        item["error"] = error
+    warmup_state["items"].append(item)
+    print(f"   {'✅' if error is None else '⚠️ '} {kind} {name}: {item['ms']}ms" + (f" ({error})" if error else ""))
+    return item
+
+async def run_warmup() -> None:
+    """매니페스트의 파일/집계/인덱스를 미리 로드 (완료 후 /ready가 200)"""
+    manifest = load_warmup_manifest()
+    files = manifest.get("files", [])
+    indexes = [name for name in manifest.get("indexes", []) if name in WARMUP_BUILDERS]
+    
+    warmup_state.update(status="running", items=[])
+    started = time.perf_counter()
+    print(f"🔥 워밍업 시작: 파일 {len(files)}개, 인덱스 {len(indexes)}개")
+    
+    await asyncio.gather(*(
+        timed_warmup("file", filename, lambda filename=filename: load_json_file_async(filename))
+        for filename in files
+    ))
+    for name in indexes:
+        await timed_warmup("index", name, WARMUP_BUILDERS[name])
+    
+    warmup_state.update(status="ready", elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+    print(f"🔥 워밍업 완료: {warmup_state['elapsed_ms']}ms")
+
+# 데이터 파일 재로드 (convert_*.py가 파일을 다시 만들면 재시작 없이 반영)
+DATA_RELOAD_INTERVAL = float(os.environ.get("DATA_RELOAD_INTERVAL", "10"))  # 초, 0이면 감시 안 함
+FILE_LOADERS = {  # 파일명 -> 전용 로더 (없으면 load_json_file)
+    MONTHLY_STORE_FILE: load_monthly_store,
+    TOPIC_STORE_FILE: load_topic_store,
+    TREND_STORE_FILE: load_trend_store
+}
+
+def find_changed_files(snapshot: DataSnapshot) -> List[str]:
+    """스냅샷에 로드된 파일 중 디스크에서 바뀐 파일 (삭제된 파일은 기존 데이터 유지)"""
+    changed = []
+    for filename, version in list(snapshot.versions.items()):
+        current = source_version(filename)
+        if current is not None and current != list(version):
+            changed.append(filename)
+    return changed
+
+def build_reloaded_snapshot(old: DataSnapshot, changed: List[str]) -> DataSnapshot:
+    """바뀐 파일과 의존 파생 인덱스를 다시 만든 새 스냅샷 (스레드 풀에서 실행)"""
+    changed_set = set(changed)
+    stale = [name for name, (dependencies, _) in old.derived.items() if changed_set & set(dependencies)]
+    new = DataSnapshot(
+        old.files,
+        {k: v for k, v in old.versions.items() if k not in changed_set},
+        {k: v for k, v in old.derived.items() if k not in stale}
+    )
+    # 캐시에서 이미 제거된 파일은 버전만 지우고 다음 요청 때 로드
+    reload_files = [filename for filename in changed if filename in new.files]
+    for filename in reload_files:
+        del new.files[filename]
+    
+    request_snapshot.set(new)  # 이 스레드의 컨텍스트에서만 새 스냅샷 사용
+    for filename in reload_files:
+        loader = FILE_LOADERS.get(filename)
+        if loader:
+            loader()
+        else:
+            load_json_file(filename)
+    for name in stale:
+        get_derived(name, derived_builders[name])
+    return new
+
+async def watch_data_files() -> None:
+    """DATA_RELOAD_INTERVAL마다 파일 버전 확인 → 새 스냅샷으로 교체, 집계 원본이 바뀌면 재집계"""
+    global current_snapshot
+    aggregate_key = aggregated_cache.version_key()
+    while True:
+        await asyncio.sleep(DATA_RELOAD_INTERVAL)
+        try:
+            changed = find_changed_files(current_snapshot)
+            if changed:
+                started = time.perf_counter()
+                current_snapshot = await asyncio.to_thread(build_reloaded_snapshot, current_snapshot, changed)
+                print(f"🔄 데이터 재로드 ({(time.perf_counter() - started) * 1000:.0f}ms): {', '.join(changed)}")
+            
+            if aggregated_cache.version_key() != aggregate_key:
+                aggregate_key = aggregated_cache.version_key()
+                await single_flight("aggregate", aggregate_data_on_startup)
+        except Exception as e:
+            print(f"❌ 데이터 재로드 실패: {e}")
+
+background_tasks: List["asyncio.Task[None]"] = []
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 실행"""
-    aggregate_data_on_startup()
+    """앱 시작 시 실행 - 워밍업/파일 감시는 백그라운드로 (준비 여부는 /ready)"""
+    if DATA_RELOAD_INTERVAL > 0:
+        background_tasks.append(asyncio.create_task(watch_data_files()))
+    if os.environ.get("WARMUP", "on").lower() in ("0", "off", "false"):
+        warmup_state["status"] = "skipped"
+        return
+    background_tasks.append(asyncio.create_task(run_warmup()))
 
 @app.get("/api/national/sido")
 async def get_sido_list():
     """전국 시도 목록 (통계 포함) - 캐시 사용"""
     try:
         if "sido" not in aggregated_cache:
-            aggregate_data_on_startup()
+            await single_flight("aggregate", aggregate_data_on_startup)
         
         sido_aggregated = aggregated_cache.get("sido", {})
         sido_list = list(sido_aggregated.values())
         
-        stats_data = load_json_file("sgis_comprehensive_stats.json")
+        stats_data = await load_json_file_async("sgis_comprehensive_stats.json")
         
         return {
             "total": len(sido_list),
@@ -182,9 +1219,9 @@ async def get_sigungu_list(sido_code: str):
     """특정 시도의 시군구 목록 (통계 포함) - 캐시 사용"""
     try:
         if "sigungu" not in aggregated_cache:
-            aggregate_data_on_startup()
+            await single_flight("aggregate", aggregate_data_on_startup)
         
-        national_regions = load_json_file("sgis_national_regions.json")
+        national_regions = await load_json_file_async("sgis_national_regions.json")
         regions_data = national_regions.get('regions', {})
         
         if sido_code not in regions_data:
@@ -239,56 +1276,21 @@ async def get_sigungu_detail(sigungu_code: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/national/sigungu/{sigungu_code}")
-async def get_emdong_list(sigungu_code: str):
-    """특정 시군구의 읍면동 목록 (통계 포함)"""
+async def get_emdong_list(sigungu_code: str, sort: Optional[str] = None, order: Optional[str] = "desc"):
+    """특정 시군구의 읍면동 목록 (통계 포함, ?sort=population|household_cnt|...&order=desc|asc)"""
     try:
-        stats_data = load_json_file("sgis_comprehensive_stats.json")
-        stats_regions = stats_data.get('regions', {})
+        hierarchy = await get_region_hierarchy_async()
         
-        # 연령별 상세 데이터 로드 (정확한 인구)
-        try:
-            enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
-            enhanced_2023 = enhanced_data.get('regions_by_year', {}).get('2023', {})
-        except:
-            enhanced_2023 = {}
-        
-        emdong_list = []
-        sigungu_name = None
-        for emdong_cd, emdong_stats in stats_regions.items():
-            if emdong_stats.get('sigungu_code') == sigungu_code:
-                if not sigungu_name:
-                    sigungu_name = emdong_stats.get('sigungu_name', '')
-                
-                # 연령별 데이터에서 정확한 인구 가져오기
-                enhanced = enhanced_2023.get(emdong_cd, {})
-                accurate_pop = enhanced.get('basic', {}).get('total_population', 0)
-                
-                # 정확한 인구가 있으면 사용
-                if accurate_pop > 0:
-                    population = accurate_pop
-                    avg_size = emdong_stats.get('household', {}).get('avg_family_member_cnt', 2.0)
-                    household_cnt = round(population / avg_size)
-                else:
-                    population = emdong_stats.get('household', {}).get('family_member_cnt', 0)
-                    household_cnt = emdong_stats.get('household', {}).get('household_cnt', 0)
-                
-                emdong_list.append({
-                    "code": emdong_cd,
-                    "name": emdong_stats.get('emdong_name', ''),
-                    "full_address": emdong_stats.get('full_address', ''),
-                    "household_cnt": household_cnt,
-                    "population": population,
-                    "avg_family_size": emdong_stats.get('household', {}).get('avg_family_member_cnt', 0),
-                    "house_cnt": emdong_stats.get('house', {}).get('house_cnt', 0),
-                    "company_cnt": emdong_stats.get('company', {}).get('corp_cnt', 0),
-                    "worker_cnt": emdong_stats.get('company', {}).get('tot_worker', 0),
-                    "x_coord": emdong_stats.get('x_coord', ''),
-                    "y_coord": emdong_stats.get('y_coord', '')
-                })
+        if sort in EMDONG_SORT_KEYS:
+            emdong_list = hierarchy["sorted_rows"][sort].get(sigungu_code, [])
+            if order == "asc":
+                emdong_list = emdong_list[::-1]
+        else:
+            emdong_list = hierarchy["emdong_rows"].get(sigungu_code, [])
         
         return {
             "sigungu_code": sigungu_code,
-            "sigungu_name": sigungu_name,
+            "sigungu_name": hierarchy["sigungu_names"].get(sigungu_code),
             "emdong_list": emdong_list,
             "total": len(emdong_list)
         }
@@ -300,14 +1302,14 @@ async def get_emdong_detail(emdong_code: str, year: Optional[str] = "2023"):
     """특정 읍면동 상세 정보 (연도별)"""
     try:
         # 다년도 데이터 로드
-        multiyear_data = load_json_file("sgis_multiyear_stats.json")
+        multiyear_index = await get_multiyear_index_async("sgis_multiyear_stats.json")
         
         # 요청한 연도의 데이터
-        year_data = multiyear_data.get('regions_by_year', {}).get(year, {})
+        year_data = multiyear_index["by_year"].get(year, {})
         
         if emdong_code not in year_data:
             # 최신 데이터 (2023년)로 폴백
-            stats_data = load_json_file("sgis_comprehensive_stats.json")
+            stats_data = await load_json_file_async("sgis_comprehensive_stats.json")
             stats_regions = stats_data.get('regions', {})
             
             if emdong_code not in stats_regions:
@@ -336,9 +1338,8 @@ async def get_emdong_detail(emdong_code: str, year: Optional[str] = "2023"):
         
         # 연령별 상세 데이터에서 정확한 인구 가져오기
         try:
-            enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
-            enhanced_year = enhanced_data.get('regions_by_year', {}).get(year, {})
-            enhanced_emdong = enhanced_year.get(emdong_code, {})
+            enhanced_index = await get_multiyear_index_async("sgis_enhanced_multiyear_stats.json")
+            enhanced_emdong = enhanced_index["by_region"].get(emdong_code, {}).get(year, {})
             
             if enhanced_emdong and enhanced_emdong.get('basic'):
                 # 정확한 인구로 교체
@@ -368,7 +1369,7 @@ async def get_emdong_detail(emdong_code: str, year: Optional[str] = "2023"):
 async def get_available_years():
     """사용 가능한 연도 목록"""
     try:
-        multiyear_data = load_json_file("sgis_multiyear_stats.json")
+        multiyear_data = await load_json_file_async("sgis_multiyear_stats.json")
         years = list(multiyear_data.get('regions_by_year', {}).keys())
         
         return {
@@ -383,13 +1384,8 @@ async def get_available_years():
 async def get_emdong_timeseries(emdong_code: str):
     """특정 읍면동의 시계열 데이터"""
     try:
-        multiyear_data = load_json_file("sgis_multiyear_stats.json")
-        regions_by_year = multiyear_data.get('regions_by_year', {})
-        
-        timeseries = {}
-        for year, year_data in sorted(regions_by_year.items()):
-            if emdong_code in year_data:
-                timeseries[year] = year_data[emdong_code]
+        multiyear_index = await get_multiyear_index_async("sgis_multiyear_stats.json")
+        timeseries = multiyear_index["by_region"].get(emdong_code, {})
         
         if not timeseries:
             raise HTTPException(status_code=404, detail=f"{emdong_code} 시계열 데이터를 찾을 수 없습니다")
@@ -404,17 +1400,71 @@ async def get_emdong_timeseries(emdong_code: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/emdong/{emdong_code}/monthly")
+async def get_emdong_monthly(emdong_code: str, start: Optional[str] = None,
+                             end: Optional[str] = None, format: Optional[str] = None):
+    """특정 읍면동의 월별 주민등록 인구 (SGIS 코드 → 주민등록 코드 매핑)"""
+    try:
+        mapping = (await load_json_file_async("code_mapping.json")).get('mapping', {})
+        jumin_code = mapping.get(emdong_code, {}).get('jumin_code')
+        
+        await load_monthly_store_async()
+        timeseries = get_monthly_series(jumin_code, start, end, format == "columns") if jumin_code else None
+        if timeseries is None:
+            raise HTTPException(status_code=404, detail=f"{emdong_code} 월별 인구 데이터를 찾을 수 없습니다")
+        
+        return {
+            "code": emdong_code,
+            "jumin_code": jumin_code,
+            "timeseries": timeseries
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/sigungu/{sigungu_code}/timeseries")
+async def get_sigungu_timeseries(sigungu_code: str, start: Optional[str] = None,
+                                 end: Optional[str] = None, format: Optional[str] = None):
+    """시군구 월별 주민등록 인구 (예: 11230 -> 1123000000)"""
+    try:
+        full_code = sigungu_code + "00000" if len(sigungu_code) == 5 else sigungu_code
+        await load_monthly_store_async()
+        timeseries = get_monthly_series(full_code, start, end, format == "columns")
+        
+        return {
+            "sigungu_code": sigungu_code,
+            "timeseries": timeseries if timeseries is not None else []
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/sido/{sido_code}/timeseries")
+async def get_sido_timeseries(sido_code: str, start: Optional[str] = None,
+                              end: Optional[str] = None, format: Optional[str] = None):
+    """시도 월별 주민등록 인구 (예: 11 -> 1100000000)"""
+    try:
+        full_code = sido_code + "00000000" if len(sido_code) == 2 else sido_code
+        await load_monthly_store_async()
+        timeseries = get_monthly_series(full_code, start, end, format == "columns")
+        
+        return {
+            "sido_code": sido_code,
+            "timeseries": timeseries if timeseries is not None else []
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/emdong/{emdong_code}/enhanced")
 async def get_emdong_enhanced(emdong_code: str):
     """특정 읍면동의 연령별 상세 데이터 (시계열)"""
     try:
-        enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
-        regions_by_year = enhanced_data.get('regions_by_year', {})
-        
-        timeseries = {}
-        for year, year_data in sorted(regions_by_year.items()):
-            if emdong_code in year_data:
-                timeseries[year] = year_data[emdong_code]
+        enhanced_index = await get_multiyear_index_async("sgis_enhanced_multiyear_stats.json")
+        timeseries = enhanced_index["by_region"].get(emdong_code, {})
         
         if not timeseries:
             raise HTTPException(status_code=404, detail=f"{emdong_code} 연령별 데이터를 찾을 수 없습니다")
@@ -430,184 +1480,195 @@ async def get_emdong_enhanced(emdong_code: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/politicians/emdong/{emdong_code}")
-async def get_politicians_by_emdong(emdong_code: str):
-    """특정 읍면동의 정치인 정보 (행정동 코드 기반)"""
-    try:
-        # 읍면동 정보 로드
-        stats_data = load_json_file("sgis_comprehensive_stats.json")
-        emdong_info = stats_data.get('regions', {}).get(emdong_code, {})
+# 정치인 디렉터리 (읍면동 코드 → 응답 본문, 원본 파일 버전당 1회 생성)
+# 서울 읍면동은 동 매핑(선거구)과 시장/구청장/국회의원/시의원/구의원 파일을 미리 조인
+POLITICIAN_FILES = {
+    "assembly": "national_assembly_22nd_real.json",
+    "si_uiwon": "seoul_si_uiwon_8th_real.json",
+    "gu_uiwon": "seoul_gu_uiwon_8th_real.json",
+    "mayor": "seoul_mayor_8th_real.json",
+    "gu_mayor": "seoul_gu_mayor_8th.json"
+}
+
+def build_emdong_politicians(sigungu_name: str, dong_mapping: Dict[str, Any], sources: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """서울 읍면동 1개의 정치인 목록 (시장 → 구청장 → 국회의원 → 시의원 → 구의원)"""
+    assembly_data, si_uiwon_data, gu_uiwon_data = sources["assembly"], sources["si_uiwon"], sources["gu_uiwon"]
+    mayor_data, gu_mayor_data = sources["mayor"], sources["gu_mayor"]
+    politicians = []
+    
+    # 1. 서울시장 (서울 모든 동에 표시)
+    if mayor_data:
+        # mayor_data가 dict인 경우 (단일 시장 정보)
+        if isinstance(mayor_data, dict) and 'name' in mayor_data:
+            politicians.append({
+                "type": "서울시장",
+                "name": mayor_data.get('name', '').split('\n')[0],
+                "party": mayor_data.get('party', ''),
+                "district": "서울특별시",
+                "icon": "🌆",
+                "priority": 1
+            })
+        # mayor_data가 {이름: 정보} 형태인 경우
+        else:
+            for mayor_name, mayor_info in mayor_data.items():
+                if isinstance(mayor_info, dict):
+                    politicians.append({
+                        "type": "서울시장",
+                        "name": mayor_name.split('\n')[0],
+                        "party": mayor_info.get('party', ''),
+                        "district": "서울특별시",
+                        "icon": "🌆",
+                        "priority": 1
+                    })
+    
+    # 2. 구청장 (해당 구의 모든 동에 표시)
+    if sigungu_name and sigungu_name in gu_mayor_data:
+        gu_mayor_info = gu_mayor_data[sigungu_name]
+        if isinstance(gu_mayor_info, dict):
+            politicians.append({
+                "type": "구청장",
+                "name": gu_mayor_info.get('name', '').split('\n')[0].split('(')[0].strip(),
+                "party": gu_mayor_info.get('party', ''),
+                "district": sigungu_name,
+                "icon": "🏢",
+                "priority": 2
+            })
+    
+    # 3. 국회의원 (선거구별로 찾기)
+    na_district = dong_mapping.get('na_uiwon', '')
+    if na_district:
+        # 동 매핑에 있는 선거구로 찾기 (예: "종로구")
+        assembly_member = assembly_data.get(na_district)
+        if assembly_member and isinstance(assembly_member, dict):
+            politicians.append({
+                "type": "국회의원",
+                "name": assembly_member.get('name', '').split('\n')[0],
+                "party": assembly_member.get('party', ''),
+                "district": na_district,
+                "committee": assembly_member.get('committee'),
+                "icon": "🏛️",
+                "priority": 3
+            })
+    else:
+        # 매핑이 없으면 구 이름으로 찾기 (예: "강남구갑", "강남구을")
+        for key in assembly_data.keys():
+            if key.startswith(sigungu_name):
+                assembly_member = assembly_data[key]
+                if isinstance(assembly_member, dict):
+                    politicians.append({
+                        "type": "국회의원",
+                        "name": assembly_member.get('name', '').split('\n')[0],
+                        "party": assembly_member.get('party', ''),
+                        "district": key,
+                        "committee": assembly_member.get('committee'),
+                        "icon": "🏛️",
+                        "priority": 3
+                    })
+                    break  # 첫 번째 매칭만 사용
+    
+    # 4. 시의원 (선거구별로 찾기)
+    si_district = dong_mapping.get('si_uiwon', '')
+    if si_district:
+        # 선거구 이름으로 찾기 (예: "종로구제2선거구")
+        found = False
+        for district_key, si_members in si_uiwon_data.items():
+            if isinstance(si_members, list):
+                for member in si_members:
+                    if isinstance(member, dict) and member.get('district') == si_district:
+                        politicians.append({
+                            "type": "시의원",
+                            "name": member.get('name', '').split('\n')[0],
+                            "party": member.get('party', ''),
+                            "district": si_district,
+                            "icon": "🏛️",
+                            "priority": 4
+                        })
+                        found = True
         
+        # 선거구별 매칭이 안 되면 구 단위로 매칭 (폴백)
+        if not found and sigungu_name and sigungu_name in si_uiwon_data:
+            si_members = si_uiwon_data[sigungu_name]
+            if isinstance(si_members, list):
+                for member in si_members:
+                    if isinstance(member, dict):
+                        politicians.append({
+                            "type": "시의원",
+                            "name": member.get('name', '').split('\n')[0],
+                            "party": member.get('party', ''),
+                            "district": member.get('district', sigungu_name),
+                            "icon": "🏛️",
+                            "priority": 4
+                        })
+    
+    # 5. 구의원 (선거구별로 찾기)
+    gu_district = dong_mapping.get('gu_uiwon', '')
+    if gu_district and sigungu_name and sigungu_name in gu_uiwon_data:
+        gu_members = gu_uiwon_data[sigungu_name]
+        if isinstance(gu_members, list):
+            for member in gu_members:
+                if isinstance(member, dict):
+                    member_district = member.get('district', '')
+                    # 선거구가 일치하는 구의원만 추가
+                    if member_district == gu_district:
+                        politicians.append({
+                            "type": "구의원",
+                            "name": member.get('name', '').split('\n')[0],
+                            "party": member.get('party', ''),
+                            "district": gu_district,
+                            "icon": "🏘️",
+                            "priority": 5
+                        })
+    
+    # priority 순으로 정렬 (시장 → 구청장 → 국회의원 → 시의원 → 구의원)
+    politicians.sort(key=lambda x: x.get('priority', 999))
+    return politicians
+
+def build_politician_directory() -> Dict[str, Dict[str, Any]]:
+    """읍면동 코드 → /api/politicians/emdong 응답"""
+    stats_regions = load_json_file("sgis_comprehensive_stats.json").get('regions', {})
+    mapping_data = load_json_file("dong_election_mapping_complete.json")
+    sources = {key: load_json_file(filename) for key, filename in POLITICIAN_FILES.items()}
+    
+    directory = {}
+    for emdong_code, emdong_info in stats_regions.items():
         if not emdong_info:
-            return {
-                "emdong_code": emdong_code,
-                "politicians": []
-            }
+            continue
         
         # 동 이름과 구 이름 추출
         emdong_name = emdong_info.get('emdong_name', '')
         sigungu_name = emdong_info.get('sigungu_name', '').replace('서울특별시 ', '')
-        sido_code = emdong_info.get('sido_code', '')
-        sido_name = emdong_info.get('sido_name', '')
-        
-        # 동 매핑 로드
-        mapping_data = load_json_file("dong_election_mapping_complete.json")
-        dong_mapping = mapping_data.get(emdong_name, {})
-        
-        politicians = []
         
         # 서울 지역만 정치인 데이터 표시
-        if sido_code != '11':
-            return {
+        if emdong_info.get('sido_code', '') != '11':
+            directory[emdong_code] = {
                 "emdong_code": emdong_code,
                 "emdong_name": emdong_name,
                 "sigungu_name": sigungu_name,
-                "sido_name": sido_name,
+                "sido_name": emdong_info.get('sido_name', ''),
                 "politicians": [],
                 "total": 0
             }
+            continue
         
-        # 각 정치인 데이터 로드 (서울만)
-        assembly_data = load_json_file("national_assembly_22nd_real.json")
-        si_uiwon_data = load_json_file("seoul_si_uiwon_8th_real.json")
-        gu_uiwon_data = load_json_file("seoul_gu_uiwon_8th_real.json")
-        mayor_data = load_json_file("seoul_mayor_8th_real.json")
-        gu_mayor_data = load_json_file("seoul_gu_mayor_8th.json")
-        
-        # 1. 서울시장 (서울 모든 동에 표시)
-        if mayor_data:
-            # mayor_data가 dict인 경우 (단일 시장 정보)
-            if isinstance(mayor_data, dict) and 'name' in mayor_data:
-                politicians.append({
-                    "type": "서울시장",
-                    "name": mayor_data.get('name', '').split('\n')[0],
-                    "party": mayor_data.get('party', ''),
-                    "district": "서울특별시",
-                    "icon": "🌆",
-                    "priority": 1
-                })
-            # mayor_data가 {이름: 정보} 형태인 경우
-            else:
-                for mayor_name, mayor_info in mayor_data.items():
-                    if isinstance(mayor_info, dict):
-                        politicians.append({
-                            "type": "서울시장",
-                            "name": mayor_name.split('\n')[0],
-                            "party": mayor_info.get('party', ''),
-                            "district": "서울특별시",
-                            "icon": "🌆",
-                            "priority": 1
-                        })
-        
-        # 2. 구청장 (해당 구의 모든 동에 표시)
-        if sigungu_name and sigungu_name in gu_mayor_data:
-            gu_mayor_info = gu_mayor_data[sigungu_name]
-            if isinstance(gu_mayor_info, dict):
-                politicians.append({
-                    "type": "구청장",
-                    "name": gu_mayor_info.get('name', '').split('\n')[0].split('(')[0].strip(),
-                    "party": gu_mayor_info.get('party', ''),
-                    "district": sigungu_name,
-                    "icon": "🏢",
-                    "priority": 2
-                })
-        
-        # 3. 국회의원 (선거구별로 찾기)
-        na_district = dong_mapping.get('na_uiwon', '')
-        if na_district:
-            # 동 매핑에 있는 선거구로 찾기 (예: "종로구")
-            assembly_member = assembly_data.get(na_district)
-            if assembly_member and isinstance(assembly_member, dict):
-                politicians.append({
-                    "type": "국회의원",
-                    "name": assembly_member.get('name', '').split('\n')[0],
-                    "party": assembly_member.get('party', ''),
-                    "district": na_district,
-                    "committee": assembly_member.get('committee'),
-                    "icon": "🏛️",
-                    "priority": 3
-                })
-        else:
-            # 매핑이 없으면 구 이름으로 찾기 (예: "강남구갑", "강남구을")
-            for key in assembly_data.keys():
-                if key.startswith(sigungu_name):
-                    assembly_member = assembly_data[key]
-                    if isinstance(assembly_member, dict):
-                        politicians.append({
-                            "type": "국회의원",
-                            "name": assembly_member.get('name', '').split('\n')[0],
-                            "party": assembly_member.get('party', ''),
-                            "district": key,
-                            "committee": assembly_member.get('committee'),
-                            "icon": "🏛️",
-                            "priority": 3
-                        })
-                        break  # 첫 번째 매칭만 사용
-        
-        # 4. 시의원 (선거구별로 찾기)
-        si_district = dong_mapping.get('si_uiwon', '')
-        if si_district:
-            # 선거구 이름으로 찾기 (예: "종로구제2선거구")
-            found = False
-            for district_key, si_members in si_uiwon_data.items():
-                if isinstance(si_members, list):
-                    for member in si_members:
-                        if isinstance(member, dict) and member.get('district') == si_district:
-                            politicians.append({
-                                "type": "시의원",
-                                "name": member.get('name', '').split('\n')[0],
-                                "party": member.get('party', ''),
-                                "district": si_district,
-                                "icon": "🏛️",
-                                "priority": 4
-                            })
-                            found = True
-            
-            # 선거구별 매칭이 안 되면 구 단위로 매칭 (폴백)
-            if not found and sigungu_name and sigungu_name in si_uiwon_data:
-                si_members = si_uiwon_data[sigungu_name]
-                if isinstance(si_members, list):
-                    for member in si_members:
-                        if isinstance(member, dict):
-                            politicians.append({
-                                "type": "시의원",
-                                "name": member.get('name', '').split('\n')[0],
-                                "party": member.get('party', ''),
-                                "district": member.get('district', sigungu_name),
-                                "icon": "🏛️",
-                                "priority": 4
-                            })
-        
-        # 5. 구의원 (선거구별로 찾기)
-        gu_district = dong_mapping.get('gu_uiwon', '')
-        if gu_district and sigungu_name and sigungu_name in gu_uiwon_data:
-            gu_members = gu_uiwon_data[sigungu_name]
-            if isinstance(gu_members, list):
-                for member in gu_members:
-                    if isinstance(member, dict):
-                        member_district = member.get('district', '')
-                        # 선거구가 일치하는 구의원만 추가
-                        if member_district == gu_district:
-                            politicians.append({
-                                "type": "구의원",
-                                "name": member.get('name', '').split('\n')[0],
-                                "party": member.get('party', ''),
-                                "district": gu_district,
-                                "icon": "🏘️",
-                                "priority": 5
-                            })
-        
-        # priority 순으로 정렬 (시장 → 구청장 → 국회의원 → 시의원 → 구의원)
-        politicians.sort(key=lambda x: x.get('priority', 999))
-        
-        return {
+        politicians = build_emdong_politicians(sigungu_name, mapping_data.get(emdong_name, {}), sources)
+        directory[emdong_code] = {
             "emdong_code": emdong_code,
             "emdong_name": emdong_name,
             "sigungu_name": sigungu_name,
             "politicians": politicians,
             "total": len(politicians)
         }
-        
+    return directory
+
+@app.get("/api/politicians/emdong/{emdong_code}")
+async def get_politicians_by_emdong(emdong_code: str):
+    """특정 읍면동의 정치인 정보 (행정동 코드 기반)"""
+    try:
+        directory = await get_derived_async("politician_directory", build_politician_directory)
+        return directory.get(emdong_code) or {
+            "emdong_code": emdong_code,
+            "politicians": []
+        }
     except Exception as e:
         import traceback
         print(f"Error in get_politicians_by_emdong: {traceback.format_exc()}")
@@ -617,7 +1678,7 @@ async def get_politicians_by_emdong(emdong_code: str):
 async def get_regions():
     """지역 목록 (서울 읍면동)"""
     try:
-        seoul_data = load_json_file("seoul_comprehensive_data.json")
+        seoul_data = await load_json_file_async("seoul_comprehensive_data.json")
         
         # regions 키 안에 실제 데이터가 있음
         regions_data = seoul_data.get('regions', {})
@@ -662,19 +1723,21 @@ async def get_regions():
 async def get_region_detail(code: str):
     """지역 상세 정보 (통합)"""
     try:
-        seoul_data = load_json_file("seoul_comprehensive_data.json")
-        gdp_data = load_json_file("seoul_gdp_data.json")
-        traffic_data = load_json_file("seoul_traffic_data.json")
-        safety_data = load_json_file("seoul_safety_data.json")
+        seoul_data = await load_json_file_async("seoul_comprehensive_data.json")
+        gdp_data = await load_json_file_async("seoul_gdp_data.json")
+        traffic_data = await load_json_file_async("seoul_traffic_data.json")
+        safety_data = await load_json_file_async("seoul_safety_data.json")
         
         regions_data = seoul_data.get('regions', {})
         
-        # 코드로 찾기
+        # 코드로 찾기 (코드를 포함하는 첫 번째 키)
+        key_lookup = await get_derived_async(
+            "region_keys:seoul_comprehensive_data.json",
+            lambda: build_region_key_lookup("seoul_comprehensive_data.json")
+        )
         region = None
-        for key, value in regions_data.items():
-            if code == key or code in key:
-                region = value.copy()
-                break
+        if code in key_lookup:
+            region = regions_data[key_lookup[code]].copy()
         
         if not region:
             raise HTTPException(status_code=404, detail=f"{code} 데이터를 찾을 수 없습니다")
@@ -701,18 +1764,56 @@ async def get_region_detail(code: str):
 # LDA 분석 API
 # ============================================
 
+DISTRICT_KEYWORDS_DEFAULT = 20
+DISTRICT_TOPIC_TERMS = 10
+DISTRICT_TOPIC_MIN_WEIGHT = 0.01  # 비중이 이보다 작은 토픽은 생략
+
 @app.get("/api/lda/district/{gu}")
-async def get_district_lda(gu: str):
-    """구 단위 LDA 분석"""
+async def get_district_lda(gu: str, limit: int = DISTRICT_KEYWORDS_DEFAULT):
+    """구 단위 토픽/키워드 (미리 계산한 행렬의 행 조회, 요청 시 텍스트 처리 없음)"""
     try:
-        # 구 뉴스 데이터에서 LDA 추출 (현재는 간단한 키워드 추출)
-        # 실제로는 분석 결과를 별도로 저장하거나 실시간 분석
+        store = await load_topic_store_async()
+        row = store["districts"].get(gu)
+        if row is None:
+            raise HTTPException(status_code=404, detail=f"{gu}의 토픽 데이터를 찾을 수 없습니다")
+        
+        columns = store["columns"]
+        vocab = store["vocab"]
+        
+        # 구 × 단어 행은 빈도순으로 저장되어 있어 앞에서부터 자르면 됨
+        lo = columns["term_offsets"][row]
+        hi = min(columns["term_offsets"][row + 1], lo + max(limit, 1))
+        keywords = [
+            {"word": vocab[term], "count": count}
+            for term, count in zip(columns["term_ids"][lo:hi], columns["term_counts"][lo:hi])
+        ]
+        
+        k = store["topic_count"]
+        weights = columns["topic_weights"][row * k:(row + 1) * k]
+        topics = []
+        for topic in sorted(range(k), key=lambda t: -weights[t]):
+            if weights[topic] < DISTRICT_TOPIC_MIN_WEIGHT:
+                continue
+            t_lo = columns["topic_offsets"][topic]
+            t_hi = min(columns["topic_offsets"][topic + 1], t_lo + DISTRICT_TOPIC_TERMS)
+            topics.append({
+                "id": topic,
+                "weight": round(weights[topic], 4),
+                "keywords": [
+                    {"word": vocab[term], "weight": round(weight, 4)}
+                    for term, weight in zip(columns["topic_terms"][t_lo:t_hi], columns["topic_term_weights"][t_lo:t_hi])
+                ]
+            })
+        
         return {
             "gu": gu,
-            "topics": [],
-            "keywords": [],
-            "message": "LDA 분석 결과 (구현 예정)"
+            "topics": topics,
+            "keywords": keywords,
+            "article_counts": store["article_counts"][row],
+            "analysis_date": store["analysis_date"]
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -720,7 +1821,7 @@ async def get_district_lda(gu: str):
 async def get_assembly_lda(name: str):
     """국회의원 LDA 분석"""
     try:
-        data = load_json_file("assembly_member_lda_analysis.json")
+        data = await load_json_file_async("assembly_member_lda_analysis.json")
         
         if name not in data:
             raise HTTPException(status_code=404, detail=f"{name} 의원의 데이터를 찾을 수 없습니다")
@@ -735,7 +1836,7 @@ async def get_assembly_lda(name: str):
 async def get_local_lda(name: str):
     """지방정치인 LDA 분석"""
     try:
-        data = load_json_file("local_politicians_lda_analysis.json")
+        data = await load_json_file_async("local_politicians_lda_analysis.json")
         
         if name not in data:
             raise HTTPException(status_code=404, detail=f"{name} 정치인의 데이터를 찾을 수 없습니다")
@@ -746,6 +1847,104 @@ async def get_local_lda(name: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# ============================================
+# 키워드 트렌드 API
+# ============================================
+
+TREND_KINDS = ("member", "district")
+TREND_WINDOW_DEFAULT = 7
+TREND_WINDOW_MAX = 90
+TREND_TOP_DEFAULT = 20
+
+def window_range(store: Dict[str, Any], end_day: int, window: int) -> Dict[str, str]:
+    """누적 배열 끝 위치(end_day, 배타) → 기간 날짜 (저장소 시작일 이전은 잘림)"""
+    start_day = max(end_day - window, 0)
+    return {
+        "start": (store["start_date"] + timedelta(days=start_day)).isoformat(),
+        "end": (store["start_date"] + timedelta(days=end_day - 1)).isoformat()
+    }
+
+@app.get("/api/trends")
+async def get_trends(kind: str = "member", name: Optional[str] = None, window: int = TREND_WINDOW_DEFAULT,
+                     end: Optional[str] = None, top: int = TREND_TOP_DEFAULT):
+    """키워드 급상승/급하락 (?kind=member|district&name=&window=7&end=YYYY-MM-DD&top=20)
+    
+    최근 window일과 그 직전 window일의 빈도를 누적 배열 뺄셈으로 구해 비교
+    name이 없으면 같은 종류의 모든 대상을 합산
+    """
+    try:
+        if kind not in TREND_KINDS:
+            raise HTTPException(status_code=400, detail=f"kind는 {', '.join(TREND_KINDS)} 중 하나여야 합니다")
+        window = min(max(window, 1), TREND_WINDOW_MAX)
+        top = max(top, 1)
+        
+        store = await load_trend_store_async()
+        day_count = store["day_count"]
+        end_day = day_count
+        end_date = parse_day(end, "end")
+        if end_date is not None:
+            end_day = (end_date.date() - store["start_date"]).days + 1
+            if not 1 <= end_day <= day_count:
+                last = store["start_date"] + timedelta(days=day_count - 1)
+                raise HTTPException(status_code=400, detail=f"end는 {store['start_date']} ~ {last} 사이여야 합니다")
+        
+        if name:
+            entity = store["entities"].get((kind, name))
+            if entity is None:
+                raise HTTPException(status_code=404, detail=f"{name}의 트렌드 데이터를 찾을 수 없습니다")
+            entities = [entity]
+        else:
+            entities = [i for (k, _), i in store["entities"].items() if k == kind]
+        
+        columns = store["columns"]
+        prefix = columns["prefix"]
+        article_prefix = columns["article_prefix"]
+        stride = day_count + 1
+        mid_day = max(end_day - window, 0)
+        start_day = max(end_day - 2 * window, 0)
+        
+        # 단어 행마다 O(1): 현재 = P[end] - P[mid], 이전 = P[mid] - P[start]
+        current: Dict[int, int] = defaultdict(int)
+        previous: Dict[int, int] = defaultdict(int)
+        articles = [0, 0]
+        for entity in entities:
+            for row in range(columns["term_offsets"][entity], columns["term_offsets"][entity + 1]):
+                base = row * stride
+                term = columns["term_ids"][row]
+                current[term] += prefix[base + end_day] - prefix[base + mid_day]
+                previous[term] += prefix[base + mid_day] - prefix[base + start_day]
+            base = entity * stride
+            articles[0] += article_prefix[base + end_day] - article_prefix[base + mid_day]
+            articles[1] += article_prefix[base + mid_day] - article_prefix[base + start_day]
+        
+        vocab = store["vocab"]
+        movers = [
+            {
+                "word": vocab[term],
+                "count": count,
+                "previous": previous[term],
+                "delta": count - previous[term],
+                "ratio": round((count + 1) / (previous[term] + 1), 2)
+            }
+            for term, count in current.items()
+        ]
+        rising = heapq.nlargest(top, (m for m in movers if m["delta"] > 0), key=lambda m: (m["delta"], m["count"]))
+        falling = heapq.nsmallest(top, (m for m in movers if m["delta"] < 0), key=lambda m: (m["delta"], -m["previous"]))
+        
+        return {
+            "kind": kind,
+            "name": name,
+            "window": window,
+            "current": {**window_range(store, end_day, window), "articles": articles[0]},
+            "previous": {**window_range(store, mid_day, window), "articles": articles[1]} if mid_day else None,
+            "rising": rising,
+            "falling": falling
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # ============================================
 # 정치인 API
 # ============================================
@@ -754,7 +1953,7 @@ async def get_local_lda(name: str):
 async def get_assembly_members():
     """국회의원 목록"""
     try:
-        data = load_json_file("assembly_by_region.json")
+        data = await load_json_file_async("assembly_by_region.json")
         
         all_members = []
         
@@ -786,21 +1985,272 @@ async def get_assembly_members():
 async def get_assembly_network():
     """국회의원-이슈 네트워크"""
     try:
-        data = load_json_file("assembly_network_graph.json")
+        data = await load_json_file_async("assembly_network_graph.json")
         return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# 의원 네트워크 그래프 엔진 (member_connections → CSR 인접 배열)
+# 노드 i의 이웃은 neighbors[offsets[i]:offsets[i+1]], 각 구간은 가중치(total_strength) 내림차순이라
+# 상위 N개/가중치 임계값 조회가 구간 앞부분만 읽고 끝남. edge_ids는 원본 member_connections 위치
+NETWORK_MAX_HOPS = 3
+NETWORK_MAX_NODES = 300
+NETWORK_MAX_EDGES = 2000
+
+def build_network_graph() -> Dict[str, Any]:
+    """assembly_network_graph.json → CSR 배열 + 간선별 가중치(edge_weight) + 가중치순 간선 번호(edge_order)"""
+    data = load_json_file("assembly_network_graph.json")
+    connections = data.get("member_connections", [])
+    
+    names = list(data.get("members", {}))
+    ids = {name: i for i, name in enumerate(names)}
+    for connection in connections:
+        for name in (connection["from"], connection["to"]):
+            if name not in ids:
+                ids[name] = len(names)
+                names.append(name)
+    
+    adjacency: List[List[Tuple[int, int, int]]] = [[] for _ in names]
+    for edge_id, connection in enumerate(connections):
+        u, v = ids[connection["from"]], ids[connection["to"]]
+        weight = connection.get("total_strength", 0)
+        adjacency[u].append((weight, v, edge_id))
+        adjacency[v].append((weight, u, edge_id))
+    
+    offsets, neighbors, weights, edge_ids = array('I', [0]), array('I'), array('i'), array('I')
+    for entries in adjacency:
+        entries.sort(key=lambda entry: (-entry[0], entry[1]))
+        for weight, neighbor, edge_id in entries:
+            neighbors.append(neighbor)
+            weights.append(weight)
+            edge_ids.append(edge_id)
+        offsets.append(len(neighbors))
+    
+    edge_weight = array('i', (connection.get("total_strength", 0) for connection in connections))
+    edge_order = array('I', sorted(range(len(connections)), key=lambda i: -edge_weight[i]))
+    return {
+        "names": names,
+        "ids": ids,
+        "offsets": offsets,
+        "neighbors": neighbors,
+        "weights": weights,
+        "edge_ids": edge_ids,
+        "edge_weight": edge_weight,
+        "edge_order": edge_order
+    }
+
+async def get_network_graph_async() -> Dict[str, Any]:
+    return await get_derived_async("network_graph", build_network_graph)
+
+def network_node(data: Dict[str, Any], name: str, **extra) -> Dict[str, Any]:
+    """노드 응답 (members 레코드 + 클러스터)"""
+    return {
+        "name": name,
+        **data.get("members", {}).get(name, {}),
+        "cluster": data.get("member_to_cluster", {}).get(name),
+        **extra
+    }
+
+def induced_edges(graph: Dict[str, Any], node_ids: List[int], min_weight: int) -> List[int]:
+    """노드 집합 내부 간선 (가중치 내림차순 구간에서 임계값 미만이 나오면 중단)"""
+    members = set(node_ids)
+    offsets, neighbors, weights, edge_ids = graph["offsets"], graph["neighbors"], graph["weights"], graph["edge_ids"]
+    edges = []
+    for u in node_ids:
+        for k in range(offsets[u], offsets[u + 1]):
+            if weights[k] < min_weight:
+                break
+            v = neighbors[k]
+            if v > u and v in members:
+                edges.append(edge_ids[k])
+    edges.sort(key=lambda edge_id: -graph["edge_weight"][edge_id])
+    return edges
+
+def network_subgraph(data: Dict[str, Any], graph: Dict[str, Any], node_ids: List[int],
+                     edge_ids: List[int], **node_extra) -> Dict[str, Any]:
+    """노드/간선 번호 → 응답 (간선은 원본 member_connections 레코드, 최대 NETWORK_MAX_EDGES개)"""
+    connections = data.get("member_connections", [])
+    return {
+        "nodes": [
+            network_node(data, graph["names"][i], **{key: values[i] for key, values in node_extra.items()})
+            for i in node_ids
+        ],
+        "edges": [connections[edge_id] for edge_id in edge_ids[:NETWORK_MAX_EDGES]],
+        "total_edges": len(edge_ids),
+        "truncated": len(edge_ids) > NETWORK_MAX_EDGES
+    }
+
+@app.get("/api/network/ego/{member}")
+async def get_network_ego(member: str, hops: int = 1, min_weight: int = 0, top: Optional[int] = None):
+    """의원 중심 k-hop 이웃 그래프 (?hops=1~3&min_weight=&top=노드당 따라갈 이웃 수)"""
+    try:
+        data = await load_json_file_async("assembly_network_graph.json")
+        graph = await get_network_graph_async()
+        if member not in graph["ids"]:
+            raise HTTPException(status_code=404, detail=f"{member} 의원을 찾을 수 없습니다")
+        
+        hops = min(max(hops, 1), NETWORK_MAX_HOPS)
+        offsets, neighbors, weights = graph["offsets"], graph["neighbors"], graph["weights"]
+        
+        # 너비 우선 탐색 (이웃 구간이 가중치 내림차순이라 top/min_weight는 앞부분만 확인)
+        hop_of = {graph["ids"][member]: 0}
+        frontier = list(hop_of)
+        for hop in range(1, hops + 1):
+            next_frontier = []
+            for u in frontier:
+                end = offsets[u + 1] if top is None else min(offsets[u + 1], offsets[u] + max(top, 0))
+                for k in range(offsets[u], end):
+                    if weights[k] < min_weight or len(hop_of) >= NETWORK_MAX_NODES:
+                        break
+                    v = neighbors[k]
+                    if v not in hop_of:
+                        hop_of[v] = hop
+                        next_frontier.append(v)
+            frontier = next_frontier
+        
+        node_ids = list(hop_of)
+        return {
+            "center": member,
+            "hops": hops,
+            "min_weight": min_weight,
+            **network_subgraph(data, graph, node_ids, induced_edges(graph, node_ids, min_weight), hop=hop_of)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/network/edges")
+async def get_network_top_edges(top: int = 100, min_weight: int = 0):
+    """가중치 상위 간선과 양 끝 의원 (?top=N&min_weight=)"""
+    try:
+        data = await load_json_file_async("assembly_network_graph.json")
+        graph = await get_network_graph_async()
+        top = min(max(top, 1), NETWORK_MAX_EDGES)
+        connections = data.get("member_connections", [])
+        
+        edge_ids = []
+        for edge_id in graph["edge_order"]:
+            if len(edge_ids) >= top or graph["edge_weight"][edge_id] < min_weight:
+                break
+            edge_ids.append(edge_id)
+        
+        node_ids = list(dict.fromkeys(
+            graph["ids"][connections[edge_id][end]] for edge_id in edge_ids for end in ("from", "to")
+        ))
+        return {"top": top, "min_weight": min_weight, **network_subgraph(data, graph, node_ids, edge_ids)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/network/clusters/{cluster_id}")
+async def get_cluster_subgraph(cluster_id: int, min_weight: int = 0):
+    """클러스터 1개의 내부 그래프 (?min_weight=)"""
+    try:
+        data = await load_json_file_async("assembly_network_graph.json")
+        graph = await get_network_graph_async()
+        cluster = next((c for c in data.get("clusters", []) if c.get("id") == cluster_id), None)
+        if cluster is None:
+            raise HTTPException(status_code=404, detail=f"{cluster_id} 클러스터를 찾을 수 없습니다")
+        
+        node_ids = [graph["ids"][name] for name in cluster.get("members", []) if name in graph["ids"]]
+        return {
+            "cluster": {key: value for key, value in cluster.items() if key != "members"},
+            "min_weight": min_weight,
+            **network_subgraph(data, graph, node_ids, induced_edges(graph, node_ids, min_weight))
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 이슈별 기사 인덱스 (이슈 → 최신순 정렬 기사 배열 + 날짜 키 + 의원별 위치 목록)
+# 커서는 정렬된 배열의 위치라서 페이지 조회 비용이 이슈의 기사 수와 무관
+ISSUE_PAGE_DEFAULT = 50
+ISSUE_PAGE_MAX = 200
+KST = timezone(timedelta(hours=9))  # start/end 날짜 기준 시간대
+
+def article_timestamp(article: Dict[str, Any]) -> int:
+    """pubDate(RFC 2822) → 유닉스 초 (파싱 실패 시 0 = 가장 오래된 기사로 취급)"""
+    try:
+        return int(parsedate_to_datetime(article.get('pubDate', '')).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+def build_issue_article_index() -> Dict[str, Dict[str, Any]]:
+    """issue_articles_tracking.json → 이슈별 {"articles", "keys": -타임스탬프(오름차순), "members": 이름 → 위치}"""
+    data = load_json_file("issue_articles_tracking.json")
+    index = {}
+    for issue, issue_data in data.items():
+        articles = sorted(issue_data.get('articles', []), key=article_timestamp, reverse=True)
+        members: Dict[str, List[int]] = {}
+        for position, article in enumerate(articles):
+            members.setdefault(article.get('member_name', ''), []).append(position)
+        index[issue] = {
+            "articles": articles,
+            "keys": [-article_timestamp(article) for article in articles],
+            "members": members
+        }
+    return index
+
+def parse_day(value: Optional[str], field: str) -> Optional[datetime]:
+    """YYYY-MM-DD → 한국 시간 자정"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=KST)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{field}는 YYYY-MM-DD 형식이어야 합니다")
+
 @app.get("/api/network/issues/{issue}")
-async def get_issue_tracking(issue: str):
-    """이슈별 기사 추적"""
+async def get_issue_tracking(issue: str, cursor: Optional[str] = None, limit: int = ISSUE_PAGE_DEFAULT,
+                             start: Optional[str] = None, end: Optional[str] = None,
+                             member: Optional[str] = None, fields: Optional[str] = None):
+    """이슈별 기사 추적 (최신순, ?cursor=&limit=&start=YYYY-MM-DD&end=YYYY-MM-DD&member=&fields=title,link,...)"""
     try:
-        data = load_json_file("issue_articles_tracking.json")
+        data = await load_json_file_async("issue_articles_tracking.json")
         
         if issue not in data:
             raise HTTPException(status_code=404, detail=f"{issue} 이슈를 찾을 수 없습니다")
         
-        return data[issue]
+        index = (await get_derived_async("issue_articles", build_issue_article_index))[issue]
+        keys = index["keys"]
+        limit = min(max(limit, 1), ISSUE_PAGE_MAX)
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 cursor입니다")
+        
+        # 날짜 범위 → 정렬 배열의 [lo, hi) 구간 (end는 해당 날짜 포함)
+        start_day, end_day = parse_day(start, "start"), parse_day(end, "end")
+        lo = bisect_right(keys, -int((end_day + timedelta(days=1)).timestamp())) if end_day else 0
+        hi = bisect_right(keys, -int(start_day.timestamp())) if start_day else len(keys)
+        
+        if member is not None:
+            positions = index["members"].get(member, [])
+            first, last = bisect_left(positions, lo), bisect_left(positions, hi)
+            page_from = max(first, bisect_left(positions, offset))
+            page_positions = positions[page_from:min(page_from + limit, last)]
+            total = last - first
+            has_more = page_from + limit < last
+        else:
+            page_from = max(lo, offset)
+            page_positions = range(page_from, min(page_from + limit, hi))
+            total = max(hi - lo, 0)
+            has_more = page_from + limit < hi
+        
+        articles = [index["articles"][position] for position in page_positions]
+        if fields:
+            projection = [field.strip() for field in fields.split(',') if field.strip()]
+            articles = [{field: article.get(field) for field in projection} for article in articles]
+        
+        return {
+            "issue": issue,
+            "members": data[issue].get('members', []),
+            "top_keywords": data[issue].get('top_keywords', []),
+            "total": total,
+            "articles": articles,
+            "next_cursor": str(page_positions[-1] + 1) if has_more and page_positions else None
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -810,7 +2260,7 @@ async def get_issue_tracking(issue: str):
 async def get_clusters():
     """의원 클러스터 정보"""
     try:
-        network_data = load_json_file("assembly_network_graph.json")
+        network_data = await load_json_file_async("assembly_network_graph.json")
         
         return {
             "clusters": network_data.get("clusters", []),
@@ -820,46 +2270,206 @@ async def get_clusters():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# ============================================
+# 통합 검색 인덱스 (지역명 + 정치인 + 뉴스 제목/본문, 문자 bigram 역색인)
+# ============================================
+
+SEARCH_TYPES = ("region", "politician", "news")
+SEARCH_NAME_WEIGHT = 3.0  # 이름/제목 필드 가중치 (본문 = 1)
+SEARCH_TAG_PATTERN = re.compile(r'<[^>]+>')
+SEARCH_SPLIT_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+def normalize_search_text(text: Optional[str]) -> str:
+    """검색용 정규화 (HTML 엔티티/태그 제거, 소문자)"""
+    return SEARCH_TAG_PATTERN.sub(' ', html.unescape(text or '')).lower()
+
+def search_tokens(text: Optional[str], unigrams: bool = False) -> List[str]:
+    """문자 bigram 토큰 (한 글자 단어는 그대로, unigrams=True면 글자 단위도 포함)"""
+    tokens: List[str] = []
+    for word in SEARCH_SPLIT_PATTERN.split(normalize_search_text(text)):
+        if not word:
+            continue
+        if len(word) == 1 or unigrams:
+            tokens.extend(word)
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def clean_politician_name(name: Optional[str]) -> str:
+    """'오세훈\n(吳世勲)', '정문헌 (鄭文憲)' → 한글 이름만"""
+    return (name or '').split('\n')[0].split('(')[0].strip()
+
+def load_optional_json(filename: str) -> Any:
+    """없어도 되는 데이터 파일 로드 (없거나 실패하면 빈 dict)"""
+    try:
+        return load_json_file(filename)
+    except HTTPException:
+        return {}
+
+def collect_search_documents() -> List[Dict[str, Any]]:
+    """검색 대상 문서 목록 (type, id, name, body + 응답용 필드)"""
+    docs: List[Dict[str, Any]] = []
+    
+    # 지역 (시도/시군구/읍면동)
+    national_regions = load_optional_json("sgis_national_regions.json")
+    for sido_cd, sido_info in national_regions.get('regions', {}).items():
+        docs.append({"type": "region", "id": sido_cd, "name": sido_info.get('sido_name', ''),
+                     "body": "", "level": "sido", "code": sido_cd})
+        for sigungu in sido_info.get('sigungu_list', []):
+            docs.append({"type": "region", "id": sigungu['sigungu_code'],
+                         "name": sigungu.get('full_address', ''), "body": "",
+                         "level": "sigungu", "code": sigungu['sigungu_code']})
+            for emdong in sigungu.get('emdong_list', []):
+                docs.append({"type": "region", "id": emdong['emdong_code'],
+                             "name": emdong.get('full_address', ''), "body": "",
+                             "level": "emdong", "code": emdong['emdong_code']})
+    
+    # 정치인 - 국회의원 (지역구 + 비례대표)
+    assembly_data = load_optional_json("assembly_by_region.json")
+    for group in ("regional", "proportional"):
+        for members in assembly_data.get(group, {}).values():
+            for member in members:
+                docs.append({
+                    "type": "politician", "id": f"국회의원:{member.get('name', '')}",
+                    "name": member.get('name', ''),
+                    "body": f"{member.get('party', '')} {member.get('district', '')} {member.get('committee', '')}",
+                    "position": "국회의원", "party": member.get('party', ''),
+                    "district": member.get('district', '')
+                })
+    
+    # 정치인 - 시장/구청장/시의원/구의원 (제8회)
+    local_sources = [
+        ("서울시장", {"서울특별시": load_optional_json("seoul_mayor_8th_real.json")}),
+        ("구청장", load_optional_json("seoul_gu_mayor_8th.json")),
+        ("시의원", load_optional_json("seoul_si_uiwon_8th_real.json")),
+        ("구의원", load_optional_json("seoul_gu_uiwon_8th_real.json"))
+    ]
+    for position, by_district in local_sources:
+        for district_key, members in by_district.items():
+            if isinstance(members, dict):
+                members = [members]
+            for member in members:
+                name = clean_politician_name(member.get('name', ''))
+                district = member.get('district', district_key)
+                docs.append({
+                    "type": "politician", "id": f"{position}:{name}:{district}",
+                    "name": name, "body": f"{member.get('party', '')} {district} {district_key}",
+                    "position": position, "party": member.get('party', ''), "district": district
+                })
+    
+    # 뉴스 (의원별/구별 수집 기사, 링크 기준 중복 제거)
+    seen_links = set()
+    for filename in ("assembly_member_news.json", "gu_news_articles.json", "gu_audit_news.json"):
+        for owner, entry in load_optional_json(filename).items():
+            for article in entry.get('news', []):
+                link = article.get('link', '')
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                docs.append({
+                    "type": "news", "id": link,
+                    "name": normalize_search_text(article.get('title', '')).strip(),
+                    "body": article.get('description', ''),
+                    "link": link, "pubDate": article.get('pubDate', ''), "related": owner
+                })
+    
+    return docs
+
+def build_search_index() -> Dict[str, Any]:
+    """문서 목록 → 역색인 (토큰 → {문서 번호: 가중치}) + 토큰별 idf"""
+    docs = collect_search_documents()
+    postings: Dict[str, Dict[int, float]] = {}
+    for doc_id, doc in enumerate(docs):
+        weights: Dict[str, float] = {}
+        for token in search_tokens(doc["name"], unigrams=doc["type"] != "news"):
+            weights[token] = weights.get(token, 0) + SEARCH_NAME_WEIGHT
+        for token in search_tokens(doc["body"]):
+            weights[token] = weights.get(token, 0) + 1.0
+        for token, weight in weights.items():
+            postings.setdefault(token, {})[doc_id] = weight
+        doc["_name"] = normalize_search_text(doc["name"])
+    
+    total = len(docs)
+    idf = {token: math.log(1 + total / len(doc_map)) for token, doc_map in postings.items()}
+    return {"docs": docs, "postings": postings, "idf": idf}
+
+def get_search_index() -> Dict[str, Any]:
+    """통합 검색 인덱스 조회 (최초 호출 시 생성)"""
+    return get_derived("search", build_search_index)
+
+async def get_search_index_async() -> Dict[str, Any]:
+    """통합 검색 인덱스 조회 - 최초 생성은 스레드 풀에서 1회만"""
+    return await get_derived_async("search", build_search_index)
+
+def run_search(query: str, doc_type: Optional[str] = None, limit: int = 20):
+    """검색 실행 - 모든 토큰을 포함하는 문서 우선, 없으면 일부 일치 문서로 대체"""
+    index = get_search_index()
+    docs, postings, idf = index["docs"], index["postings"], index["idf"]
+    tokens = [t for t in set(search_tokens(query)) if t in postings]
+    if not tokens:
+        return 0, []
+    
+    # 가장 희소한 토큰부터 교집합
+    tokens.sort(key=lambda t: len(postings[t]))
+    candidates = set(postings[tokens[0]])
+    for token in tokens[1:]:
+        candidates.intersection_update(postings[token])
+        if not candidates:
+            break
+    if not candidates:
+        candidates = set().union(*(postings[t] for t in tokens))
+    
+    if doc_type:
+        candidates = {d for d in candidates if docs[d]["type"] == doc_type}
+    
+    phrase = normalize_search_text(query).strip()
+    def score(doc_id: int) -> float:
+        value = sum(idf[t] * postings[t].get(doc_id, 0) for t in tokens)
+        name = docs[doc_id]["_name"]
+        if name == phrase:
+            value *= 3
+        elif phrase and name.endswith(phrase):
+            value *= 2
+        elif phrase and phrase in name:
+            value *= 1.5
+        return value
+    
+    results = []
+    for doc_id in heapq.nlargest(limit, candidates, key=score):
+        doc = docs[doc_id]
+        results.append({
+            **{k: v for k, v in doc.items() if k not in ("body", "_name")},
+            "score": round(score(doc_id), 3)
+        })
+    return len(candidates), results
+
 # ============================================
 # 검색 API
 # ============================================
 
 @app.get("/api/search")
-async def search(q: str, type: Optional[str] = None):
-    """통합 검색"""
-    if not q:
+async def search(q: str, type: Optional[str] = None, limit: int = 20):
+    """통합 검색 (type: region | politician | news, assembly는 politician으로 처리)"""
+    if not q or not q.strip():
         raise HTTPException(status_code=400, detail="검색어를 입력하세요")
     
-    results = {
-        "query": q,
-        "regions": [],
-        "assembly_members": [],
-        "local_politicians": []
-    }
+    doc_type = "politician" if type == "assembly" else type
+    if doc_type and doc_type not in SEARCH_TYPES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 검색 유형입니다: {type}")
     
     try:
-        # 지역 검색
-        if not type or type == "region":
-            region_data = load_json_file("seoul_comprehensive_data.json")
-            for region_id, region in region_data.items():
-                if isinstance(region, dict):
-                    name = region.get("sigunguName", "") + region.get("dongName", "")
-                    if q.lower() in name.lower():
-                        results["regions"].append({
-                            "id": region_id,
-                            "name": name,
-                            "type": "region"
-                        })
-        
-        # 국회의원 검색
-        if not type or type == "assembly":
-            assembly_data = load_json_file("assembly_by_region.json")
-            for region, members in assembly_data.get("regional", {}).items():
-                for member in members:
-                    if q.lower() in member.get("name", "").lower():
-                        results["assembly_members"].append(member)
+        await get_search_index_async()
+        total, results = run_search(q.strip(), doc_type, min(max(limit, 1), 100))
         
-        return results
+        return {
+            "query": q,
+            "type": doc_type,
+            "total": total,
+            "results": results,
+            # 기존 응답 형식 호환
+            "regions": [r for r in results if r["type"] == "region"],
+            "assembly_members": [r for r in results if r.get("position") == "국회의원"],
+            "local_politicians": [r for r in results if r["type"] == "politician" and r.get("position") != "국회의원"]
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -871,8 +2481,8 @@ async def search(q: str, type: Optional[str] = None):
 async def get_stats_summary():
     """전체 통계 요약"""
     try:
-        assembly_data = load_json_file("assembly_by_region.json")
-        network_data = load_json_file("assembly_network_graph.json")
+        assembly_data = await load_json_file_async("assembly_by_region.json")
+        network_data = await load_json_file_async("assembly_network_graph.json")
         
         # 의원 수 계산
         regional_count = sum(len(members) for members in assembly_data.get("regional", {}).values())
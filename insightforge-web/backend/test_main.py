@@ -0,0 +1,47 @@
+"""
+InsightForge API 테스트
+
+실행: cd insightforge-web/backend && python -m pytest -q
+"""
+import asyncio
+
+import httpx
+
+import main
+
+def test_concurrent_cold_requests_record_dependencies():
+    """파생 인덱스 생성을 함께 기다린 요청도 응답 캐시 항목에 원본 파일이 기록되어야 함"""
+    main.index_cache.clear()
+    main.data_cache.clear()
+    main.response_cache._local.clear()
+    # 응답이 파생 인덱스(politician_directory)만 거치는 엔드포인트
+    paths = [f"/api/politicians/emdong/{code}" for code in ("11230680", "11230690", "11680640", "11680650")]
+
+    async def fetch_all():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.get(path) for path in paths))
+
+    responses = asyncio.run(fetch_all())
+    assert [r.status_code for r in responses] == [200] * len(paths)
+
+    for path in paths:
+        entry = main.response_cache.get(path + "?")
+        assert entry is not None, path
+        assert entry["dependencies"], path
+
+def test_evicted_file_drops_derived_index(monkeypatch):
+    """예산 초과로 파일이 제거되면 그 파일로 만든 파생 인덱스도 함께 제거되어야 함"""
+    snapshot = main.DataSnapshot()
+    token = main.request_snapshot.set(snapshot)
+    try:
+        main.get_multiyear_index("sgis_multiyear_stats.json")
+        assert "multiyear:sgis_multiyear_stats.json" in snapshot.derived
+
+        monkeypatch.setattr(main, "DATA_CACHE_BUDGET", 0)
+        main.load_json_file("assembly_network_graph.json")
+    finally:
+        main.request_snapshot.reset(token)
+
+    assert "sgis_multiyear_stats.json" not in snapshot.files
+    assert "multiyear:sgis_multiyear_stats.json" not in snapshot.derived